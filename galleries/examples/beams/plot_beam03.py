@@ -0,0 +1,142 @@
+"""
+=============================================================
+Load cases and load combinations for a cantilever beam
+=============================================================
+
+Two load cases are defined for a cantilever beam:
+
+* **dead**: a uniformly distributed load, :math:`w`
+* **live**: a point load at the free end, :math:`P`
+
+Both are solved by :py:meth:`System.solveLoadCases` using a single factorization of the stiffness matrix
+and checked against the classical solutions for the tip deflection,
+
+.. math::
+
+   v_{dead} = \\frac{w L^4}{8 EI},
+   \\qquad
+   v_{live} = \\frac{P L^3}{3 EI}
+
+The combination :math:`1.2\\:dead + 1.6\\:live` (see :py:meth:`System.combineLoadCases`) is compared to
+a direct analysis of the combined loads.
+
+Author: Peter Mackenzie-Helnwein
+"""
+
+# %%
+# Setup
+import numpy as np
+
+from femedu.examples import Example
+
+from femedu.domain import System, Node
+from femedu.elements.linear import Beam2D
+from femedu.materials import ElasticSection
+
+# %%
+# Create the example by subclassing the :py:class:`Example`
+
+class ExampleBeam03(Example):
+
+    # sphinx_gallery_start_ignore
+    def docString(self):
+        s = """
+        Load cases and load combinations for a cantilever beam
+
+        Author: Peter Mackenzie-Helnwein
+        """
+        return s
+
+    # sphinx_gallery_end_ignore
+    def problem(self):
+        # initialize a system model
+        L = 120.0     # span length
+        w = -0.50     # distributed load (dead)
+        P = -10.0     # tip load (live)
+
+        Nelems = 4    # number of elements
+        params = {'E': 29000., 'A': 4.7, 'I':103}
+
+        EI = params['E'] * params['I']
+
+        model = System()
+
+        nodes = [ Node(L * k / Nelems, 0.0) for k in range(Nelems + 1) ]
+        model.addNode(*nodes)
+
+        elements = [ Beam2D(ndi, ndj, ElasticSection(params)) for ndi, ndj in zip(nodes[:-1], nodes[1:]) ]
+        model.addElement(*elements)
+
+        # define support(s)
+        nd0   = nodes[0]
+        ndTip = nodes[-1]
+
+        nd0.fixDOF('ux', 'uy', 'rz')     # fixed support left end
+
+        # define the load cases
+        for elem in elements:
+            elem.setDistLoad(w)
+
+        model.addLoadCase('dead')
+
+        model.resetLoad()
+        for elem in elements:
+            elem.setDistLoad(0.0)
+        ndTip.setLoad([P], ('uy',))
+
+        model.addLoadCase('live')
+
+        # analyze all load cases at once
+        model.solveLoadCases()
+
+        # check the load cases: tip deflection and support reactions
+        expected = {
+            'dead': (w * L**4 / (8. * EI), w * L, w * L**2 / 2.),
+            'live': (P * L**3 / (3. * EI), P,     P * L),
+        }
+
+        for name, (v, V, M) in expected.items():
+            U, R = model.getLoadCase(name)
+
+            v_tip  = U[ndTip.getIdx4DOFs(dofs=['uy'])][0]
+            V0, M0 = R[nd0.getIdx4DOFs(dofs=['uy', 'rz'])]
+
+            print(f"load case '{name}':  tip deflection {v_tip:10.6f} (expected {v:10.6f}),"
+                  f"  support reactions {V0:8.3f}, {M0:10.3f}")
+
+            assert np.isclose(v_tip, v), (name, v_tip, v)
+            assert np.allclose([V0, M0], [V, M]), (name, V0, M0)
+
+        # the load combination ...
+        U, R = model.combineLoadCases({'dead': 1.2, 'live': 1.6})
+        v_combo = ndTip.getDisp(dofs=['uy'])[0]
+
+        # ... equals a direct analysis of the combined loads
+        for elem in elements:
+            elem.setDistLoad(1.2 * w)
+        ndTip.setLoad([1.6 * P], ('uy',))
+
+        model.solve()
+        v_direct = ndTip.getDisp(dofs=['uy'])[0]
+
+        print(f"1.2 dead + 1.6 live:  tip deflection {v_combo:10.6f} (direct analysis {v_direct:10.6f})")
+
+        assert np.isclose(v_combo, 1.2 * expected['dead'][0] + 1.6 * expected['live'][0])
+        assert np.isclose(v_combo, v_direct)
+
+        # write out report
+        model.report()
+
+        # create plots
+        model.plot(factor=5., filename="beam03_deformed.png", show_bc=1, show_reactions=1)
+
+        model.beamValuePlot('M', filename="beam03_moment.png")
+
+
+# %%
+# Run the example by creating an instance of the problem and executing it by calling :py:meth:`Example.run()`
+#
+
+if __name__ == "__main__":
+    ex = ExampleBeam03()
+    ex.run()
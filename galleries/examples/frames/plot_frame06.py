@@ -0,0 +1,119 @@
+"""
+======================================================
+Linearized buckling of a pinned column
+======================================================
+
+modeled using a 2D frame element
+
+.. list-table:: setting given parameters
+
+    * - N  = 8
+      - number of elements
+    * - L  = 200.0
+      - column length
+    * - E  = 29000.0
+      - elastic modulus
+    * - I  = 10.0
+      - moment of inertia
+
+The critical load factors of a linearized buckling analysis (:py:meth:`System.solveBuckling`)
+are compared to Euler's solution, :math:`P_n = n^2 \\pi^2 EI / L^2`.
+
+Author: Peter Mackenzie-Helnwein
+"""
+
+# %%
+# Setup
+import numpy as np
+import matplotlib.pyplot as plt
+
+from femedu.examples import Example
+
+from femedu.domain import System, Node
+from femedu.elements.finite import Frame2D
+from femedu.materials import ElasticSection
+from femedu.solver import NewtonRaphsonSolver
+
+# %%
+# Create the example by subclassing the :py:class:`Example`
+
+class ExampleFrame06(Example):
+
+    # sphinx_gallery_start_ignore
+    def docString(self):
+        s = """
+    Linearized buckling of a pinned column
+
+    degrees of freedom:
+        ux ... horizontal displacement
+        uy ... vertical displacement
+        rz ... rotation, theta
+
+    Author: Peter Mackenzie-Helnwein
+    """
+        return s
+
+    # sphinx_gallery_end_ignore
+    def problem(self):
+        # initialize a system model
+        N = 8       # number of elements
+        L = 200.
+        E = 29000.0
+        A = 20.0
+        I = 10.0
+
+        Pe = np.pi**2 * E * I / L**2    # Euler load
+
+        # ========= build your structural model =============
+        model = System()
+        model.setSolver(NewtonRaphsonSolver())
+
+        nodes = [ Node(0.0, L * k / N) for k in range(N + 1) ]
+        model.addNode(*nodes)
+
+        params = {'E': E, 'A': A, 'I': I}
+        for nd0, nd1 in zip(nodes[:-1], nodes[1:]):
+            model += Frame2D(nd0, nd1, ElasticSection(params))
+
+        # fixities
+        nodes[0].fixDOF('ux', 'uy')     # pinned
+        nodes[-1].fixDOF('ux')          # roller
+
+        # reference load: a unit compressive force
+        nodes[-1].addLoad([-1.0], ['uy'])
+
+        print("\n==== perform the analysis ===\n")
+
+        lam = model.solveBuckling(num_modes=3)
+
+        for n, lam_n in enumerate(lam, start=1):
+            print(f"mode {n}:  lambda = {lam_n:10.4f}   Euler: {n**2 * Pe:10.4f}")
+
+        # the critical load factors approach n^2 Pe
+        assert np.allclose(lam, Pe * np.array([1., 4., 9.]), rtol=0.01), lam
+
+        # the first mode is a half sine wave ...
+        ux = np.array([ node.getDisp(modeshape=True)[0] for node in nodes ])
+        assert np.allclose(ux / ux[N // 2], np.sin(np.pi * np.arange(N + 1) / N), atol=1.0e-3), ux
+
+        model.plot(factor=20., modeshape=True, filename="frame6_buckling_mode0.png", title=f"mode 1: $\\lambda$ = {lam[0]:.3f}")
+
+        # ... and the second mode a full sine wave
+        lam_2 = model.pushBucklingMode(mode=1)
+        assert lam_2 == lam[1]
+
+        ux = np.array([ node.getDisp(modeshape=True)[0] for node in nodes ])
+        assert np.allclose(ux / ux[N // 4], np.sin(2. * np.pi * np.arange(N + 1) / N), atol=1.0e-3), ux
+
+        model.plot(factor=20., modeshape=True, filename="frame6_buckling_mode1.png", title=f"mode 2: $\\lambda$ = {lam[1]:.3f}")
+
+        # the model state is not changed by the buckling analysis
+        assert all( np.all(node.getDisp() == 0.0) for node in nodes )
+
+# %%
+# Run the example by creating an instance of the problem and executing it by calling :py:meth:`Example.run()`
+#
+
+if __name__ == "__main__":
+    ex = ExampleFrame06()
+    ex.run()
@@ -147,8 +147,6 @@ class ExamplePlate07(Example):
         model.setLoadFactor(0.0)
         model.solve()
 
-        np.save('../../../Kplate.npy', model.solver.Kt)
-
         for k in range(8):
             name = f"plate07_mode{k:2d}.png"
             model.plotBucklingMode(mode=k,filename=name,factor=1.0)
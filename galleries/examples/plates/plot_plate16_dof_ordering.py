@@ -0,0 +1,118 @@
+"""
+===============================================================
+Numbering the d.o.f.s of a plate model
+===============================================================
+
+The system d.o.f.s are numbered in a node ordering selected by :py:meth:`Solver.setDOFOrdering`:
+
+* **'natural'**: the order in which nodes were added to the model
+* **'rcm'**: reverse Cuthill-McKee, keeping the bandwidth of the stiffness matrix small (default)
+* **'mindegree'**: multiple minimum degree, keeping the fill-in of a sparse factorization small
+
+The numbering changes the layout of the system matrix but not the solution.
+A slender cantilever is meshed along its length, so the natural order couples nodes
+a full row of the mesh apart, while the reverse Cuthill-McKee ordering numbers across the short side.
+
+Author: Peter Mackenzie-Helnwein
+"""
+import numpy as np
+
+from femedu.examples import Example
+
+from femedu.domain import System
+from femedu.solver import NewtonRaphsonSolver
+from femedu.elements.linear import Quad
+from femedu.materials import PlaneStress
+from femedu.mesher import *
+
+
+# %%
+# Create the example by subclassing the :py:class:`Example`
+
+class ExamplePlate16(Example):
+
+    # sphinx_gallery_start_ignore
+    # sphinx_gallery_thumbnail_number = -1
+    def docString(self):
+        s = """
+    Numbering the d.o.f.s of a plate model
+
+    Author: Peter Mackenzie-Helnwein
+    """
+        return s
+
+    # sphinx_gallery_end_ignore
+    def problem(self):
+
+        # ========== setting mesh parameters ==============
+
+        Nx = 40       # number of elements in the mesh along x
+        Ny = 4        # number of elements in the mesh along y
+        Lx = 200.0    # length of plate in the x-direction
+        Ly =  20.0    # length of plate in the y-direction
+
+        # ========== setting material parameters ==============
+
+        params = dict(
+            E  = 20000.,    # Young's modulus
+            nu = 0.250,     # Poisson's ratio
+            t  = 1.00       # thickness of the plate
+        )
+
+        pxy = 1.5           # uniform shear load on x=Lx
+
+        results = {}
+
+        for ordering in ('natural', 'rcm', 'mindegree'):
+
+            #
+            # ==== Build the system model ====
+            #
+
+            model = System()
+            model.setSolver(NewtonRaphsonSolver())
+            model.solver.setDOFOrdering(ordering)
+
+            mesher = PatchMesher(model, (0.,0.),(Lx,0.),(Lx,Ly),(0.,Ly) )
+            nodes, elements = mesher.quadMesh(Nx, Ny, Quad, PlaneStress(params))
+
+            # define support(s)
+            for node, _ in model.findNodesAlongLine((0.0, 0.0), (0.0, 1.0)):
+                node.fixDOF('ux', 'uy')
+
+            # the section at the right end
+            for _, face in model.findFacesAlongLine((Lx, 0.0), (0.0, 1.0), orientation=+1):
+                face.setLoad(0.0, -pxy)
+
+            model.setLoadFactor(1.0)
+            model.solve()
+
+            amap = model.solver.getAssemblyMap()
+
+            # displacements of all nodes, in the order the mesher created them
+            U = np.array([ node.getDisp() for node in nodes ])
+
+            results[ordering] = (amap.bandwidth, U)
+
+            print(f"ordering '{ordering}':  half-bandwidth {amap.bandwidth:4d},"
+                  f"  tip deflection {U[:, 1].min():10.6f}")
+
+        # the numbering does not change the solution ...
+        for ordering in ('rcm', 'mindegree'):
+            assert np.allclose(results[ordering][1], results['natural'][1], rtol=1.0e-10, atol=1.0e-12), ordering
+
+        # ... but reverse Cuthill-McKee numbers across the short side of the mesh
+        bw_natural = results['natural'][0]
+        bw_rcm     = results['rcm'][0]
+        assert bw_rcm < bw_natural / 2, (bw_rcm, bw_natural)
+
+        model.plot(factor=10., filename="plate16_deformed.png", show_bc=1, show_loads=1)
+
+
+# %%
+# Run the example by creating an instance of the problem and executing it by calling :py:meth:`Example.run()`
+#
+
+if __name__ == "__main__":
+    ex = ExamplePlate16()
+    ex.run()
@@ -0,0 +1,134 @@
+"""
+================================================================
+Snap-through of a shallow two-bar truss
+================================================================
+
+The von Mises truss: two inclined bars loaded at their common apex.
+Under arc-length control, the load factor passes a maximum, snaps through
+to negative values, and passes a minimum before the truss stiffens again.
+
+Stability is tracked through the inertia of the factorized tangent stiffness
+(see :py:meth:`System.trackStability`).  Both critical points must be reported as limit points.
+
+Author: Peter Mackenzie-Helnwein
+"""
+
+# %%
+# Setup
+import numpy as np
+import matplotlib.pyplot as plt
+
+from femedu.examples import Example
+
+from femedu.domain import System, Node
+from femedu.elements.finite import Truss
+from femedu.materials import FiberMaterial
+from femedu.solver import NewtonRaphsonSolver, NewtonRaphsonSolverSparse, KrylovSolver, ModifiedNewtonSolver
+
+# %%
+# Create the example by subclassing the :py:class:`Example`
+
+class ExampleTruss10(Example):
+
+    # sphinx_gallery_start_ignore
+    # sphinx_gallery_thumbnail_number = -1
+    def docString(self):
+        s = """
+        Snap-through of a shallow two-bar truss.
+
+        Limit points are detected from the inertia of the tangent stiffness.
+
+        Author: Peter Mackenzie-Helnwein
+        """
+        return s
+
+    # sphinx_gallery_end_ignore
+    def problem(self):
+
+        # geometry
+        W = 5.5
+        H = 0.5
+
+        params = dict(E=2100., A=1.0)
+
+        for solver in (NewtonRaphsonSolver(), NewtonRaphsonSolverSparse(), KrylovSolver(), ModifiedNewtonSolver()):
+
+            # initialize a system model
+            model = System()
+            model.setSolver(solver)
+
+            ndA = Node(0.0, 0.0)
+            ndB = Node(  W,   H)
+            ndC = Node(2*W, 0.0)
+
+            model.addNode(ndA, ndB, ndC)
+
+            model += Truss(ndA, ndB, FiberMaterial(params))
+            model += Truss(ndB, ndC, FiberMaterial(params))
+
+            ndA.fixDOF('ux', 'uy')
+            ndC.fixDOF('ux', 'uy')
+
+            ndB.addLoad([-1.0], ['uy'])
+
+            #
+            # performing the analysis
+            #
+            model.trackStability(True, method='inertia')
+            model.startRecorder()
+
+            model.setLoadFactor(0.0)
+            model.solve()
+
+            model.initArcLength(load_increment=0.1, alpha=0.0, tolerance=1.0e-10)
+
+            load_list = [ 0.0 ]
+            data_list = [ 0.0 ]
+
+            # follow the path until the apex has passed the mirrored configuration
+            for step in range(100):
+                model.stepArcLength(max_iter=20)
+
+                load_list.append(model.loadfactor)
+                data_list.append(-ndB.getDisp()[1])
+
+                if data_list[-1] > 2.2*H:
+                    break
+
+            levels = np.array(load_list)
+
+            print(f"\n{solver.__class__.__name__}:")
+            for kind, lam0, lam1, neg0, neg1 in model.critical_points:
+                print(f"   {kind} between lambda = {lam0:g} and lambda = {lam1:g}")
+
+            # both critical points are limit points ...
+            kinds = [ point[0] for point in model.critical_points ]
+            assert kinds == ['limit point', 'limit point'], kinds
+
+            # ... bracketing the load steps at the local maximum and minimum of the load factor
+            dlam = np.diff(levels)
+            turns = levels[1:-1][dlam[:-1] * dlam[1:] < 0.0]
+
+            peak, valley = model.critical_points
+            assert np.isclose(turns[0], max(peak[1:3])), peak
+            assert np.isclose(turns[1], min(valley[1:3])), valley
+
+        #
+        # create a nice summary plot
+        #
+        plt.figure()
+        plt.plot(data_list, load_list, '--o')
+
+        plt.grid(True)
+        plt.xlabel('apex deflection $ -u_y $')
+        plt.ylabel('load factor $ \\lambda $')
+        plt.savefig("truss10_snap_through.png")
+        plt.show()
+
+# %%
+# Run the example by creating an instance of the problem and executing it by calling :py:meth:`Example.run()`
+#
+
+if __name__ == "__main__":
+    ex = ExampleTruss10()
+    ex.run()
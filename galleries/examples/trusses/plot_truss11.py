@@ -0,0 +1,157 @@
+"""
+================================================================
+Adaptive load stepping with a line search
+================================================================
+
+The von Mises truss of :ref:`sphx_glr_auto_examples_trusses_plot_truss10.py` is loaded
+up to 50%, 90%, and 99% of its limit load using :py:meth:`System.solveLoadPath`.
+A final load path aims beyond the limit load, where failed steps are bisected.  The Armijo search
+accepts a jump to the snapped-through branch, while the energy search stops at the limit point.
+The step size follows the convergence rate, and every Newton increment is scaled by a line search
+(see :py:meth:`NewtonRaphsonSolver.setLineSearch`).
+
+Every converged state is compared to the analytic equilibrium path of the truss,
+
+.. math::
+
+   \\lambda = - 2\\: EA\\: \\ln\\left(\\frac{\\ell}{L_0}\\right) \\frac{H - v}{\\ell},
+   \\qquad
+   \\ell = \\sqrt{W^2 + (H - v)^2}
+
+where :math:`v` is the downward deflection of the apex.
+
+Author: Peter Mackenzie-Helnwein
+"""
+
+# %%
+# Setup
+import numpy as np
+import matplotlib.pyplot as plt
+
+from femedu.examples import Example
+
+from femedu.domain import System, Node
+from femedu.elements.finite import Truss
+from femedu.materials import FiberMaterial
+from femedu.solver import NewtonRaphsonSolver
+
+# %%
+# Create the example by subclassing the :py:class:`Example`
+
+class ExampleTruss11(Example):
+
+    # sphinx_gallery_start_ignore
+    # sphinx_gallery_thumbnail_number = -1
+    def docString(self):
+        s = """
+        Adaptive load stepping with a line search.
+
+        Author: Peter Mackenzie-Helnwein
+        """
+        return s
+
+    # sphinx_gallery_end_ignore
+    def problem(self):
+
+        # geometry
+        W = 5.5
+        H = 0.5
+
+        params = dict(E=2100., A=1.0)
+        EA = params['E'] * params['A']
+        L0 = np.sqrt(W**2 + H**2)
+
+        def analytic(v):
+            ell = np.sqrt(W**2 + (H - v)**2)
+            return -2. * EA * np.log(ell / L0) * (H - v) / ell
+
+        # limit load of the analytic path
+        v = np.linspace(0.0, H, 10001)
+        lam_limit = analytic(v).max()
+
+        plt.figure()
+
+        for method in ('armijo', 'energy'):
+
+            # initialize a system model
+            model = System()
+            solver = NewtonRaphsonSolver()
+            solver.setLineSearch(method)
+            model.setSolver(solver)
+
+            ndA = Node(0.0, 0.0)
+            ndB = Node(  W,   H)
+            ndC = Node(2*W, 0.0)
+
+            model.addNode(ndA, ndB, ndC)
+
+            model += Truss(ndA, ndB, FiberMaterial(params))
+            model += Truss(ndB, ndC, FiberMaterial(params))
+
+            ndA.fixDOF('ux', 'uy')
+            ndC.fixDOF('ux', 'uy')
+
+            ndB.addLoad([-1.0], ['uy'])
+
+            #
+            # performing the analysis in three legs, each with a deliberately large initial step
+            #
+            model.setLoadFactor(0.0)
+            model.solve()
+
+            levels = [ 0.0 ]
+            v      = [ 0.0 ]
+
+            for target in lam_limit * np.array([0.5, 0.9, 0.99]):
+
+                load_list = model.solveLoadPath(target=target, step=target, max_iter=6, verbose=True)
+
+                # the leg reaches its target ...
+                assert np.isclose(load_list[-1], target), load_list
+
+                levels.append(load_list[-1])
+                v.append(-ndB.getDisp()[1])
+
+            levels = np.array(levels)
+            v      = np.array(v)
+
+            print(f"\n{method}: lambda = {levels}")
+
+            # ... and every converged state lies on the equilibrium path
+            assert np.allclose(analytic(v), levels, atol=1.0e-8), analytic(v) - levels
+
+            # beyond the limit load, failed steps are bisected ...
+            load_list = model.solveLoadPath(target=1.2 * lam_limit, step=0.1, min_step=1.0e-5, verbose=True)
+
+            v_end = -ndB.getDisp()[1]
+            print(f"{method}: stopped at lambda = {load_list[-1]:.6f} with v = {v_end:.6f}, limit load: {lam_limit:.6f}")
+
+            # ... and the final state is an equilibrium state
+            assert np.isclose(analytic(v_end), load_list[-1], atol=1.0e-6), (analytic(v_end), load_list[-1])
+
+            if method == 'armijo':
+                # the backtracking search accepts the jump to the stiffened, snapped-through branch
+                assert np.isclose(load_list[-1], 1.2 * lam_limit) and v_end > 2.*H, load_list
+            else:
+                # the energy search stays on the initial branch and stops at the limit point
+                assert lam_limit - 1.0e-4 < load_list[-1] <= lam_limit, load_list
+
+            plt.plot(v, levels, 'o', label=f"solveLoadPath ('{method}')")
+
+        v = np.linspace(0.0, 2.*H, 201)
+        plt.plot(v, analytic(v), '-k', label='analytic')
+
+        plt.grid(True)
+        plt.xlabel('apex deflection $ v $')
+        plt.ylabel('load factor $ \\lambda $')
+        plt.legend()
+        plt.savefig("truss11_load_path.png")
+        plt.show()
+
+# %%
+# Run the example by creating an instance of the problem and executing it by calling :py:meth:`Example.run()`
+#
+
+if __name__ == "__main__":
+    ex = ExampleTruss11()
+    ex.run()
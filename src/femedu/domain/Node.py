@@ -36,6 +36,7 @@ class Node():
         self.loadfactor_nn = 0.0    # load factor for two steps back converged state
         self.disp_mode     = None   # stored displacement representing a mode shape
         self.disp_pushed   = deque()   # stored displacement vector (see pushU() and popU())
+        self._state        = None   # system-level DisplacementState holding the above vectors (see bindState())
 
         self.dofs        = {}
         self.ndofs       = 0
@@ -132,7 +133,7 @@ class Node():
                     self.ndofs += 1
                 dof_idx.append(self.dofs[dof])
 
-            if caller not in self.elements:
+            if caller not in self.dof_maps:     # same as 'not in self.elements', without scanning the list
                 self.elements.append(caller)
 
             # remember the dof_idx map for this element for future interaction
@@ -295,9 +296,9 @@ class Node():
                         raise TypeError(msg)
             else:
                 if modeshape:
-                    self.disp_mode = U
+                    self._setVector('disp_mode', U)
                 else:
-                    self.disp = U
+                    self._setVector('disp', U)
 
         else:
             self.lead.setDisp(U, dof_list=dof_list, modeshape=modeshape)
@@ -333,7 +334,7 @@ class Node():
         """
         if len(self.disp_pushed):
             state = self.disp_pushed.pop()
-            self.disp       = state['U']
+            self._setVector('disp', state['U'])
             self.loadfactor = state['lam']
         else:
             raise TypeError("no pushed displacement data available")
@@ -748,9 +749,9 @@ class Node():
         Resets the displacement vector.
         """
         if self.is_lead:
-            self.disp_nn = np.zeros(len(self.dofs))
-            self.disp_n  = np.zeros(len(self.dofs))
-            self.disp    = np.zeros(len(self.dofs))
+            self._setVector('disp_nn', np.zeros(len(self.dofs)))
+            self._setVector('disp_n',  np.zeros(len(self.dofs)))
+            self._setVector('disp',    np.zeros(len(self.dofs)))
         else:
             self.lead.resetDisp()
 
@@ -852,20 +853,36 @@ class Node():
     def on_converged(self):
         r"""
         This method is called every time a solver signals a converged solution.
+
+        Displacements of a node bound to a :py:class:`DisplacementState` are rotated
+        by that state (see :py:meth:`bindState`).
         """
         if self.is_lead:
             # rotate states (n)->(n-1) and current->(n)
-            if isinstance(self.disp_n, np.ndarray):
-                self.disp_nn = self.disp_n.copy()
-            if isinstance(self.disp, np.ndarray):
-                self.disp_n  = self.disp.copy()
+            if not self._state:
+                if isinstance(self.disp_n, np.ndarray):
+                    self.disp_nn = self.disp_n.copy()
+                if isinstance(self.disp, np.ndarray):
+                    self.disp_n  = self.disp.copy()
             self.loadfactor_nn = self.loadfactor_n
             self.loadfactor_n  = self.loadfactor
 
         # do not duplicate this step for the load node !!
 
     def revert(self):
-        pass
+        r"""
+        This method is called every time a solver fails to converge.
+        It restores the last converged state.
+
+        Displacements of a node bound to a :py:class:`DisplacementState` are restored
+        by that state (see :py:meth:`bindState`).
+        """
+        if self.is_lead:
+            if not self._state and isinstance(self.disp_n, np.ndarray):
+                self.disp = self.disp_n.copy()
+            self.loadfactor = self.loadfactor_n
+
+        # do not duplicate this step for the load node !!
 
     def isLead(self):
         return self.is_lead
@@ -922,10 +939,64 @@ class Node():
 
         This should be used by a solution algorithm but not by regular
         user input.
+
+        Displacements of a node bound to a :py:class:`DisplacementState` are set
+        by that state (see :py:meth:`bindState`).
         """
-        self.disp       = 2.0 * self.disp_n - self.disp_nn
+        if not self._state:
+            self.disp   = 2.0 * self.disp_n - self.disp_nn
         self.loadfactor = 2.0 * self.loadfactor_n - self.loadfactor_nn
 
+    def bindState(self, state, idx=None):
+        r"""
+        Store the displacement vectors of this node in a system-level :py:class:`DisplacementState`.
+
+        :code:`disp`, :code:`disp_n`, :code:`disp_nn`, and :code:`disp_mode` become views into the
+        respective arrays of that state.  Current values are copied into the state.
+        Solvers then update, rotate, and revert the displacements of all bound nodes
+        by vector operations on the state.
+
+        For internal use by solvers only
+
+        :param state: a :py:class:`DisplacementState` object, or **None** to detach this node
+        :param idx: slice of the system d.o.f.s owned by this node
+        """
+        names = ('disp', 'disp_n', 'disp_nn', 'disp_mode')
+
+        if state is None:
+            # keep private copies of the current values
+            for name in names:
+                vec = getattr(self, name)
+                if isinstance(vec, np.ndarray):
+                    setattr(self, name, vec.copy())
+            self._state = None
+            return
+
+        for name, array in zip(names, state.getArrays()):
+            view = array[idx]
+            vec  = getattr(self, name)
+            if isinstance(vec, np.ndarray):
+                n = min(vec.shape[0], view.shape[0])
+                view[:n] = vec[:n]
+            setattr(self, name, view)
+
+        self._state = state
+
+    def _setVector(self, name, U):
+        r"""
+        Assign a displacement vector.  Vectors bound to a :py:class:`DisplacementState` are overwritten in place.
+
+        For internal use only
+        """
+        if self._state and getattr(self, name).shape != np.shape(U):
+            # the d.o.f.s of this node have changed: detach until the solver binds the node again
+            self.bindState(None)
+
+        if self._state:
+            getattr(self, name)[:] = U
+        else:
+            setattr(self, name, U)
+
     #
     # Transformation methods
     #
@@ -933,6 +1004,12 @@ class Node():
     def hasTransform(self):
         return (self._transform != None)
 
+    def getTransformation(self):
+        r"""
+        :return: the attached :py:meth:`femedu.domain.Transformation` object, or **None**
+        """
+        return self._transform
+
     def v2l(self, U, caller=None):
         """
         transform a nodal vector from global to local coordinates
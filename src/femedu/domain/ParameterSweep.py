@@ -0,0 +1,223 @@
+import io
+import itertools
+import contextlib
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .Node import Node
+
+
+class ParameterSweep():
+    r"""
+    Run the same model for many parameter sets and collect all recorded data in a single table.
+
+    Every run builds a new model by calling **builder** with one parameter set as keyword arguments,
+    performs the analysis, and fetches all data gathered by the model's recorders (see :py:meth:`System.initRecorder`).
+
+    .. code::
+
+        def build(E=1000., w=1.0, n=10):
+            model = System()
+            ...
+            model.initRecorder(variables=['uy'], nodes=[tip])
+            model.startRecorder()
+            return model
+
+        def analyze(model, **parameters):
+            for lam in np.linspace(0., 1., 5):
+                model.setLoadFactor(lam)
+                model.solve()
+
+        sweep = ParameterSweep(build, analyze)
+        table = sweep.run({'E': [1000., 2000.], 'w': [1., 2., 4.]}, workers=4)
+
+    Runs are distributed over a pool of processes.  Hence, **builder** and **analysis** need to be defined at the
+    top level of a module (not as :code:`lambda`).  Use :code:`workers=1` to run all parameter sets in the calling process.
+
+    A run raising an exception does not affect any other run: its row in the result table shows the error message.
+
+    The ID counters of nodes and elements are reset before every run, such that IDs, and thus record labels
+    like :code:`'Node_12:uy'`, are identical for the same parameter set, regardless of which worker performs the run.
+
+    :param builder: callable returning a :py:class:`System` for the given keyword parameters
+    :param analysis: optional callable :code:`analysis(model, **parameters)` performing the analysis.
+                     Default: a single :code:`model.solve()`
+    """
+
+    def __init__(self, builder, analysis=None):
+        self.builder  = builder
+        self.analysis = analysis
+
+    def __str__(self):
+        return "ParameterSweep(builder={}, analysis={})".format(getattr(self.builder, '__name__', self.builder),
+                                                                getattr(self.analysis, '__name__', self.analysis))
+
+    @staticmethod
+    def makeGrid(parameters):
+        r"""
+        Expand a parameter grid into a list of parameter sets.
+
+        :param parameters: either a dict :code:`{ name: list of values }`, expanded into all combinations in the
+                           order the names are given (the last name varies fastest), or a list of dicts, one per run.
+        :returns: list of dicts, one per run
+        """
+        if isinstance(parameters, dict):
+            names = list(parameters)
+            return [ dict(zip(names, values)) for values in itertools.product(*parameters.values()) ]
+
+        if isinstance(parameters, (list, tuple)) and all( isinstance(p, dict) for p in parameters ):
+            return [ dict(p) for p in parameters ]
+
+        msg = "parameters must be a dict of value lists or a list of dicts"
+        raise TypeError(msg)
+
+    @staticmethod
+    def resetCounters():
+        r"""
+        Reset all global ID counters, such that the next model is numbered from zero.
+
+        :returns: the previous counter values, for use with :py:meth:`restoreCounters`
+        """
+        from ..elements.Element import Element                      # deferred: elements import the domain
+        from ..elements.linear.BeamSolidLink import BeamSolidLink
+
+        counters = (Node.COUNT, Element.COUNT, BeamSolidLink.COUNT)
+        Node.COUNT = Element.COUNT = BeamSolidLink.COUNT = 0
+
+        return counters
+
+    @staticmethod
+    def restoreCounters(counters):
+        r"""
+        :param counters: counter values as returned by :py:meth:`resetCounters`
+        """
+        from ..elements.Element import Element
+        from ..elements.linear.BeamSolidLink import BeamSolidLink
+
+        Node.COUNT, Element.COUNT, BeamSolidLink.COUNT = counters
+
+    @staticmethod
+    def fetchRecords(model):
+        r"""
+        Collect the data of all recorders of a model: the system recorder, and all node and element recorders.
+
+        :param model: a :py:class:`System`
+        :returns: dict :code:`{ record label: list of values }`
+        """
+        data = {}
+
+        for item in [model] + list(model.nodes) + list(model.elements):
+            recorder = getattr(item, 'recorder', None)
+            if recorder:
+                for record in recorder.fetchRecord().values():
+                    data[record.label] = list(record.data)
+
+        return data
+
+    def runOne(self, parameters, quiet=True):
+        r"""
+        Build and analyze a single model.  (used by :py:meth:`run`)
+
+        :param parameters: dict of keyword parameters for **builder**
+        :param quiet: set to **False** to show the output of the model
+        :returns: tuple (dict of recorded data, error message or **None**)
+        """
+        counters = self.resetCounters()
+        output = io.StringIO() if quiet else None
+
+        try:
+            with contextlib.redirect_stdout(output) if quiet else contextlib.nullcontext():
+                model = self.builder(**parameters)
+
+                if self.analysis:
+                    self.analysis(model, **parameters)
+                else:
+                    model.solve()
+
+            return (self.fetchRecords(model), None)
+
+        except Exception:
+            return ({}, traceback.format_exc(limit=4).strip())
+
+        finally:
+            self.restoreCounters(counters)
+
+    def run(self, parameters, workers=None, quiet=True):
+        r"""
+        Run all parameter sets.
+
+        The result table holds one row per recorded step and run, in the order of the parameter sets.
+
+        .. list-table:: columns of the result table
+            :header-rows: 1
+
+            * - column
+              - content
+            * - **run**
+              - position of the parameter set in the grid (see :py:meth:`makeGrid`)
+            * - parameter names
+              - the parameter values of that run
+            * - **step**
+              - number of the recorded step within that run
+            * - record labels
+              - recorded values, e.g., :code:`'sys:lam'` or :code:`'Node_3:uy'`
+            * - **error**
+              - error message of a failed run, **None** otherwise
+
+        :param parameters: parameter grid (see :py:meth:`makeGrid`)
+        :param workers: number of worker processes.  **None** uses one process per CPU,
+                        **1** runs all parameter sets in the calling process.
+        :param quiet: set to **False** to show the output of all runs
+        :returns: result table as :code:`pandas.DataFrame`
+        """
+        grid = self.makeGrid(parameters)
+
+        if workers == 1 or len(grid) < 2:
+            results = [ self.runOne(p, quiet) for p in grid ]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [ executor.submit(self.runOne, p, quiet) for p in grid ]
+
+                results = []
+                for future in futures:
+                    try:
+                        results.append(future.result())
+                    except Exception as error:
+                        # the worker process failed, e.g., ran out of memory
+                        results.append(({}, "{}: {}".format(error.__class__.__name__, error)))
+
+        return self.makeTable(grid, results)
+
+    @staticmethod
+    def makeTable(grid, results):
+        r"""
+        Combine the results of all runs into a single columnar table.  (used by :py:meth:`run`)
+
+        :param grid: list of parameter sets
+        :param results: list of tuples (dict of recorded data, error message), one per parameter set
+        :returns: result table as :code:`pandas.DataFrame`
+        """
+        names  = list(dict.fromkeys( name for p in grid for name in p ))
+        labels = list(dict.fromkeys( label for data, _ in results for label in data ))
+
+        columns = { key: [] for key in ['run'] + names + ['step'] + labels + ['error'] }
+
+        for run, (p, (data, error)) in enumerate(zip(grid, results)):
+            nsteps = max([ len(values) for values in data.values() ], default=0)
+            nrows  = max(nsteps, 1)
+
+            columns['run'].extend([run] * nrows)
+            for name in names:
+                columns[name].extend([p.get(name, np.nan)] * nrows)
+            columns['step'].extend(range(nrows) if nsteps else [np.nan])
+
+            for label in labels:
+                values = list(data.get(label, []))
+                columns[label].extend(values + [np.nan] * (nrows - len(values)))
+
+            columns['error'].extend([error] * nrows)
+
+        return pd.DataFrame(columns)
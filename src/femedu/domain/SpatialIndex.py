@@ -0,0 +1,178 @@
+import numpy as np
+
+
+class SpatialIndex():
+    r"""
+    Uniform grid over a fixed set of points, used to find candidate points near a point, a line, or a plane.
+
+    The bounding box of all points is divided into cubic cells holding about one point each.
+    Every query returns the indices of all points inside cells touched by the query region,
+    sorted in ascending order.  That is a superset of the points actually satisfying the query:
+    the caller applies the exact distance test to the candidates only.
+
+    Queries touch :math:`O(1)` cells for points, :math:`O(N^{1/d})` cells for lines, and
+    :math:`O(N^{(d-1)/d})` cells for planes, where :math:`d` is the spatial dimension.
+
+    :param points: coordinates :code:`(n, d)`, one row per point
+    """
+
+    def __init__(self, points):
+        points = np.array(points, dtype=np.float64)
+        if points.ndim == 1:
+            points = points.reshape(-1, 1)
+
+        self.size, self.dim = points.shape
+
+        if self.size:
+            self.lo = points.min(axis=0)
+            extent  = points.max(axis=0) - self.lo
+        else:
+            self.lo = np.zeros(self.dim)
+            extent  = np.zeros(self.dim)
+
+        h = extent.max() / np.ceil(self.size ** (1. / self.dim)) if self.size else 0.0
+        self.h = h if h > 0.0 else 1.0
+
+        self.shape = np.floor(extent / self.h).astype(np.int64) + 1
+
+        cells = np.ravel_multi_index(self.cellOf(points).T, self.shape)
+        self.order = np.argsort(cells, kind='stable')
+        self.cells = cells[self.order]
+
+    def __len__(self):
+        return self.size
+
+    def __str__(self):
+        return "SpatialIndex({} points, {} cells of size {})".format(self.size, self.shape.tolist(), self.h)
+
+    def cellOf(self, X):
+        r"""
+        :param X: coordinates :code:`(n, d)`
+        :returns: cell indices :code:`(n, d)`, clipped to the grid
+        """
+        idx = np.floor((np.asarray(X) - self.lo) / self.h)
+        return np.clip(idx, 0, self.shape - 1).astype(np.int64)
+
+    def nearPoint(self, x, r):
+        r"""
+        :param x: target position
+        :param r: search radius
+        :returns: indices of all candidate points within distance **r** from **x**
+        """
+        x = np.asarray(x, dtype=np.float64)
+        return self.inBox(x - r, x + r)
+
+    def nearLine(self, x, t, r):
+        r"""
+        :param x: a point on the line
+        :param t: direction vector of the line
+        :param r: search radius
+        :returns: indices of all candidate points within distance **r** from the line
+        """
+        x = np.asarray(x, dtype=np.float64)
+        t = np.asarray(t, dtype=np.float64)
+        t = t / np.linalg.norm(t)
+
+        if not np.all(np.isfinite(t)):
+            return np.zeros(0, dtype=np.int64)
+
+        # walk the layers of cells across the main direction k of the line.
+        # a point within r from the line lies within r*(1 + 1/|t_k|) from the line point of equal x_k.
+        k = np.argmax(np.abs(t))
+        w = r * (1. + 1. / np.abs(t[k])) + self.slack(r)
+
+        bounds = self.lo[k] + self.h * np.arange(self.shape[k] + 1)
+        s = (bounds - x[k]) / t[k]
+        Y = x + np.outer(s, t)
+
+        found = []
+        for m in range(self.shape[k]):
+            lo = np.minimum(Y[m], Y[m+1]) - w
+            hi = np.maximum(Y[m], Y[m+1]) + w
+            lo[k] = hi[k] = self.lo[k] + self.h * (m + 0.5)
+            found.append(self.inBox(lo, hi))
+
+        return np.sort(np.concatenate(found)) if found else np.zeros(0, dtype=np.int64)
+
+    def nearPlane(self, x, n, r):
+        r"""
+        :param x: a point on the plane
+        :param n: normal vector to the plane
+        :param r: search radius
+        :returns: indices of all candidate points within distance **r** from the plane
+        """
+        if self.dim < 2:
+            return self.nearPoint(x, r)
+
+        x = np.asarray(x, dtype=np.float64)
+        n = np.asarray(n, dtype=np.float64)
+        n = n / np.linalg.norm(n)
+
+        if not np.all(np.isfinite(n)):
+            return np.zeros(0, dtype=np.int64)
+
+        # for every column of cells along the main direction k of the normal,
+        # find the range of x_k touched by the slab of half-width r.
+        k = np.argmax(np.abs(n))
+        others = [ j for j in range(self.dim) if j != k ]
+
+        columns = np.indices(self.shape[others]).reshape(len(others), -1).T
+        centers = self.lo[others] + self.h * (columns + 0.5)
+
+        xk    = x[k] - (centers - x[others]) @ n[others] / n[k]
+        width = (0.5 * self.h * np.abs(n[others]).sum() + r) / np.abs(n[k]) + self.slack(r)
+
+        kmin = np.floor((xk - width - self.lo[k]) / self.h).astype(np.int64)
+        kmax = np.floor((xk + width - self.lo[k]) / self.h).astype(np.int64)
+        kmin = np.maximum(kmin, 0)
+        kmax = np.minimum(kmax, self.shape[k] - 1)
+        count = np.maximum(kmax - kmin + 1, 0)
+
+        rows = np.repeat(np.arange(len(count)), count)
+        idx  = np.empty((len(rows), self.dim), dtype=np.int64)
+        idx[:, others] = columns[rows]
+        idx[:, k]      = kmin[rows] + self.ranges(np.zeros_like(count), count)
+
+        return np.sort(self.inCells(np.ravel_multi_index(idx.T, self.shape)))
+
+    def inBox(self, lo, hi):
+        r"""
+        :param lo: lower corner of an axis-aligned box
+        :param hi: upper corner of that box
+        :returns: indices of all points inside cells touched by the box
+        """
+        if not self.size or np.any(hi < self.lo) or np.any(lo > self.lo + self.h * self.shape):
+            return np.zeros(0, dtype=np.int64)
+
+        imin = self.cellOf(lo)
+        imax = self.cellOf(hi)
+
+        axes = [ np.arange(a, b + 1) for a, b in zip(imin, imax) ]
+        idx  = np.stack(np.meshgrid(*axes, indexing='ij')).reshape(self.dim, -1)
+
+        return np.sort(self.inCells(np.ravel_multi_index(idx, self.shape)))
+
+    def inCells(self, cells):
+        r"""
+        :param cells: flat indices of distinct cells
+        :returns: indices of all points inside those cells (unsorted)
+        """
+        start = np.searchsorted(self.cells, cells, side='left')
+        stop  = np.searchsorted(self.cells, cells, side='right')
+
+        return self.order[self.ranges(start, stop - start)]
+
+    def slack(self, r):
+        r"""
+        :returns: safety margin covering round-off in the cell geometry
+        """
+        return 1.0e-9 * (self.h + r)
+
+    @staticmethod
+    def ranges(start, count):
+        r"""
+        :returns: concatenation of :code:`range(start[i], start[i] + count[i])` for all **i**
+        """
+        count  = np.asarray(count, dtype=np.int64)
+        offset = np.cumsum(count) - count
+        return np.repeat(np.asarray(start, dtype=np.int64) - offset, count) + np.arange(count.sum())
@@ -2,6 +2,7 @@ from multiprocessing.connection import answer_challenge
 from xmlrpc.client import INVALID_ENCODING_CHAR
 
 import numpy as np
+from copy import deepcopy
 
 ###
 ### matplotlib is needed for deprecated methods only
@@ -16,6 +17,7 @@ from fontTools.misc.textTools import caselessSort
 ###
 
 from .Node import Node
+from .SpatialIndex import SpatialIndex
 from ..elements.Element import *
 from ..solver.LinearSolver import LinearSolver
 from ..plotter.ElementPlotter import ElementPlotter as Plotter
@@ -30,9 +32,12 @@ class System():
     def __init__(self, verbose=False):
         self.nodes       = []
         self.elements    = []
+        self._node_set   = set()   # members of self.nodes, maintained by addNode() only
         self.constraints = []
         self.plotter     = Plotter()
 
+        self._node_index = None   # spatial index over node positions (see findNodesAt())
+
         self.verbose = verbose
 
         self.disp        = np.array([])
@@ -73,20 +78,29 @@ class System():
         if solver:
             self.solver = solver
             self.solver.pushState(state)
+            self.solver.resetAssemblyMap()
 
     def addNode(self, *nodes):
         """
         Add one or more nodes to the model.
 
+        .. note::
+
+            Nodes must be added through this method only.  Do not modify :code:`self.nodes` directly:
+            the set of known nodes used to reject duplicates would not be updated.
+
         :param newNode: a :code:`Node` object
         """
         for newNode in nodes:
-            if newNode not in self.nodes:
+            if newNode not in self._node_set:
                 newNode.setLoadFactor(self.loadfactor)
                 self.nodes.append(newNode)
+                self._node_set.add(newNode)
             elif self.verbose:
                 print('addNode: node {} already exists in system and was not added again'.format(newNode.getID()))
 
+        self._topologyChanged()
+
     def __add__(self, other):
         if isinstance(other, Node):
             self.addNode(other)
@@ -105,6 +119,44 @@ class System():
             elem.setLoadFactor(self.loadfactor)
             self.elements.append(elem)
 
+        self._topologyChanged()
+
+    def addMesh(self, X, connectivity, element_type, material, **kwargs):
+        r"""
+        Create and add nodes and elements in bulk.
+
+        .. code::
+
+            X = np.array([[0.,0.], [1.,0.], [2.,0.], [0.,1.], [1.,1.], [2.,1.]])
+            nodes, elements = model.addMesh(X, [[0,1,4,3], [1,2,5,4]], Quad, PlaneStress(params))
+
+        :param X: node coordinates :code:`(n, 2)` or :code:`(n, 3)`, one row per node
+        :param connectivity: node numbers :code:`(m, k)`, one row per element.  Node numbers are rows of **X**
+        :param element_type: element class, called as :code:`element_type(*nodes, material, **kwargs)`
+        :param material: a material object.  Every element receives its own copy.
+        :param kwargs: additional keyword arguments for every element
+        :returns: tuple (list of created :py:class:`Node` objects, list of created elements)
+        """
+        X = np.asarray(X, dtype=np.float64)
+        connectivity = np.asarray(connectivity, dtype=np.int64)
+
+        if X.ndim != 2 or connectivity.ndim != 2:
+            msg = "addMesh requires a 2d coordinate array and a 2d connectivity array"
+            raise TypeError(msg)
+
+        if connectivity.size and (connectivity.min() < 0 or connectivity.max() >= X.shape[0]):
+            msg = "connectivity refers to nodes outside 0..{}".format(X.shape[0] - 1)
+            raise TypeError(msg)
+
+        nodes    = [ Node(*x) for x in X.tolist() ]
+        elements = [ element_type(*[ nodes[i] for i in row ], deepcopy(material), **kwargs)
+                     for row in connectivity.tolist() ]
+
+        self.addNode(*nodes)
+        self.addElement(*elements)
+
+        return (nodes, elements)
+
     def addConstraint(self, *newConstraints):
         """
 
@@ -113,6 +165,18 @@ class System():
         for constraint in newConstraints:
             self.constraints.append(constraint)
 
+        self._topologyChanged()
+
+    def _topologyChanged(self):
+        """
+        Tell the solver that any cached assembly map, sparsity pattern, or ordering is outdated.
+        Also drops the spatial index over node positions.
+        """
+        self._node_index = None
+
+        if self.solver:
+            self.solver.resetAssemblyMap()
+
 # --------- load control functions ----------------------
 
     def setLoadFactor(self, lam):
@@ -152,6 +216,23 @@ class System():
 
         return (dist < tol)
 
+    def _nodeIndex(self, pos):
+        r"""
+        The spatial index over all node positions is built on first use and dropped whenever nodes or elements are added.
+
+        :param pos: target position of a query
+        :returns: the spatial index, or **None** if node positions and **pos** differ in dimension
+        """
+        if self._node_index is None or len(self._node_index) != len(self.nodes):
+            if len({ node.getPos().shape[0] for node in self.nodes }) != 1:
+                return None
+            self._node_index = SpatialIndex([ node.getPos() for node in self.nodes ])
+
+        if np.size(pos) != self._node_index.dim:
+            return None
+
+        return self._node_index
+
 
     def findNodesAt(self, pos, tol=1.e-3):
         r"""
@@ -167,7 +248,10 @@ class System():
         """
         ans = []
 
-        for node in self.nodes:
+        index = self._nodeIndex(pos)
+        nodes = self.nodes if index is None else [ self.nodes[i] for i in index.nearPoint(pos, tol) ]
+
+        for node in nodes:
             dist = node.distanceTo(pos)
             if dist<tol:
                 ans.append((node,dist))
@@ -189,7 +273,10 @@ class System():
         """
         ans = []
 
-        for node in self.nodes:
+        index = self._nodeIndex(pos)
+        nodes = self.nodes if index is None else [ self.nodes[i] for i in index.nearLine(pos, dir, tol) ]
+
+        for node in nodes:
             if self._is_node_on_line(node, pos, dir, tol=tol):
                 ans.append((node, node.distanceTo(pos)))
 
@@ -220,7 +307,10 @@ class System():
 
         ans = []
 
-        for node in self.nodes:
+        index = self._nodeIndex(pos)
+        nodes = self.nodes if index is None else [ self.nodes[i] for i in index.nearPlane(X0, nvec, tol) ]
+
+        for node in nodes:
             dist = np.abs( nvec @ (node.getPos() - X0) )
             if dist<tol:
                 ans.append((node,dist))
@@ -337,7 +427,7 @@ class System():
 
 # --------- Arc-length control functions: forward to Solver ------------
 
-    def initArcLength(self, load_increment=1., alpha=0.0, tolerance=1.0e-12):
+    def initArcLength(self, load_increment=1., alpha=0.0, tolerance=1.0e-12, max_steps=None):
         r"""
         Initializes parameters for the arc-length constraint.
 
@@ -352,9 +442,11 @@ class System():
         :param load_increment:   load increment used to calibrate the constraint
         :param alpha:            load contribution factor
         :param tolerance:        convergence tolerance
+        :param max_steps:        maximum number of iterations for each calibration solve (default: solver specific)
         """
         if self.solver:
-            self.solver.initArcLength(load_increment=load_increment, alpha=alpha, tolerance=tolerance)
+            kwargs = {} if max_steps is None else {'max_steps': max_steps}
+            self.solver.initArcLength(load_increment=load_increment, alpha=alpha, tolerance=tolerance, **kwargs)
 
     def stepArcLength(self, verbose=False, max_iter=10):
         r"""
@@ -372,6 +464,123 @@ class System():
             loadfactor, normR = self.solver.stepArcLength(verbose=verbose, max_iter=max_iter)
             self.setLoadFactor(loadfactor)
 
+# --------- Adaptive load stepping ------------
+
+    def solveLoadPath(self, target, start=None, step=None, min_step=None, max_step=None,
+                      desired_iterations=4, max_iter=10, verbose=False):
+        r"""
+        Follow the load path from the current (or **start**) load factor to **target** using load control
+        with automatic step size selection.
+
+        * After a converged step, the next increment is scaled by :math:`\sqrt{n_d / n}`, where :math:`n` is the
+          number of iterations used by that step and :math:`n_d` is **desired_iterations**.  The increment grows
+          by at most a factor of 2 and shrinks by at most a factor of 2.
+        * A failed step is reverted to the last converged state (see :py:meth:`Solver.revert`) and
+          retried with half the increment.
+
+        Only converged steps are recorded.
+
+        .. code::
+
+            model.startRecorder()
+            lams = model.solveLoadPath(target=1.0, start=0.0)
+
+        :param target: final load factor
+        :param start: initial load factor.  If given, equilibrium at that load level is found first.
+                      Defaults to the current load factor.
+        :param step: initial load increment (default: 1/10 of the load range)
+        :param min_step: smallest acceptable load increment (default: :math:`10^{-6}` of the load range)
+        :param max_step: largest acceptable load increment (default: the entire load range)
+        :param desired_iterations: number of iterations per step the step size is adjusted for
+        :param max_iter: maximum number of iterations per step; handed on to the solver
+        :param verbose: set to **True** for log info
+        :returns: list of converged load factors
+        :raises RuntimeError: if no equilibrium is found at the **start** load factor
+        """
+        if not self.solver:
+            print("** load path: no solver assigned to the model: use setSolver() first")
+            return []
+
+        if not isinstance(desired_iterations, int) or desired_iterations < 1:
+            msg = "desired_iterations must be a positive int"
+            raise TypeError(msg)
+
+        converged = []
+
+        if start is not None:
+            self.setLoadFactor(start)
+            if not self._solveLoadStep(max_iter):
+                msg = f"no equilibrium found at the start of the load path, lambda = {start}"
+                raise RuntimeError(msg)
+            converged.append(start)
+
+        lam = self.solver.loadfactor_n if start is None else start
+
+        load_range = abs(target - lam)
+        if load_range == 0.0:
+            return converged
+
+        direction = np.sign(target - lam)
+
+        if step is None:
+            step = load_range / 10.
+        if min_step is None:
+            min_step = 1.0e-6 * load_range
+        if max_step is None:
+            max_step = load_range
+
+        step = min(abs(step), max_step)
+
+        while direction * (target - lam) > 1.0e-12 * load_range:
+
+            dlam = min(step, direction * (target - lam))
+
+            self.setLoadFactor(lam + direction * dlam)
+
+            if self._solveLoadStep(max_iter):
+                lam += direction * dlam
+                converged.append(lam)
+
+                # adjust the step size to the convergence rate
+                iterations = max(self.solver.num_iterations, 1)
+                factor = min(max(np.sqrt(desired_iterations / iterations), 0.5), 2.0)
+                step = min(max(dlam * factor, min_step), max_step)
+
+                if verbose:
+                    print(f"** load path: converged at lambda = {lam:g} in {iterations} iterations,"
+                          f" next increment {step:g}")
+
+            else:
+                # cut back
+                step = dlam / 2.
+
+                if verbose:
+                    print(f"** load path: no convergence for lambda = {lam + direction * dlam:g},"
+                          f" bisecting to increment {step:g}")
+
+                if step < min_step:
+                    self.setLoadFactor(lam)
+                    print(f"** load path: step size below {min_step:g} at lambda = {lam:g}: analysis stopped")
+                    break
+
+        return converged
+
+    def _solveLoadStep(self, max_iter):
+        r"""
+        Single load step for :py:meth:`solveLoadPath` (internal use only).
+
+        :returns: **True** if the step converged, otherwise the model is reverted to the last converged state
+        """
+        try:
+            normR = self.solver.solve(max_steps=max_iter)
+        except (np.linalg.LinAlgError, RuntimeError, ValueError):
+            # singular or invalid tangent stiffness: the solver stopped before reverting the trial state
+            self.solver.revert()
+            return False
+
+        # a failed solve() has reverted to the last converged state already
+        return normR < self.solver.TOL
+
     # --------- recorder methods ------------------------------
 
     def initRecorder(self, **kwargs):
@@ -476,15 +685,98 @@ class System():
 
         if self.recorder and self.recorder.isActive():
             data = {'lam':self.loadfactor}
-            if self.track_stability:
+            if self.track_stability == 'inertia':
+                data['stability'] = self.checkInertia()
+            elif self.track_stability:
                 data['stability'] = self.solver.checkStability(num_eigen=1)
             else:
                 data['stability'] = np.nan
 
             self.recorder.addData(data)
 
-    def trackStability(self, on=True):
-        self.track_stability = on
+    def trackStability(self, on=True, method='eigen'):
+        r"""
+        Turn stability tracking on or off.  The stability index is recorded as **'stability'** for every converged load step.
+
+        .. list-table:: methods
+            :header-rows: 1
+
+            * - method
+              - stability index
+            * - **'eigen'**
+              - determinant or smallest eigenvalues of :math:`{\bf K}_{ff}` (see :py:meth:`checkStability`) (default)
+            * - **'inertia'**
+              - number of negative eigenvalues of :math:`{\bf K}_{ff}`, read from the factorization used by the solver.
+                Changes of that number between load steps are reported as limit or bifurcation points.
+
+        :param on: **True** to track stability, **False** to turn tracking off
+        :param method: **'eigen'** or **'inertia'**
+        """
+        if method not in ('eigen', 'inertia'):
+            msg = f"unknown stability tracking method '{method}': use 'eigen' or 'inertia'"
+            raise TypeError(msg)
+
+        if on and method == 'inertia':
+            self.track_stability = 'inertia'
+        else:
+            self.track_stability = on
+
+        self.critical_points = []
+        self.last_inertia    = None
+
+    def checkInertia(self, verbose=True):
+        r"""
+        Compare the number of negative eigenvalues of :math:`{\bf K}_{ff}` to that of the previously checked state.
+        The count is obtained from the inertia of the solver's factorization (Sylvester's law of inertia),
+        i.e., without any eigenvalue analysis.
+
+        A changed count indicates a critical point between the two states.  Once the next state is checked,
+        that point is classified as
+
+        * **limit point** if the load factor reversed its direction, or
+        * **bifurcation point** otherwise.
+
+        All detected points are appended to :code:`self.critical_points` as tuple
+        (kind, previous load factor, current load factor, previous count, current count).
+
+        :param verbose: set to **True** to report detected critical points
+        :returns: number of negative eigenvalues of :math:`{\bf K}_{ff}`
+        """
+        negative = self.solver.getInertia()[0]
+        lam      = self.solver.loadfactor      # the model learns the load factor of an arc-length step only after recording
+
+        if self.last_inertia is None:
+            self.last_inertia = (negative, lam, 0.0, None)
+            return negative
+
+        last_negative, last_lam, last_dlam, pending = self.last_inertia
+
+        dlam = lam - last_lam
+        if dlam == 0.0:
+            dlam = last_dlam
+
+        if pending is not None and dlam != 0.0:
+            # classify the critical point found during the previous step
+            k, dlam_before = pending
+            kind = 'limit point' if dlam * dlam_before < 0.0 else 'bifurcation point'
+            self.critical_points[k] = (kind, *self.critical_points[k][1:])
+            pending = None
+
+            if verbose:
+                print(f"\n ** Stability check: critical point between lambda = {self.critical_points[k][1]:g}"
+                      f" and lambda = {self.critical_points[k][2]:g} is a {kind}\n")
+
+        if negative != last_negative:
+            self.critical_points.append(('critical point', last_lam, lam, last_negative, negative))
+            pending = (len(self.critical_points) - 1, last_dlam)
+
+            if verbose:
+                print(f"\n ** Stability check: critical point between lambda = {last_lam:g} and lambda = {lam:g}"
+                      f" (negative eigenvalues of Kt: {last_negative} -> {negative})\n")
+
+        self.last_inertia = (negative, lam, dlam, pending)
+
+        return negative
 
     def fetchRecord(self, keys=[]):
         """
@@ -537,6 +829,110 @@ class System():
         else:
             return (np.nan,None)
 
+    def solveBuckling(self, num_modes=1, **kwargs):
+        r"""
+        Linearized buckling analysis for the reference load: solves :math:`({\bf K}_0 + \lambda {\bf K}_g) {\bf \phi} = {\bf 0}`
+        for the **num_modes** lowest critical load factors, :math:`\lambda`.  The model state is not changed.
+
+        The first mode shape is pushed to the nodes.  Other modes can be selected using :py:meth:`pushBucklingMode`.
+
+        .. code::
+
+            lam = model.solveBuckling(num_modes=3)
+
+            model.pushBucklingMode(mode=1)
+            model.plot(factor=1.0, modeshape=True)
+
+        **Implemented** by :py:class:`Solver`.
+
+        :param num_modes: number of requested buckling modes
+        :param verbose: set to **True** for log info
+        :returns: critical load factors in ascending order
+        """
+        if self.solver:
+            return self.solver.solveBuckling(num_modes=num_modes, **kwargs)
+
+    def pushBucklingMode(self, mode=0):
+        r"""
+        Push a mode shape from the last :py:meth:`solveBuckling` to the nodes, e.g., for :code:`plot(modeshape=True)`.
+
+        **Implemented** by :py:class:`Solver`.
+
+        :param mode: mode number, :code:`0` being the mode with the lowest critical load factor
+        :returns: the critical load factor of that mode
+        """
+        if self.solver:
+            return self.solver.pushBucklingMode(mode=mode)
+
+    def addLoadCase(self, name):
+        r"""
+        Store all loads currently applied to the model (nodal loads and element loads) as load case **name**.
+
+        .. code::
+
+            model.resetLoad()
+            node.addLoad([-10.], ['uy'])
+            model.addLoadCase('dead')
+
+            model.resetLoad()
+            element.setDistLoad(-2.0)
+            model.addLoadCase('live')
+
+            model.solveLoadCases()
+            U, R = model.combineLoadCases({'dead': 1.2, 'live': 1.6})
+
+        **Implemented** by :py:class:`Solver`.
+
+        :param name: name of the load case
+        """
+        if self.solver:
+            self.solver.addLoadCase(name)
+
+    def resetLoadCases(self):
+        r"""
+        Remove all load cases and their results.
+
+        **Implemented** by :py:class:`Solver`.
+        """
+        if self.solver:
+            self.solver.resetLoadCases()
+
+    def solveLoadCases(self, **kwargs):
+        r"""
+        Linear analysis of all load cases using a single factorization of the stiffness matrix.
+        The model state is not changed.
+
+        **Implemented** by :py:class:`Solver`.
+
+        :param verbose: set to **True** for log info
+        :returns: list of the names of all solved load cases
+        """
+        if self.solver:
+            return self.solver.solveLoadCases(**kwargs)
+
+    def getLoadCase(self, name):
+        r"""
+        **Implemented** by :py:class:`Solver`.
+
+        :param name: name of the load case
+        :returns: tuple (system displacement vector, system vector of support reactions)
+        """
+        if self.solver:
+            return self.solver.getLoadCase(name)
+
+    def combineLoadCases(self, factors):
+        r"""
+        Linear combination of solved load cases.  The combined displacements are pushed to the nodes,
+        e.g., for :py:meth:`plot` or :py:meth:`valuePlot`.
+
+        **Implemented** by :py:class:`Solver`.
+
+        :param factors: dict :code:`{ name: factor }` of load case names and their factors
+        :returns: tuple (system displacement vector, system vector of support reactions)
+        """
+        if self.solver:
+            return self.solver.combineLoadCases(factors)
+
 # ------------ plot methods -----------------
 
     def plot(self, factor=1.0, show_reactions=True, show_loads=True, force_limit=1.0e-6, **kwargs):
@@ -772,7 +1168,10 @@ class System():
             ax2.plot(detKt, loadfactors,'-r')
             ax2.plot(np.zeros_like(loadfactors), loadfactors,'-k', lw=2)
             ax2.grid(True)
-            ax2.set_xlabel('stability index, $ det({\\bf K}_t) $ or $ \\min |\\lambda| $')
+            if self.track_stability == 'inertia':
+                ax2.set_xlabel('number of negative eigenvalues of $ {\\bf K}_t $')
+            else:
+                ax2.set_xlabel('stability index, $ det({\\bf K}_t) $ or $ \\min |\\lambda| $')
             ax2.set_ylabel('load factor, $\\lambda$')
 
         plt.savefig("history_plots.png", bbox_inches='tight')
@@ -799,15 +1198,15 @@ class System():
         """
         Store the current displacement vector for later restore using :code:`popU()`.
         """
-        for node in self.nodes:
-            node.pushU()
+        self.solver.getDisplacementState().push(self.solver.loadfactor)
 
     def popU(self):
         """
         Restore a previously pushed displacement vector (using :code:`pushU()`).
         """
+        lam = self.solver.getDisplacementState().pop()
         for node in self.nodes:
-            node.popU()
+            node.setLoadFactor(lam)
 
     def plotBucklingMode(self, factor=1.0, mode=0, filename=None, **kwargs):
         """
@@ -889,10 +1288,12 @@ class System():
 
     def resetLoad(self):
         """
-        Resets the load vector.
+        Resets the load vector, i.e., all nodal loads and all element loads.
         """
         for node in self.nodes:
             node.resetLoad()
+        for elem in self.elements:
+            elem.resetLoads()
 
     def resetAll(self):
         """
@@ -8,7 +8,8 @@ __all__ = (
     'FrameTransformation',
     'Frame2dTransformation',
     'SolidTransformation',
-    'Solid2dTransformation'
+    'Solid2dTransformation',
+    'ParameterSweep',
 )
 
 from .System                import System
@@ -20,3 +21,4 @@ from .BeamTransformation    import BeamTransformation
 from .Beam2dTransformation  import Beam2dTransformation
 from .SolidTransformation   import SolidTransformation
 from .Solid2dTransformation import Solid2dTransformation
+from .ParameterSweep        import ParameterSweep
@@ -9,6 +9,7 @@ from .DrawElement import *
 from ..recorder.Recorder import Recorder
 from .Face2D import *
 from .Face3D import *
+from .ElementGroup import *
 
 
 class Element(DrawElement):
@@ -18,6 +19,9 @@ class Element(DrawElement):
 
     COUNT = 0
 
+    GROUP      = None   # ElementGroup class for batched evaluation (see ElementGroup)
+    KINEMATICS = None   # kinematic assumption used by the ElementGroup: 'finite' or 'linear'
+
     def __init__(self, nodes, material, label=None):
         r"""
         :param nodes: list of node pointers
@@ -105,7 +109,9 @@ class Element(DrawElement):
         r"""
         default implementation for resetting element loads.
         """
-        for face in self.faces:
+        self.Loads = [ [] for i in range(len(self.nodes)) ]
+
+        for face in getattr(self, 'faces', []):     # line elements have no faces
             face.setLoad(0.0, 0.0)
 
     def createFaces(self):
@@ -278,6 +284,26 @@ class Element(DrawElement):
         """
         self.updateState()
 
+        return self._localForces()
+
+    def getForceAndStiffness(self):
+        r"""
+        Request the internal force vector and the tangent stiffness matrix from a single state update.
+
+        Equivalent to calling :py:meth:`getForce` followed by :py:meth:`getStiffness`,
+        though, the element state is updated only once.  Used by the solvers' assembly loop.
+
+        :return: tuple (internal force vector, tangent stiffness matrix as nodal matrices)
+        """
+        self.updateState()
+
+        # shallow copy: transformed blocks replace entries but never modify self.Kt
+        return (self._localForces(), self._localStiffness([ list(KTi) for KTi in self.Kt ]))
+
+    def _localForces(self):
+        r"""
+        :return: internal forces in each respective node's local coordinates
+        """
         # make sure forces are returned in each respective node's local coordinates
         forces = []
         for node, force in zip(self.nodes, self.Forces):
@@ -355,8 +381,85 @@ class Element(DrawElement):
         """
         self.updateState()
 
-        KT = deepcopy(self.Kt)
+        # shallow copy: transformed blocks replace entries but never modify self.Kt
+        return self._localStiffness([ list(KTi) for KTi in self.Kt ])
+
+    def getMaterials(self):
+        r"""
+        Elements keeping their material objects elsewhere than in :code:`self.material` shall overload this method.
+
+        :returns: list of all material objects of this element, e.g., one per integration point
+        """
+        if isinstance(self.material, (list, tuple)):
+            return list(self.material)
+        return [self.material]
+
+    def hasConstantStiffness(self):
+        r"""
+        Elements using a linear formulation with a linear material (see :py:meth:`Material.isLinear`)
+        shall overload this method.  Solvers then compute the stiffness of such an element once and
+        reuse it until :py:meth:`getStiffnessKey` changes.
+
+        :returns: **True** if the stiffness does not depend on the state of deformation
+        """
+        return False
+
+    def getStiffnessKey(self):
+        r"""
+        Identify all data a constant element stiffness depends on, other than the reference geometry:
+        material objects and their parameters, as well as element and nodal transformations.
+
+        :returns: a tuple that changes whenever the material or any transformation of this element changes
+        """
+        key  = tuple( (material, tuple(material.parameters.items())) for material in self.getMaterials() )
+        key += tuple(self.transforms)
+        key += tuple( node.getTransformation() for node in self.nodes )
+
+        return key
+
+    def getGeometricStiffness(self):
+        r"""
+        Geometric (initial stress) stiffness, :math:`{\bf K}_g`, for the current state of stress,
+        evaluated on the reference configuration.  Used by the linearized buckling analysis.
+
+        This default implementation is for elements without geometric stiffness and returns zero matrices.
+
+        :return: geometric stiffness in each respective node's local coordinates
+        """
+        self.updateState()
+
+        return [ [ np.zeros_like(KtIJ) for KtIJ in KtI ] for KtI in self.Kt ]
+
+    def getGaussPointData(self):
+        r"""
+        Provide the reference-configuration data needed for batched evaluation by an :py:class:`ElementGroup`.
+
+        This method needs to be implemented by every element that defines :code:`GROUP`.
+
+        :return: tuple (shape function gradients :code:`(ngp, 2, nnode)`, integration weights times Jacobian :code:`(ngp,)`,
+                 list of material objects, one per Gauss point)
+        """
+        msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
+        raise NotImplementedError(msg)
+
+    def setGaussPointState(self, strains, stresses, P):
+        r"""
+        Store the Gauss-point state computed by an :py:class:`ElementGroup` for reporting.
+
+        This method needs to be implemented by every element that defines :code:`GROUP`.
 
+        :param strains: list of strain dictionaries, one per Gauss point
+        :param stresses: list of stress dictionaries returned by the materials, one per Gauss point
+        :param P: stress tensors as used for internal forces :code:`(ngp, 2, 2)`
+        """
+        msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
+        raise NotImplementedError(msg)
+
+    def _localStiffness(self, KT):
+        r"""
+        :param KT: copy of the tangent stiffness matrix, :code:`self.Kt`, as nodal matrices
+        :return: tangent stiffness in each respective node's local coordinates
+        """
         for i, ndI in enumerate(self.nodes):
             for j, ndJ in enumerate(self.nodes):
                 #
@@ -0,0 +1,770 @@
+import numpy as np
+
+from ..materials.MaterialStore import MaterialStore
+
+
+class ElementGroup():
+    r"""
+    abstract class: representing a group of elements of one type, evaluated in a single batch.
+
+    Element types supporting batched evaluation name their group class in the class attribute
+    :code:`GROUP`.  Derived element classes are evaluated one by one unless they declare :code:`GROUP` again.  Solvers collect all such elements with :py:meth:`buildGroups` once per topology
+    and then request forces and stiffness for an entire group at once (see :py:meth:`evaluate`).
+    The results are written back to every element, such that element-level access
+    (forces, stresses, plotting) remains unchanged.
+
+    All other elements are evaluated one by one through :py:meth:`Element.getForceAndStiffness`.
+
+    :param elements: list of element pointers (all of the same type)
+    :param index: position of every element in the solver's element list
+    """
+
+    MIN_SIZE = 2    # smaller groups are evaluated element by element
+    MAX_SIZE = 512  # larger groups are split into chunks of at most that many elements
+
+    def __init__(self, elements, index):
+        self.elements = elements
+        self.index    = np.asarray(index, dtype=int)
+
+        self.vec_pos = None     # positions of all element force entries in the assembly data
+        self.mat_pos = None     # positions of all element stiffness entries in the assembly data
+
+    def __len__(self):
+        return len(self.elements)
+
+    @staticmethod
+    def buildGroups(elements):
+        r"""
+        Sort elements into groups for batched evaluation.
+
+        :param elements: list of element pointers
+        :returns: tuple (list of :py:class:`ElementGroup` objects, indices of all remaining elements)
+        """
+        members = {}
+        singles = []
+
+        for idx, element in enumerate(elements):
+            # subclasses may alter the element formulation and need to declare GROUP themselves
+            group = element.__class__.__dict__.get('GROUP', None)
+            if group is not None and group.accepts(element):
+                key = (group,) + group.signature(element)
+                members.setdefault(key, []).append(idx)
+            else:
+                singles.append(idx)
+
+        groups = []
+        for key, index in members.items():
+            if len(index) < key[0].MIN_SIZE:
+                singles.extend(index)
+                continue
+
+            # a fixed chunk size keeps results independent of the number of workers (see Solver.setWorkers)
+            for start in range(0, len(index), key[0].MAX_SIZE):
+                chunk = index[start:start + key[0].MAX_SIZE]
+                groups.append(key[0]([ elements[i] for i in chunk ], chunk))
+
+        return (groups, sorted(singles))
+
+    @classmethod
+    def accepts(cls, element):
+        r"""
+        :returns: **True** if **element** can be evaluated by this group type
+        """
+        return False
+
+    @classmethod
+    def signature(cls, element):
+        r"""
+        :returns: a tuple that is identical for all elements evaluated in the same group
+        """
+        return (element.__class__,)
+
+    def setPositions(self, vec_ptr, mat_ptr):
+        r"""
+        Locate the element data of this group within the flat assembly arrays.
+
+        :param vec_ptr: offset of every element's force entries (see :py:class:`AssemblyMap`)
+        :param mat_ptr: offset of every element's stiffness entries (see :py:class:`AssemblyMap`)
+        """
+        nvec = vec_ptr[self.index + 1] - vec_ptr[self.index]
+        nmat = mat_ptr[self.index + 1] - mat_ptr[self.index]
+
+        self.vec_pos = (vec_ptr[self.index][:,np.newaxis] + np.arange(nvec[0])).ravel()
+        self.mat_pos = (mat_ptr[self.index][:,np.newaxis] + np.arange(nmat[0])).ravel()
+
+    def evaluate(self, U, force_only=False):
+        r"""
+        Update the state of all elements in this group.
+
+        :param U: current displacements of all nodes (see :py:class:`DisplacementState`)
+        :param force_only: set to **True** if only internal forces are needed
+        :returns: tuple (internal forces, tangent stiffness or **None**) as arrays with one row per element,
+                  ordered as the element's nodal vectors and blocks.
+        """
+        msg = "** WARNING ** {}.evaluate not implemented".format(self.__class__.__name__)
+        raise NotImplementedError(msg)
+
+
+class ContinuumGroup(ElementGroup):
+    r"""
+    Batched evaluation of plane continuum elements (2 d.o.f.s per node).
+
+    All element data is stacked into arrays with one row per element:
+
+    .. list-table:: data layout
+        :header-rows: 1
+
+        * - array
+          - content
+        * - **X**
+          - reference coordinates :code:`(nelem, nnode, 2)`
+        * - **uidx**
+          - system d.o.f. index of the displacement components :code:`(nelem, nnode, 2)`
+        * - **Grad**
+          - gradients of the shape functions with respect to reference coordinates :code:`(nelem, ngp, 2, nnode)`
+        * - **wJ**
+          - integration weight times Jacobian :code:`(nelem, ngp)`
+
+    Elements of a group provide :code:`getGaussPointData()` and :code:`setGaussPointState()`
+    and select the kinematics through the class attribute :code:`KINEMATICS`:
+
+    * **'finite'**: Green-Lagrange strain, 1st Piola-Kirchhoff stress, and initial stress stiffness
+    * **'linear'**: small strain
+
+    Materials keeping their state in a :py:class:`MaterialStore` are updated by a single, vectorized
+    call per store.  All other materials are updated Gauss point by Gauss point.
+    """
+
+    def __init__(self, elements, index):
+        super(ContinuumGroup, self).__init__(elements, index)
+
+        element = elements[0]
+        self.finite = (element.KINEMATICS == 'finite')
+
+        X     = []
+        uidx  = []
+        Grad  = []
+        wJ    = []
+        self.materials = []
+
+        for element in elements:
+            X.append([ node.getPos() for node in element.nodes ])
+            uidx.append([ node.getIdx4Element(element) for node in element.nodes ])
+
+            grads, weights, materials = element.getGaussPointData()
+            Grad.append(grads)
+            wJ.append(weights)
+            self.materials.extend(materials)
+
+        self.X    = np.array(X, dtype=np.float64)
+        self.uidx = np.array(uidx, dtype=int)
+        self.Grad = np.array(Grad, dtype=np.float64)
+        self.wJ   = np.array(wJ, dtype=np.float64)
+
+        self.ngp = self.Grad.shape[1]
+
+        self.store_map = None   # Gauss points grouped by material store (see mapMaterials)
+        self.bindings  = None   # value of MaterialStore.BINDINGS when store_map was built
+
+    @classmethod
+    def accepts(cls, element):
+        r"""
+        inherited from :code:`ElementGroup` class.
+
+        Plane elements without nodal transformations.
+        """
+        if element.KINEMATICS not in ('finite', 'linear'):
+            return False
+
+        for node in element.nodes:
+            if node.getPos().size != 2 or node.hasTransform() or node.getLead().hasTransform():
+                return False
+
+        return True
+
+    def evaluate(self, U, force_only=False):
+        r"""
+        inherited from :code:`ElementGroup` class.
+        """
+        Grad = self.Grad
+        nelem, ngp, _, nnode = Grad.shape
+        One = np.eye(2)
+
+        # deformed nodal coordinates and deformation gradient
+        xt = self.X + U[self.uidx]
+        F  = np.einsum('egkn,enj->egjk', Grad, xt)
+
+        if self.finite:
+            # Green-Lagrange strain
+            eps = 0.5 * (np.swapaxes(F, 2, 3) @ F - One)
+        else:
+            # small strain
+            eps = 0.5 * (F + np.swapaxes(F, 2, 3)) - One
+
+        # update the material state
+        S, Ct, strains, stresses = self.updateMaterials(eps)
+
+        P = F @ S if self.finite else S
+
+        # write back the Gauss-point state
+        k = 0
+        for e, element in enumerate(self.elements):
+            element.setGaussPointState(strains[k:k+ngp], stresses[k:k+ngp], P[e])
+            k += ngp
+
+        # internal forces
+        w = self.wJ
+        Fe = np.einsum('egjk,egkn->enj', P * w[:,:,np.newaxis,np.newaxis], Grad)
+
+        if force_only:
+            for e, element in enumerate(self.elements):
+                element.Forces = Fe[e]
+            return (Fe, None)
+
+        # kinematic matrices, B[e,g,n] (3 x 2)
+        Fk = F if self.finite else np.broadcast_to(One, F.shape)
+
+        G0 = Grad[:,:,0,:,np.newaxis]
+        G1 = Grad[:,:,1,:,np.newaxis]
+        B = np.empty((nelem, ngp, nnode, 3, 2))
+        B[...,0,:] = G0 * Fk[:,:,np.newaxis,:,0]
+        B[...,1,:] = G1 * Fk[:,:,np.newaxis,:,1]
+        B[...,2,:] = G0 * Fk[:,:,np.newaxis,:,1] + G1 * Fk[:,:,np.newaxis,:,0]
+
+        # material stiffness
+        CtB = (Ct * w[:,:,np.newaxis,np.newaxis])[:,:,np.newaxis] @ B
+        Bt  = np.swapaxes(B, 3, 4).reshape(nelem, ngp, nnode*2, 3)
+        Kt  = (Bt @ np.swapaxes(CtB, 2, 3).reshape(nelem, ngp, 3, nnode*2)).sum(axis=1)
+        Kt  = Kt.reshape(nelem, nnode, 2, nnode, 2).transpose(0, 1, 3, 2, 4)
+
+        if self.finite:
+            # initial stress stiffness
+            GSG = np.swapaxes(Grad, 2, 3) @ (S * w[:,:,np.newaxis,np.newaxis]) @ Grad
+            Kt = Kt + GSG.sum(axis=1)[:,:,:,np.newaxis,np.newaxis] * One
+
+        for e, element in enumerate(self.elements):
+            element.Forces = Fe[e]
+            element.Kt     = Kt[e]
+
+        return (Fe, Kt)
+
+    def mapMaterials(self):
+        r"""
+        Group all Gauss points by the :py:class:`MaterialStore` holding their material state.
+
+        :returns: tuple (list of (store, Gauss point positions, rows within the store), positions of all other Gauss points)
+        """
+        if self.store_map is None or self.bindings != MaterialStore.BINDINGS:
+            members = {}
+            others  = []
+
+            for k, material in enumerate(self.materials):
+                store, row = material.getStoreRow()
+                if store is None:
+                    others.append(k)
+                else:
+                    members.setdefault(id(store), (store, [], []))
+                    members[id(store)][1].append(k)
+                    members[id(store)][2].append(row)
+
+            stores = []
+            for store, pos, rows in members.values():
+                rows = np.array(rows, dtype=int)
+                if np.array_equal(rows, np.arange(rows[0], rows[0] + rows.shape[0])):
+                    rows = slice(rows[0], rows[0] + rows.shape[0])    # contiguous rows: no copies needed
+                stores.append((store, np.array(pos, dtype=int), rows))
+
+            self.store_map = (stores, others)
+            self.bindings  = MaterialStore.BINDINGS
+
+        return self.store_map
+
+    def updateMaterials(self, eps):
+        r"""
+        Set the strain at every Gauss point and collect stress and material tangent.
+
+        :param eps: strain tensors :code:`(nelem, ngp, 2, 2)`
+        :returns: tuple (2nd Piola-Kirchhoff stress tensors :code:`(nelem, ngp, 2, 2)`,
+                  material tangents :code:`(nelem, ngp, 3, 3)`, list of strain dictionaries,
+                  list of stress dictionaries)
+        """
+        nelem, ngp = eps.shape[:2]
+
+        E = np.stack((eps[:,:,0,0], eps[:,:,1,1], eps[:,:,0,1] + eps[:,:,1,0]), axis=-1).reshape(-1, 3)
+
+        S  = np.empty((nelem*ngp, 3))
+        Ct = np.empty((nelem*ngp, 3, 3))
+        zz = np.zeros(nelem*ngp)
+
+        stores, others = self.mapMaterials()
+
+        # vectorized update of all material stores
+        for store, pos, rows in stores:
+            S[pos], Ct[pos] = store.setStrain(rows, E[pos])
+            zz[pos] = store.zz[rows]
+
+        strains  = [ {'xx':exx, 'yy':eyy, 'xy':exy, 'zz':ezz} for (exx, eyy, exy), ezz in zip(E.tolist(), zz.tolist()) ]
+        stresses = [ {'xx':sxx, 'yy':syy, 'zz':0.0, 'xy':sxy, 'yz':0.0, 'zx':0.0} for sxx, syy, sxy in S.tolist() ]
+
+        # Gauss point by Gauss point
+        for k in others:
+            strain = {'xx':strains[k]['xx'], 'yy':strains[k]['yy'], 'xy':strains[k]['xy']}
+            strains[k] = strain
+
+            material = self.materials[k]
+            material.setStrain(strain)
+
+            stress = material.getStress()
+            S[k]  = (stress['xx'], stress['yy'], stress['xy'])
+            Ct[k] = material.getStiffness()
+
+            stresses[k] = stress
+
+        S = S[:,(0,2,2,1)].reshape(nelem, ngp, 2, 2)
+
+        return (S, Ct.reshape(nelem, ngp, 3, 3), strains, stresses)
+
+
+class LineGroup(ElementGroup):
+    r"""
+    abstract class: batched evaluation of two-node line elements.
+
+    .. list-table:: data layout
+        :header-rows: 1
+
+        * - array
+          - content
+        * - **X**
+          - reference coordinates :code:`(nelem, 2, ndim)`
+        * - **uidx**
+          - system d.o.f. index of the element d.o.f.s :code:`(nelem, 2, ndof)`
+
+    Derived groups compute kinematics and nodal forces for all elements at once
+    and write the element variables (:code:`force`, :code:`Forces`, :code:`Kt`, ...) back to every element.
+    Material updates use the material object of every element.
+    """
+
+    def __init__(self, elements, index):
+        super(LineGroup, self).__init__(elements, index)
+
+        self.kinematics = elements[0].KINEMATICS
+
+        self.X    = np.array([ [ node.getPos() for node in element.nodes ] for element in elements ], dtype=np.float64)
+        self.uidx = np.array([ [ node.getIdx4Element(element) for node in element.nodes ] for element in elements ], dtype=int)
+
+    @classmethod
+    def accepts(cls, element):
+        r"""
+        inherited from :code:`ElementGroup` class.
+
+        Two-node elements without nodal transformations.
+        """
+        if element.KINEMATICS is None or len(element.nodes) != 2:
+            return False
+
+        for node in element.nodes:
+            if node.hasTransform() or node.getLead().hasTransform():
+                return False
+
+        return True
+
+    @classmethod
+    def signature(cls, element):
+        r"""
+        inherited from :code:`ElementGroup` class.
+
+        Elements of one class with the same number of d.o.f.s per node.
+        """
+        return (element.__class__, len(element.getDofs()))
+
+    def setForces(self, Fe, Kt=None):
+        r"""
+        Write nodal forces and, optionally, the tangent stiffness back to every element.
+
+        :param Fe: nodal forces :code:`(nelem, 2, ndof)`
+        :param Kt: tangent stiffness :code:`(nelem, 2, 2, ndof, ndof)`
+        """
+        if Kt is None:
+            for element, F in zip(self.elements, Fe):
+                element.Forces = [ F[0], F[1] ]
+        else:
+            for element, F, K in zip(self.elements, Fe, Kt):
+                element.Forces = [ F[0], F[1] ]
+                element.Kt     = K
+
+
+class TrussGroup(LineGroup):
+    r"""
+    Batched evaluation of truss elements in 2D or 3D.
+
+    The class attribute :code:`KINEMATICS` of the element selects the formulation:
+
+    * **'direct'**: constant stiffness, force recovery from the axial strain
+    * **'linear'**: small deformation, section (:code:`SECTION1D`) or fiber materials
+    * **'finite'**: Hencky strain along the deformed axis, including the initial stress stiffness
+    """
+
+    def __init__(self, elements, index):
+        super(TrussGroup, self).__init__(elements, index)
+
+        Lvec = self.X[:,1] - self.X[:,0]
+        self.L0   = np.linalg.norm(Lvec, axis=1)
+        self.Nvec = Lvec / self.L0[:,np.newaxis]
+
+        if self.kinematics == 'direct':
+            # stiffness and force recovery parameters are fixed by the element
+            self.L0   = np.array([ element.L for element in elements ])
+            self.Nvec = np.array([ element.Nvec for element in elements ])
+            self.EA   = np.array([ element.EA for element in elements ])
+            self.K0   = np.array([ element.Kt for element in elements ], dtype=np.float64)
+        elif self.kinematics == 'linear':
+            self.L0   = np.array([ element.L0 for element in elements ])
+            self.Nvec = np.array([ element.Nvec for element in elements ])
+
+        self.section = [ self.kinematics == 'linear' and
+                         element.material.materialType() == element.material.SECTION1D
+                         for element in elements ]
+
+    @classmethod
+    def accepts(cls, element):
+        r"""
+        inherited from :code:`ElementGroup` class.
+        """
+        return (element.KINEMATICS in ('direct', 'linear', 'finite')
+                and super(TrussGroup, cls).accepts(element))
+
+    def evaluate(self, U, force_only=False):
+        r"""
+        inherited from :code:`ElementGroup` class.
+        """
+        dU = U[self.uidx[:,1]] - U[self.uidx[:,0]]
+
+        if self.kinematics == 'finite':
+            lvec = (self.X[:,1] + U[self.uidx[:,1]]) - (self.X[:,0] + U[self.uidx[:,0]])
+            ell  = np.linalg.norm(lvec, axis=1)
+            nvec = lvec / ell[:,np.newaxis]
+            eps  = np.log(ell / self.L0)
+        else:
+            ell  = self.L0
+            nvec = self.Nvec
+            eps  = np.einsum('ed,ed->e', nvec, dU) / ell
+
+        if self.kinematics == 'direct':
+            force = self.EA * eps
+            EA    = self.EA
+        else:
+            force, EA = self.updateMaterials(eps)
+
+        for element, f in zip(self.elements, force.tolist()):
+            element.force = f
+
+        # nodal forces
+        Pe = force[:,np.newaxis] * nvec
+        Fe = np.stack((-Pe, Pe), axis=1)
+
+        if force_only:
+            self.setForces(Fe)
+            return (Fe, None)
+
+        # tangent stiffness
+        if self.kinematics == 'direct':
+            Kt = self.K0
+        else:
+            n_outer_n = nvec[:,:,np.newaxis] * nvec[:,np.newaxis,:]
+            ke = (EA / ell)[:,np.newaxis,np.newaxis] * n_outer_n
+            if self.kinematics == 'finite':
+                ke = ke + (force / ell)[:,np.newaxis,np.newaxis] * (np.eye(nvec.shape[1]) - n_outer_n)
+            Kt = np.stack((np.stack((ke, -ke), axis=1), np.stack((-ke, ke), axis=1)), axis=1)
+
+        self.setForces(Fe, Kt)
+
+        return (Fe, Kt)
+
+    def updateMaterials(self, eps):
+        r"""
+        Set the axial strain of every element and collect axial forces and axial stiffness.
+
+        :param eps: axial strains :code:`(nelem,)`
+        :returns: tuple (axial forces, axial tangent stiffness), both :code:`(nelem,)`
+        """
+        nelem = len(self.elements)
+        force = np.empty(nelem)
+        EA    = np.empty(nelem)
+
+        for k, (element, strain, section) in enumerate(zip(self.elements, eps.tolist(), self.section)):
+            material = element.material
+            if section:
+                material.setStrain({'axial':strain})
+                force[k] = material.getStress()['axial']
+                EA[k]    = material.getStiffness()['ax-ax']
+            else:
+                material.setStrain({'xx':strain})
+                area     = material.getArea()
+                force[k] = material.getStress()['xx'] * area
+                EA[k]    = material.getStiffness() * area
+
+        return (force, EA)
+
+
+class SpringGroup(LineGroup):
+    r"""
+    Batched evaluation of linear springs (d.o.f. :code:`ux` only).
+    """
+
+    def __init__(self, elements, index):
+        super(SpringGroup, self).__init__(elements, index)
+
+        self.c  = np.array([ element.c for element in elements ], dtype=np.float64)
+        self.K0 = np.array([ element.Kt for element in elements ], dtype=np.float64)[:,:,:,np.newaxis,np.newaxis]
+
+    @classmethod
+    def accepts(cls, element):
+        r"""
+        inherited from :code:`ElementGroup` class.
+        """
+        return element.KINEMATICS == 'spring' and super(SpringGroup, cls).accepts(element)
+
+    def evaluate(self, U, force_only=False):
+        r"""
+        inherited from :code:`ElementGroup` class.
+        """
+        delta = U[self.uidx[:,1,0]] - U[self.uidx[:,0,0]]
+        force = self.c * delta
+
+        for element, d, f in zip(self.elements, delta.tolist(), force.tolist()):
+            element.delta  = d
+            element.force  = f
+            element.Forces = [-f, f]
+
+        Fe = np.stack((-force, force), axis=1)[:,:,np.newaxis]
+
+        if force_only:
+            return (Fe, None)
+        else:
+            return (Fe, self.K0)
+
+
+class FrameGroup(LineGroup):
+    r"""
+    Batched evaluation of 2D beam and frame elements.
+
+    The class attribute :code:`KINEMATICS` of the element selects the formulation:
+
+    * **'beam'**: beam along the X-axis using d.o.f.s :code:`uy` and :code:`rz`
+    * **'linear'**: frame using d.o.f.s :code:`ux`, :code:`uy`, and :code:`rz`; :math:`P-\Delta` effects
+      if the element was created with :code:`use_p_delta=True`
+    * **'p-delta'**: frame including :math:`P-\Delta` effects
+
+    :math:`P-\Delta` effects use the exact stability functions, evaluated for all compressive and all
+    tensile members at once.  Members with a (nearly) vanishing axial force use the linear stiffness.
+    """
+
+    def __init__(self, elements, index):
+        super(FrameGroup, self).__init__(elements, index)
+
+        nelem = len(elements)
+        self.beam = (self.kinematics == 'beam')
+
+        if self.beam:
+            self.L    = self.X[:,1,0] - self.X[:,0,0]
+            self.Nvec = np.zeros((nelem, 1))
+            self.Svec = np.ones((nelem, 1))
+        else:
+            Nvec = self.X[:,1] - self.X[:,0]
+            self.L    = np.linalg.norm(Nvec, axis=1)
+            self.Nvec = Nvec / self.L[:,np.newaxis]
+            self.Svec = np.stack((-self.Nvec[:,1], self.Nvec[:,0]), axis=1)
+
+        # powers of the element length are evaluated element by element to match the scalar element code
+        self.L2 = np.array([ L**2 for L in self.L.tolist() ])
+        self.L3 = np.array([ L**3 for L in self.L.tolist() ])
+
+        self.p_delta = np.array([ self.kinematics == 'p-delta' or
+                                  (self.kinematics == 'linear' and element.use_p_delta)
+                                  for element in elements ], dtype=bool)
+
+    @classmethod
+    def accepts(cls, element):
+        r"""
+        inherited from :code:`ElementGroup` class.
+        """
+        return (element.KINEMATICS in ('beam', 'linear', 'p-delta')
+                and super(FrameGroup, cls).accepts(element))
+
+    def evaluate(self, U, force_only=False):
+        r"""
+        inherited from :code:`ElementGroup` class.
+        """
+        nelem = len(self.elements)
+        L    = self.L
+        Nvec = self.Nvec
+        Svec = self.Svec
+        ndim = Nvec.shape[1]
+
+        theta = U[self.uidx[:,:,-1]]
+
+        if self.beam:
+            v      = U[self.uidx[:,:,0]]
+            strain = np.zeros(nelem)
+        else:
+            Ux     = U[self.uidx[:,:,:2]]
+            strain = np.einsum('ed,ed->e', Nvec, Ux[:,1] - Ux[:,0]) / L
+            v      = np.einsum('end,ed->en', Ux, Svec)
+
+        force, moment, EA, EI = self.updateMaterials(strain)
+
+        kfu, kft, kmu, kmt, kmth = self.stiffnessCoefficients(force, EI)
+
+        vi = v[:,0]
+        vj = v[:,1]
+        thetai = theta[:,0]
+        thetaj = theta[:,1]
+
+        Vi =  kfu * (vi - vj) + kft * (thetaj + thetai)
+        Vj = -kfu * (vi - vj) - kft * (thetaj + thetai)
+
+        Mi = kmu * (vi - vj) + kmt * thetai + kmth * thetaj
+        Mj = kmu * (vi - vj) + kmth * thetai + kmt * thetaj
+
+        # nodal forces
+        Fe = np.empty((nelem, 2, ndim + 1))
+        Fe[:,0,:ndim] = Vi[:,np.newaxis] * Svec - force[:,np.newaxis] * Nvec
+        Fe[:,1,:ndim] = Vj[:,np.newaxis] * Svec + force[:,np.newaxis] * Nvec
+        Fe[:,0,ndim]  = Mi
+        Fe[:,1,ndim]  = Mj
+
+        for element, f, m, vi_, vj_, mi_, mj_, F in zip(self.elements, force.tolist(), moment.tolist(),
+                                                        Vi.tolist(), Vj.tolist(), Mi.tolist(), Mj.tolist(), Fe):
+            element.force  = f
+            element.moment = m
+            element.Fi = F[0]
+            element.Fj = F[1]
+            element.internal_forces = {'fi':f, 'Vi': vi_, 'Mi':-mi_,
+                                       'fj':f, 'Vj':-vj_, 'Mj': mj_,
+                                       'Pw':element.internal_forces.get('Pw', 0.0),
+                                       'Mw':element.internal_forces.get('Mw', 0.0)}
+
+        if force_only:
+            self.setForces(Fe)
+            return (Fe, None)
+
+        # tangent stiffness
+        s_tensor_s = Svec[:,:,np.newaxis] * Svec[:,np.newaxis,:]
+
+        Kt = np.empty((nelem, 2, 2, ndim + 1, ndim + 1))
+        for I, J, sgn_u, sgn_t, sgn_m, kt in ((0, 0,  1.,  1.,  1., kmt ),
+                                              (0, 1, -1.,  1., -1., kmth),
+                                              (1, 0, -1., -1.,  1., kmth),
+                                              (1, 1,  1., -1., -1., kmt )):
+            Kt[:,I,J,:ndim,:ndim] = (sgn_u * kfu)[:,np.newaxis,np.newaxis] * s_tensor_s
+            Kt[:,I,J,:ndim,ndim]  = (sgn_t * kft)[:,np.newaxis] * Svec
+            Kt[:,I,J,ndim,:ndim]  = (sgn_m * kmu)[:,np.newaxis] * Svec
+            Kt[:,I,J,ndim,ndim]   = kt
+
+        if not self.beam:
+            # axial portion
+            ke = (EA / L)[:,np.newaxis,np.newaxis] * (Nvec[:,:,np.newaxis] * Nvec[:,np.newaxis,:])
+            Kt[:,0,0,:ndim,:ndim] += ke
+            Kt[:,0,1,:ndim,:ndim] -= ke
+            Kt[:,1,0,:ndim,:ndim] -= ke
+            Kt[:,1,1,:ndim,:ndim] += ke
+
+        self.setForces(Fe, Kt)
+
+        return (Fe, Kt)
+
+    def updateMaterials(self, strain):
+        r"""
+        Set the axial strain (and zero curvature) of every element and collect forces and section stiffness.
+
+        :param strain: axial strains :code:`(nelem,)`
+        :returns: tuple (axial forces, moments, axial stiffness, flexural stiffness), all :code:`(nelem,)`
+        """
+        nelem  = len(self.elements)
+        force  = np.empty(nelem)
+        moment = np.empty(nelem)
+        EA     = np.empty(nelem)
+        EI     = np.empty(nelem)
+
+        for k, (element, eps) in enumerate(zip(self.elements, strain.tolist())):
+            material = element.material
+            material.setStrain({'axial':eps, 'flexure':0.0})
+
+            stress = material.getStress()
+            force[k]  = stress.get('axial', 0.0)
+            moment[k] = stress.get('flexure', 0.0)
+
+            Et = material.getStiffness()
+            EA[k] = Et.get('ax-ax', 0.0)
+            EI[k] = Et.get('flx-flx', 0.0)
+            if Et.get('ax-flx', 0.0) or Et.get('flx-ax', 0.0):
+                print('coupling of axial and flexural behavior is ignored by this element')
+
+        return (force, moment, EA, EI)
+
+    def stiffnessCoefficients(self, force, EI):
+        r"""
+        Flexural stiffness coefficients of all elements.
+
+        Members with :math:`P-\Delta` effects under compression or tension use the exact stability functions.
+        All other members use the linear stiffness.
+
+        :param force: axial forces :code:`(nelem,)`
+        :param EI: flexural stiffness :code:`(nelem,)`
+        :returns: tuple (kfu, kft, kmu, kmt, kmth), all :code:`(nelem,)`
+        """
+        L = self.L
+
+        kfu  = 12. * EI / self.L3
+        kft  =  6. * EI / self.L2
+        kmu  = kft.copy()
+        kmt  =  4. * EI / L
+        kmth = kmt / 2.
+
+        tol = EI / self.L2 / 1000000
+        compression = np.flatnonzero(self.p_delta & (force < -tol))
+        tension     = np.flatnonzero(self.p_delta & (force >  tol))
+
+        if compression.size:
+            # exact solution for compressive members
+            c   = compression
+            Lc  = L[c]
+            EIc = EI[c]
+
+            kappa  = np.sqrt(-force[c] / EIc) * Lc
+            kappa2 = kappa / 2
+
+            cot  = 1./np.tan(kappa)
+            csc  = 1./np.sin(kappa)
+            cot2 = 1./np.tan(kappa2)
+            sec2 = 1./np.cos(kappa2)
+
+            EIfact = EIc / (Lc*Lc*Lc * (2. - kappa*cot2))
+            kfu[c] = EIfact * kappa**3 * cot2
+            kft[c] = EIfact * kappa**2 * Lc
+            kmu[c] = kft[c]
+
+            EIfact  = EIc * kappa * csc / (Lc*( kappa*csc - sec2**2))
+            kmt[c]  = EIfact * (kappa*cot - 1.)
+            kmth[c] = EIfact * (1. - kappa*csc)
+
+        if tension.size:
+            # exact solution for tensile members
+            t   = tension
+            Lt  = L[t]
+            EIt = EI[t]
+
+            kappa = np.sqrt(force[t] / EIt) * Lt
+
+            coshk = np.cosh(kappa)
+            sinhk = np.sinh(kappa)
+
+            EIfact = EIt / (Lt*Lt*Lt*(2. - 2.*coshk + kappa*sinhk))
+
+            kfu[t]  = EIfact * kappa**3 * sinhk
+            kft[t]  = EIfact * kappa**2 * Lt * (coshk - 1.)
+            kmu[t]  = kft[t]
+            kmt[t]  = EIfact * kappa * Lt*Lt * (kappa*coshk - sinhk)
+            kmth[t] = EIfact * kappa * Lt*Lt * (sinhk - kappa)
+
+        return (kfu, kft, kmu, kmt, kmth)
@@ -37,4 +37,12 @@ class LinearElement(Element):
         self.updateState()
         return self.Forces
 
+    def hasConstantStiffness(self):
+        r"""
+        inherited from :code:`Element` class.
+
+        A linear element computes its stiffness once, at construction.
+        """
+        return True
+
 
@@ -27,6 +27,9 @@ class Truss(Element):
 
     """
 
+    GROUP      = TrussGroup
+    KINEMATICS = 'direct'
+
     def __init__(self, nodei, nodej, material, label=None):
         super().__init__((nodei, nodej), material, label=label)
         self.element_type = DrawElement.LINE
@@ -120,6 +123,12 @@ class Truss(Element):
         else:
             return (np.empty([0]),np.empty([0]))
 
+    def hasConstantStiffness(self):
+        r"""
+        inherited from :code:`Element` class.
+        """
+        return self.material.isLinear()
+
     def updateState(self):
         """
         Stress/force recovery
@@ -32,6 +32,9 @@ class Frame2D(Element):
 
     """
 
+    GROUP      = FrameGroup
+    KINEMATICS = 'p-delta'
+
     def __init__(self, nodei, nodej, material, label=None):
         """
         :param nodei: (pointer to) start Node object
@@ -332,6 +335,44 @@ class Frame2D(Element):
                                 'fj':self.force, 'Vj':-Vj, 'Mj': Mj,
                                 'Pw':Pw, 'Mw':Mw}
 
+    def getGeometricStiffness(self):
+        r"""
+        inherited from :code:`Element` class.
+
+        Linearization of the :math:`P-\Delta` stiffness with respect to the axial force, :math:`f`,
+        using the consistent (cubic) interpolation of the transverse displacement:
+
+        .. math::
+
+           k_{fu} = \frac{6}{5}\frac{f}{L}, \quad k_{ft} = k_{mu} = \frac{f}{10}, \quad
+           k_{mt} = \frac{2}{15}\:f L, \quad k_{m\theta} = -\frac{1}{30}\:f L
+        """
+        self.updateState()
+
+        Xi = self.getPos(0)
+        Xj = self.getPos(1)
+
+        Nvec = Xj - Xi
+        L = np.linalg.norm(Nvec)
+        Nvec /= L
+        Svec = np.array([[0,-1],[1,0]]) @ Nvec
+
+        f = self.force
+
+        kfu  = 6. / 5. * f / L
+        kft  = f / 10.
+        kmu  = kft
+        kmt  = 2. / 15. * f * L
+        kmth = -f * L / 30.
+
+        s_tensor_s = np.outer(Svec, Svec)
+        KgII = np.block( [[ kfu * s_tensor_s,  kft * Svec[:,np.newaxis]], [ kmu * Svec, kmt ]] )
+        KgIJ = np.block( [[-kfu * s_tensor_s,  kft * Svec[:,np.newaxis]], [-kmu * Svec, kmth]] )
+        KgJI = np.block( [[-kfu * s_tensor_s, -kft * Svec[:,np.newaxis]], [ kmu * Svec, kmth]] )
+        KgJJ = np.block( [[ kfu * s_tensor_s, -kft * Svec[:,np.newaxis]], [-kmu * Svec, kmt ]] )
+
+        return self._localStiffness([[KgII, KgIJ],[KgJI, KgJJ]])
+
     def computeSurfaceLoads(self):
 
         Xi = self.getPos(0)
@@ -29,6 +29,9 @@ class Quad(Element):
     * For 3D membrane behavior, define nodes as three-dimensional nodes
     """
 
+    GROUP      = ContinuumGroup
+    KINEMATICS = 'finite'
+
     def __init__(self, node0, node1, node2, node3, material, label=None):
         super(Quad, self).__init__((node0, node1, node2, node3), material, label=label)
         self.element_type = DrawElement.QUAD
@@ -139,6 +142,20 @@ class Quad(Element):
     def resetLoads(self):
         super(Quad, self).resetLoads()
 
+    def getGaussPointData(self):
+        r"""
+        inherited from :code:`Element` class.
+        """
+        wJ = np.array(self.wis) * np.array(self.J)
+        return (np.array(self.Grad), wJ, self.material)
+
+    def setGaussPointState(self, strains, stresses, P):
+        r"""
+        inherited from :code:`Element` class.
+        """
+        self.strain = list(strains)
+        self.stress = [ {'xx':Pg[0,0], 'xy':Pg[0,1], 'yx':Pg[1,0], 'yy':Pg[1,1]} for Pg in P ]
+
     def updateState(self):
 
         # initialization step
@@ -220,6 +237,27 @@ class Quad(Element):
 
         self.Kt = Kt
 
+    def getGeometricStiffness(self):
+        r"""
+        inherited from :code:`Element` class.
+
+        Initial stress stiffness from the 2nd Piola-Kirchhoff stress, :math:`{\bf S}`, at each integration point:
+        :math:`{\bf K}_{g,IJ} = \sum_{gp} \left( \nabla N_I \cdot {\bf S} \cdot \nabla N_J \right) J\,w_{gp}\: {\bf 1}`
+        """
+        self.updateState()
+
+        G = np.zeros((len(self.nodes), len(self.nodes)))
+
+        for Grad, J, wi, material in zip(self.Grad, self.J, self.wis, self.material):
+            stress = material.getStress()
+            S = np.array( [[stress['xx'],stress['xy']],[stress['xy'],stress['yy']]] )
+            G += Grad.T @ S @ Grad * (wi * J)
+
+        One = np.eye(self.ndof)
+        Kg = [ [ GIJ * One for GIJ in GI ] for GI in G ]
+
+        return self._localStiffness(Kg)
+
     def computeSurfaceLoads(self):
         r"""
         compute surface loads using faces
@@ -30,6 +30,9 @@ class Quad8(Element):
     * For 3D membrane behavior, define nodes as three-dimensional nodes
     """
 
+    GROUP      = ContinuumGroup
+    KINEMATICS = 'finite'
+
     def __init__(self, node0, node1, node2, node3, node4, node5, node6, node7, material, label=None):
         super(Quad8, self).__init__((node0, node1, node2, node3, node4, node5, node6, node7), material, label=label)
         self.element_type = DrawElement.QUAD
@@ -132,6 +135,21 @@ class Quad8(Element):
     def resetLoads(self):
         super(Quad8, self).resetLoads()
 
+    def getGaussPointData(self):
+        r"""
+        inherited from :code:`Element` class.
+        """
+        integrator = QuadIntegration(order=3)
+        xis, wis = integrator.parameters()
+        wJ = np.array(wis) * np.array(self.J)
+        return (np.array(self.Grad), wJ, self.material)
+
+    def setGaussPointState(self, strains, stresses, P):
+        r"""
+        inherited from :code:`Element` class.
+        """
+        self.stress = [ {'xx':Pg[0,0], 'xy':Pg[0,1], 'yx':Pg[1,0], 'yy':Pg[1,1]} for Pg in P ]
+
     def updateState(self):
 
         # initialization step
@@ -32,6 +32,9 @@ class Quad9(Element):
     * For 3D membrane behavior, define nodes as three-dimensional nodes
     """
 
+    GROUP      = ContinuumGroup
+    KINEMATICS = 'finite'
+
     def __init__(self, node0, node1, node2, node3, node4, node5, node6, node7, node8, material, label=None):
         super(Quad9, self).__init__((node0, node1, node2, node3, node4, node5, node6, node7, node8), material, label=label)
         self.element_type = DrawElement.QUAD
@@ -186,6 +189,28 @@ class Quad9(Element):
     def resetLoads(self):
         super(Quad9, self).resetLoads()
 
+    def getGaussPointData(self):
+        r"""
+        inherited from :code:`Element` class.
+        """
+        Grad = [ gpData.Grad for gpData in self.gpData ]
+        wJ   = [ wi * gpData.J for wi, gpData in zip(self.wis, self.gpData) ]
+        return (np.array(Grad), np.array(wJ), [ gpData.material for gpData in self.gpData ])
+
+    def getMaterials(self):
+        r"""
+        inherited from :code:`Element` class.
+        """
+        return [ gpData.material for gpData in self.gpData ]
+
+    def setGaussPointState(self, strains, stresses, P):
+        r"""
+        inherited from :code:`Element` class.
+        """
+        for gpData, strain, Pg in zip(self.gpData, strains, P):
+            gpData.state['strain'] = strain
+            gpData.state['stress'] = {'xx':Pg[0,0], 'xy':Pg[0,1], 'yx':Pg[1,0], 'yy':Pg[1,1]}
+
     def updateState(self):
 
         # initialization step
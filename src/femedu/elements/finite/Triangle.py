@@ -7,6 +7,9 @@ class Triangle(Element):
     class: representing a single truss element
     """
 
+    GROUP      = ContinuumGroup
+    KINEMATICS = 'finite'
+
     def __init__(self, node0, node1, node2, material, label=None):
         super().__init__((node0, node1, node2), material, label=label)
         self.element_type = DrawElement.TRIANGLE
@@ -77,6 +80,24 @@ class Triangle(Element):
     def resetLoads(self):
         super(Triangle, self).resetLoads()
 
+    def getGaussPointData(self):
+        r"""
+        inherited from :code:`Element` class.
+        """
+        Gs = self.gcont[0]
+        Gt = self.gcont[1]
+        Gu = -Gs - Gt
+        Grad = np.vstack((Gu, Gs, Gt)).T
+        return (np.array([Grad]), np.array([self.area]), [self.material])
+
+    def setGaussPointState(self, strains, stresses, P):
+        r"""
+        inherited from :code:`Element` class.
+        """
+        self.strain = strains[0]
+        Pg = P[0]
+        self.stress = {'xx':Pg[0,0], 'xy':Pg[0,1], 'yx':Pg[1,0], 'yy':Pg[1,1]}
+
     def updateState(self):
 
         node0 = self.nodes[0]
@@ -10,6 +10,9 @@ class Triangle6(Element):
     class: representing a 6-noded plane triangle
     """
 
+    GROUP      = ContinuumGroup
+    KINEMATICS = 'finite'
+
     def __init__(self, node0, node1, node2, node3, node4, node5, material, label=None):
         super().__init__((node0, node1, node2, node3, node4, node5), material, label=label)
 
@@ -131,6 +134,33 @@ class Triangle6(Element):
     def resetLoads(self):
         super(Triangle6, self).resetLoads()
 
+    def getGaussPointData(self):
+        r"""
+        inherited from :code:`Element` class.
+        """
+        Grad = []
+        wJ   = []
+        for xi, wi, gpData in zip(self.xis, self.wis, self.gpData):
+            dshape1 = self.interpolation.shape(order=2, s=xi[0], t=xi[1], n=(1, 0))
+            dshape2 = self.interpolation.shape(order=2, s=xi[0], t=xi[1], n=(0, 1))
+            Grad.append( gpData.dual_base.T @ np.vstack((dshape1, dshape2)) )
+            wJ.append( gpData.J * wi )
+        return (np.array(Grad), np.array(wJ), [ gpData.material for gpData in self.gpData ])
+
+    def getMaterials(self):
+        r"""
+        inherited from :code:`Element` class.
+        """
+        return [ gpData.material for gpData in self.gpData ]
+
+    def setGaussPointState(self, strains, stresses, P):
+        r"""
+        inherited from :code:`Element` class.
+        """
+        for gpData, strain, Pg in zip(self.gpData, strains, P):
+            gpData.state['strain'] = strain
+            gpData.state['stress'] = {'xx':Pg[0,0], 'xy':Pg[0,1], 'yx':Pg[1,0], 'yy':Pg[1,1]}
+
     def updateState(self):
 
         # initializes internal force and tangent stiffness to zero arrays of the appropriate size.
@@ -28,6 +28,9 @@ class Truss(Element):
 
     """
 
+    GROUP      = TrussGroup
+    KINEMATICS = 'finite'
+
     def __init__(self, nodei, nodej, material, label=None):
         super().__init__((nodei, nodej), material, label=label)
         self.element_type = DrawElement.LINE
@@ -138,3 +141,15 @@ class Truss(Element):
         n_outer_n = np.outer(nvec, nvec)
         ke = (Et * area / ell) * n_outer_n + self.force / ell * (np.eye(len(nvec)) - n_outer_n)
         self.Kt = [[ke, -ke], [-ke, ke]]
+
+    def getGeometricStiffness(self):
+        r"""
+        inherited from :code:`Element` class.
+
+        The axial force acts on the undeformed geometry: :math:`{\bf k}_g = \frac{f}{L_0}\left({\bf 1} - {\bf N}\otimes{\bf N}\right)`.
+        """
+        self.updateState()
+
+        kg = self.force / self.L0 * (np.eye(len(self.Nvec)) - np.outer(self.Nvec, self.Nvec))
+
+        return self._localStiffness([[kg, -kg], [-kg, kg]])
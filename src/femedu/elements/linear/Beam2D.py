@@ -32,6 +32,9 @@ class Beam2D(Element):
 
     """
 
+    GROUP      = FrameGroup
+    KINEMATICS = 'beam'
+
     def __init__(self, nodei, nodej, material, label=None):
         """
         :param nodei: (pointer to) start Node object
@@ -142,6 +145,12 @@ class Beam2D(Element):
 
         return (s,val)
 
+    def hasConstantStiffness(self):
+        r"""
+        inherited from :code:`Element` class.
+        """
+        return self.material.isLinear()
+
     def updateState(self):
         """
         Compute internal state, nodal forces, and tangent stiffness for the current state of deformation.
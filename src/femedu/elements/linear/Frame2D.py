@@ -32,6 +32,9 @@ class Frame2D(Element):
 
     """
 
+    GROUP      = FrameGroup
+    KINEMATICS = 'linear'
+
     def __init__(self, nodei, nodej, material, label=None, use_p_delta=False):
         """
         :param nodei: (pointer to) start Node object
@@ -146,6 +149,14 @@ class Frame2D(Element):
 
         return (s,val)
 
+    def hasConstantStiffness(self):
+        r"""
+        inherited from :code:`Element` class.
+
+        :math:`P-\Delta` effects render the stiffness dependent on the axial force.
+        """
+        return not self.use_p_delta and self.material.isLinear()
+
     def updateState(self):
 
         Xi = self.getPos(0)
@@ -137,6 +137,12 @@ class HRQuad(Element):
     def resetLoads(self):
         super(HRQuad, self).resetLoads()
 
+    def hasConstantStiffness(self):
+        r"""
+        inherited from :code:`Element` class.
+        """
+        return all( material.isLinear() for material in self.material )
+
     def updateState(self):
 
         # initialization step
@@ -29,6 +29,9 @@ class Quad(Element):
     * For 3D membrane behavior, define nodes as three-dimensional nodes
     """
 
+    GROUP      = ContinuumGroup
+    KINEMATICS = 'linear'
+
     def __init__(self, node0, node1, node2, node3, material, label=None):
         super(Quad, self).__init__((node0, node1, node2, node3), material, label=label)
         self.element_type = DrawElement.QUAD
@@ -139,6 +142,26 @@ class Quad(Element):
     def resetLoads(self):
         super(Quad, self).resetLoads()
 
+    def getGaussPointData(self):
+        r"""
+        inherited from :code:`Element` class.
+        """
+        wJ = np.array(self.wis) * np.array(self.J)
+        return (np.array(self.Grad), wJ, self.material)
+
+    def setGaussPointState(self, strains, stresses, P):
+        r"""
+        inherited from :code:`Element` class.
+        """
+        self.strain = list(strains)
+        self.stress = [ {'xx':Pg[0,0], 'xy':Pg[0,1], 'yx':Pg[1,0], 'yy':Pg[1,1]} for Pg in P ]
+
+    def hasConstantStiffness(self):
+        r"""
+        inherited from :code:`Element` class.
+        """
+        return all( material.isLinear() for material in self.material )
+
     def updateState(self):
 
         # initialization step
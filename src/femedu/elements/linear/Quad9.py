@@ -32,6 +32,9 @@ class Quad9(Element):
     * For 3D membrane behavior, define nodes as three-dimensional nodes
     """
 
+    GROUP      = ContinuumGroup
+    KINEMATICS = 'linear'
+
     def __init__(self, node0, node1, node2, node3, node4, node5, node6, node7, node8, material, label=None):
         super(Quad9, self).__init__((node0, node1, node2, node3, node4, node5, node6, node7, node8), material, label=label)
         self.element_type = DrawElement.QUAD
@@ -142,6 +145,34 @@ class Quad9(Element):
     def resetLoads(self):
         super(Quad9, self).resetLoads()
 
+    def getGaussPointData(self):
+        r"""
+        inherited from :code:`Element` class.
+        """
+        Grad = [ gpData.Grad for gpData in self.gpData ]
+        wJ   = [ wi * gpData.J for wi, gpData in zip(self.wis, self.gpData) ]
+        return (np.array(Grad), np.array(wJ), [ gpData.material for gpData in self.gpData ])
+
+    def getMaterials(self):
+        r"""
+        inherited from :code:`Element` class.
+        """
+        return [ gpData.material for gpData in self.gpData ]
+
+    def setGaussPointState(self, strains, stresses, P):
+        r"""
+        inherited from :code:`Element` class.
+        """
+        for gpData, strain, stress in zip(self.gpData, strains, stresses):
+            gpData.state['strain'] = strain
+            gpData.state['stress'] = stress
+
+    def hasConstantStiffness(self):
+        r"""
+        inherited from :code:`Element` class.
+        """
+        return all( gpData.material.isLinear() for gpData in self.gpData )
+
     def updateState(self):
 
         # initialization step
@@ -160,6 +160,12 @@ class ReducedIntegrationQuad(Element):
     def resetLoads(self):
         super(ReducedIntegrationQuad, self).resetLoads()
 
+    def hasConstantStiffness(self):
+        r"""
+        inherited from :code:`Element` class.
+        """
+        return all( material.isLinear() for material in self.material )
+
     def updateState(self):
 
         # initialization step
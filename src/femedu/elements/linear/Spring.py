@@ -24,6 +24,7 @@ where :math:`c` is the spring stiffness in force per length change.
 """
 import numpy as np
 from ..Element import Element
+from ..ElementGroup import SpringGroup
 from ...materials import Material
 
 class Spring(Element):
@@ -33,6 +34,9 @@ class Spring(Element):
     This element only uses the x-coordinate and the displacement in x-direction ('ux').
     """
 
+    GROUP      = SpringGroup
+    KINEMATICS = 'spring'
+
     def __init__(self, ndi, ndj, c=1, label=None):
         """
         :param ndi:  node object
@@ -67,6 +71,12 @@ class Spring(Element):
         s = "Spring({}, {}, c={})".format(self.getID(), self.nodes[0].getID(), self.nodes[1].getID(), self.c)
         return s
 
+    def hasConstantStiffness(self):
+        r"""
+        inherited from :code:`Element` class.
+        """
+        return True
+
     def updateState(self):
         """
         called to compute internal force and current nodal reactions for equilibrium test
@@ -131,6 +131,12 @@ class Triangle6(Element):
     def resetLoads(self):
         super(Triangle6, self).resetLoads()
 
+    def getMaterials(self):
+        r"""
+        inherited from :code:`Element` class.
+        """
+        return [ gpData.material for gpData in self.gpData ]
+
     def updateState(self):
 
         # initializes internal force and tangent stiffness to zero arrays of the appropriate size.
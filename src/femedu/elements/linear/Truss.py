@@ -1,6 +1,7 @@
 import numpy as np
 
 from ..Element import Element
+from ..ElementGroup import TrussGroup
 from ...materials.Material import *
 from ...domain.Node import *
 
@@ -28,6 +29,9 @@ class Truss(Element):
 
     """
 
+    GROUP      = TrussGroup
+    KINEMATICS = 'linear'
+
     def __init__(self, nodei, nodej, material, label=None):
         super().__init__((nodei, nodej), material, label=label)
         self.element_type = Element.LINE
@@ -103,6 +107,12 @@ class Truss(Element):
         else:
             return (np.empty([0]),np.empty([0]))
 
+    def hasConstantStiffness(self):
+        r"""
+        inherited from :code:`Element` class.
+        """
+        return self.material.isLinear()
+
     def updateState(self):
         """
         Compute internal state, nodal forces, and tangent stiffness for the current state of deformation.
@@ -28,6 +28,14 @@ class FiberMaterial(Material):
         self.plastic_strain = 0.0
         self.setStrain({'xx':0.0})
 
+    def isLinear(self):
+        r"""
+        inherited from :code:`Material` class.
+
+        The response remains elastic if no yield stress is given (:code:`fy` >= 1.0e30).
+        """
+        return self.parameters['fy'] >= 1.0e30
+
     def getArea(self):
         return self.parameters['A']
 
@@ -29,6 +29,8 @@ class Material():
     HARDENING   = 0x080000
     DIFFUSION   = 0x100000
 
+    STORE = None    # MaterialStore class for materials keeping their state in contiguous arrays
+
 
     def __init__(self, params={'E':1.0, 'A':1.0, 'nu':0.0, 'fy':1.0e30}):
         """
@@ -52,6 +54,9 @@ class Material():
         self.sig = 0.0
         self.Et  = self.parameters['E']
 
+        self._store = None      # MaterialStore holding the state, if this material supports one
+        self._row   = None      # row within that store
+
     def __str__(self):
         s = "{}(Material)({})".format(self.__class__.__name__, self.parameters)
         return s
@@ -65,6 +70,36 @@ class Material():
     def isMaterialType(self, type):
         return ( self._type == type )
 
+    def bind(self, store, row):
+        r"""
+        Use row **row** of **store** to hold the state of this material.
+        Only materials defining :code:`STORE` keep their state in a store (see :py:class:`MaterialStore`).
+
+        :param store: a :py:class:`MaterialStore` object of type :code:`STORE`
+        :param row: row within that store
+        """
+        self._store = store
+        self._row   = row
+        store.materials[row] = self
+
+    def getStoreRow(self):
+        r"""
+        :returns: tuple (:py:class:`MaterialStore` holding the state of this material, row within that store),
+                  or (**None**, **None**) for materials keeping their state themselves
+        """
+        return (self._store, self._row)
+
+    def isLinear(self):
+        r"""
+        A linear material never changes its tangent stiffness.  Elements use this information
+        to decide whether their stiffness matrix may be cached (see :py:meth:`Element.hasConstantStiffness`).
+
+        Materials shall overload this method only if their response is linear for the current parameters.
+
+        :returns: **True** if the stress is a linear function of the strain
+        """
+        return False
+
     def getStress(self):
         r"""
         request axial stress
@@ -0,0 +1,237 @@
+import numpy as np
+
+
+class MaterialStore():
+    r"""
+    abstract class: representing the state of many material points of one material class and parameter set,
+    held in contiguous arrays with one row per material point.
+
+    Material classes supporting such storage name their store class in the class attribute :code:`STORE`.
+    Every such material object is a handle to a single row of a store.  A material object created on its own
+    uses a private store with a single row.  Solvers bind all materials of a model to shared stores
+    (see :py:meth:`bindMaterials`), such that element groups can update all material points in a single,
+    vectorized call of :py:meth:`setStrain`.
+
+    Every store holds a **trial** and a **committed** state for all history variables listed in :code:`STATE`.
+    :py:meth:`setStrain` computes the trial state from the committed state, :py:meth:`converged` commits the
+    trial state, and :py:meth:`revert` discards it.
+
+    :param parameters: material parameters (dict)
+    :param size: number of material points
+    """
+
+    BINDINGS  = 0   # incremented by every call to bindMaterials(); used to detect outdated row maps
+
+    VARIABLES = {}  # shape of all current state variables: { name: shape per material point }
+    STATE     = {}  # shape of all history variables: { name: shape per material point }
+
+    def __init__(self, parameters, size):
+        self.parameters = dict(parameters)
+        self.size       = size
+        self.materials  = [ None for k in range(size) ]    # material object bound to every row
+
+        for name, shape in self.VARIABLES.items():
+            setattr(self, name, np.zeros((size,) + shape))
+
+        self.trial     = { name: np.zeros((size,) + shape) for name, shape in self.STATE.items() }
+        self.committed = { name: np.zeros((size,) + shape) for name, shape in self.STATE.items() }
+
+    def __len__(self):
+        return self.size
+
+    def __str__(self):
+        return "{}({} material points, {})".format(self.__class__.__name__, self.size, self.parameters)
+
+    @staticmethod
+    def bindMaterials(materials):
+        r"""
+        Bind material objects to shared stores, one store per material class and parameter set.
+
+        The current state of every material is copied into its new store.  Materials without :code:`STORE`
+        are ignored.  Material objects listed more than once are bound only once.
+
+        :param materials: list of material objects
+        :returns: list of :py:class:`MaterialStore` objects
+        """
+        MaterialStore.BINDINGS += 1
+
+        members = {}
+        seen    = set()
+
+        for material in materials:
+            store = material.__class__.__dict__.get('STORE', None)
+            if store is None or id(material) in seen:
+                continue
+            seen.add(id(material))
+
+            key = (store, tuple(sorted(material.parameters.items())))
+            members.setdefault(key, []).append(material)
+
+        stores = []
+        for (store_type, _), group in members.items():
+            store = store_type(group[0].parameters, len(group))
+
+            for row, material in enumerate(group):
+                store.copyRow(material._store, material._row, row)
+                material.bind(store, row)
+
+            stores.append(store)
+
+        return stores
+
+    def isValid(self):
+        r"""
+        :returns: **True** if all bound materials still use this store and its parameters
+        """
+        return all( material._store is self and material.parameters == self.parameters
+                    for material in self.materials )
+
+    def copyRow(self, source, source_row, row):
+        r"""
+        Copy the state of one material point.
+
+        :param source: the :py:class:`MaterialStore` holding the state
+        :param source_row: row of the material point in **source**
+        :param row: row of the material point in this store
+        """
+        for name in self.VARIABLES:
+            getattr(self, name)[row] = getattr(source, name)[source_row]
+
+        for name in self.STATE:
+            self.trial[name][row]     = source.trial[name][source_row]
+            self.committed[name][row] = source.committed[name][source_row]
+
+    def extract(self, row):
+        r"""
+        :returns: a private store holding a copy of the state of material point **row**
+        """
+        store = self.__class__(self.parameters, 1)
+        store.copyRow(self, row, 0)
+        return store
+
+    def setStrain(self, rows, eps):
+        r"""
+        Update the trial state of the given material points for the given strains.
+
+        :param rows: rows of all material points to be updated (int array or slice)
+        :param eps: strain vectors, one row per material point
+        :returns: tuple (stress vectors, material tangents), one row per material point
+        """
+        raise NotImplementedError(self.__class__.__name__ + '.setStrain() needs to be overloaded')
+
+    def converged(self, rows=None):
+        r"""
+        Commit the trial state.
+
+        :param rows: rows of the material points to be committed.  Default: all
+        """
+        if rows is None:
+            rows = slice(None)
+        for name in self.STATE:
+            self.committed[name][rows] = self.trial[name][rows]
+
+    def revert(self, rows=None):
+        r"""
+        Discard the trial state and return to the last committed state.
+
+        :param rows: rows of the material points to be reverted.  Default: all
+        """
+        if rows is None:
+            rows = slice(None)
+        for name in self.STATE:
+            self.trial[name][rows] = self.committed[name][rows]
+
+
+class PlaneStressStore(MaterialStore):
+    r"""
+    Material point store for :py:class:`PlaneStress` materials.
+
+    .. list-table:: data layout (one row per material point)
+        :header-rows: 1
+
+        * - array
+          - content
+        * - **strain**
+          - total strain :code:`(n, 3)` as :math:`(\varepsilon_{xx}, \varepsilon_{yy}, \gamma_{xy})`
+        * - **zz**
+          - thickness strain :code:`(n,)`
+        * - **stress**
+          - stress resultants :code:`(n, 3)` as :math:`(\sigma_{xx}, \sigma_{yy}, \sigma_{xy})\:t`
+        * - **tangent**
+          - material tangent :code:`(n, 3, 3)`, including the thickness
+        * - **plastic_strain**
+          - plastic strain :code:`(n, 3)`, trial and committed
+
+    The elastic stiffness, its inverse, and the yield function matrix are computed once per store.
+    """
+
+    VARIABLES = {'strain':(3,), 'zz':(), 'stress':(3,), 'tangent':(3,3)}
+    STATE     = {'plastic_strain':(3,)}
+
+    def __init__(self, parameters, size):
+        super(PlaneStressStore, self).__init__(parameters, size)
+
+        E  = self.parameters['E']
+        t  = self.parameters['t']
+        nu = self.parameters['nu']
+        fy = self.parameters['fy']
+
+        self.Ce   = E*t/(1. - nu*nu) * np.array([[1.,nu,0.],[nu,1.,0.],[0.,0.,(1.-nu)/2.]])
+        self.Cinv = 1/(E*t) * np.array([[1.,-nu,0.],[-nu,1.,0.],[0.,0.,2.*(1.+nu)]])
+        self.Phi  = np.array([[2.,-1.,0.],[-1.,2.,0.],[0.,0.,6.]])
+        self.fy2  = (t*fy)**2
+
+        self.tangent[:] = self.Ce
+
+    def setStrain(self, rows, eps):
+        r"""
+        inherited from :code:`MaterialStore` class.
+
+        Elastic predictor for all points, followed by a plastic corrector for all points violating the yield condition.
+        """
+        E  = self.parameters['E']
+        nu = self.parameters['nu']
+
+        eps = np.asarray(eps, dtype=np.float64)
+        ep  = self.committed['plastic_strain'][rows]
+
+        # elastic predictor
+        stress = (eps - ep) @ self.Ce.T
+        zz     = -nu * (eps[:,0] + eps[:,1])      # elastic thickness strain
+
+        self.strain[rows] = eps
+        self.tangent[rows] = self.Ce
+        self.trial['plastic_strain'][rows] = ep
+
+        # check yield condition
+        f = 0.5 * ((stress @ self.Phi) * stress).sum(axis=1) - self.fy2
+
+        # plastic corrector as needed
+        yielding = np.flatnonzero(f >= 0.0)
+        if yielding.size:
+            tangent = self.tangent[rows]
+            plastic = ep.copy()
+
+            r     = stress[yielding] @ self.Phi
+            gamma = f[yielding] / np.einsum('ni,ni->n', r, r @ self.Ce)
+
+            Xi = np.linalg.inv(self.Cinv + gamma[:,np.newaxis,np.newaxis] * self.Phi)
+            de = eps[yielding] - ep[yielding]
+
+            stress[yielding]  = np.einsum('nij,nj->ni', Xi, de)
+            tangent[yielding] = Xi
+
+            zz[yielding]  = -0.5 * (ep[yielding,0] + ep[yielding,1])
+            zz[yielding] += -nu * (stress[yielding,0] + stress[yielding,1]) / E
+
+            plastic[yielding] = eps[yielding] - stress[yielding] @ self.Cinv.T
+
+            self.tangent[rows] = tangent
+            self.trial['plastic_strain'][rows] = plastic
+
+            print("material entering plastic state")
+
+        self.zz[rows]     = zz
+        self.stress[rows] = stress
+
+        return (stress, self.tangent[rows])
@@ -18,6 +18,14 @@ class PlaneStrain(Material):
         self.plastic_strain = np.zeros(3)
         self.setStrain({'xx':0.0, 'yy':0.0, 'xy':0.0})
 
+    def isLinear(self):
+        r"""
+        inherited from :code:`Material` class.
+
+        The response remains elastic if no yield stress is given (:code:`fy` >= 1.0e30).
+        """
+        return self.parameters['fy'] >= 1.0e30
+
     def getThickness(self):
         if 't' in  self.parameters:
             return self.parameters['t']
@@ -1,4 +1,7 @@
+from copy import deepcopy
+
 from .Material import *
+from .MaterialStore import PlaneStressStore
 
 class PlaneStress(Material):
     """
@@ -6,6 +9,8 @@ class PlaneStress(Material):
 
     """
 
+    STORE = PlaneStressStore
+
     def __init__(self, params={'E':1.0, 't':1.0, 'nu':0.0, 'fy':1.0e30}):
         super().__init__(params = params)
 
@@ -14,11 +19,42 @@ class PlaneStress(Material):
         if 't' not in self.parameters:
             self.parameters['t'] = 1.0
 
+        # the material state is a single row of a store (see MaterialStore)
+        self.bind(PlaneStressStore(self.parameters, 1), 0)
+
         # initialize strain
-        self.total_strain   = np.zeros(3)
-        self.plastic_strain = np.zeros(3)
         self.setStrain({'xx':0.0, 'yy':0.0, 'zz':0.0, 'xy':0.0, 'yz':0.0, 'zx':0.0})
 
+    def __getstate__(self):
+        # copies receive a private store holding only their own state
+        state = self.__dict__.copy()
+        state['_store'] = self._store.extract(self._row)
+        state['_row']   = 0
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._store.materials[0] = self
+
+    def __deepcopy__(self, memo):
+        # the private store is new already: copy the remaining attributes only
+        state = self.__getstate__()
+        memo[id(state['_store'])] = state['_store']
+
+        material = self.__class__.__new__(self.__class__)
+        memo[id(self)] = material
+        material.__setstate__(deepcopy(state, memo))
+
+        return material
+
+    def isLinear(self):
+        r"""
+        inherited from :code:`Material` class.
+
+        The response remains elastic if no yield stress is given (:code:`fy` >= 1.0e30).
+        """
+        return self.parameters['fy'] >= 1.0e30
+
     def getThickness(self):
         if 't' in  self.parameters:
             return self.parameters['t']
@@ -32,61 +68,35 @@ class PlaneStress(Material):
         :param eps:  strain or strain tensor
         :return: n/a
         """
-        eps = np.array([self.strain['xx'], self.strain['yy'], self.strain['xy']])
-
-        # update stress state
-        E  = self.parameters['E']
-        t  = self.parameters['t']
-        nu = self.parameters['nu']
-        fy = self.parameters['fy']
-
-        # default consistency parameter
-        gamma = 0.0
-
-        self.Et = E*t/(1. - nu*nu) * np.array([[1.,nu,0.],[nu,1.,0.],[0.,0.,(1.-nu)/2.]])
-
-        Cinv = 1/(E*t) * np.array([[1.,-nu,0.],[-nu,1.,0.],[0.,0.,2.*(1.+nu)]])
-        Phi  = np.array([[2.,-1.,0.],[-1.,2.,0.],[0.,0.,6.]])
-
-        # elastic predictor
-        stress = self.Et @ ( eps - self.plastic_strain )
-
-        self.strain['zz'] = -self.parameters['nu'] * (eps[0] + eps[1])  # elastic thickness strain
-
-        # check yield condition
-        (sxx, syy, sxy) = stress
-        f = stress @ Phi @ stress / 2. - (t*fy)**2
+        if self.parameters != self._store.parameters:
+            # parameters have changed: continue with a private store
+            store = PlaneStressStore(self.parameters, 1)
+            store.copyRow(self._store, self._row, 0)
+            self.bind(store, 0)
 
-        gamma = 0.0
-        Xi = self.Et
+        eps = np.array([[self.strain['xx'], self.strain['yy'], self.strain['xy']]])
 
-        # plastic corrector as needed
-        if f >= 0.0:
-            # loop
-            r = Phi @ stress
-            Xixr = Xi @ r
-            gamma += f / (r @ Xixr)
-            Xi = np.linalg.inv(Cinv + gamma * Phi)
-            stress = Xi @ ( eps - self.plastic_strain )
-            self.Et  = Xi
+        self._store.setStrain(slice(self._row, self._row + 1), eps)
 
-            self.strain['zz']  = -0.5 * (self.plastic_strain[0] + self.plastic_strain[1])
-            self.strain['zz'] += -nu * (stress[0] + stress[1]) / E
+        self.strain['zz'] = self._store.zz[self._row]
 
-            print("material entering plastic state")
+    def getStress(self):
+        stress = self._store.stress[self._row]
+        return {'xx':stress[0], 'yy':stress[1], 'zz':0.0, 'xy':stress[2], 'yz':0.0, 'zx':0.0}
 
-        #print(4*'{:12.8e}  '.format(eps, f, self.plastic_strain, self.sig ))
-        self.sig    = stress
-        self.stress = {'xx':stress[0], 'yy':stress[1], 'zz':0.0, 'xy':stress[2], 'yz':0.0, 'zx':0.0}
+    def getStiffness(self):
+        return self._store.tangent[self._row]
 
     def getStrain(self):
-        return self.strain
+        # read from the store: batched updates do not refresh self.strain
+        strain = self._store.strain[self._row]
+        return {'xx':strain[0], 'yy':strain[1], 'zz':self._store.zz[self._row],
+                'xy':strain[2], 'yz':0.0, 'zx':0.0}
 
     def converged(self):
         # update state now that the global analysis has converged
-        E  = self.parameters['E']
-        t  = self.parameters['t']
-        nu = self.parameters['nu']
+        self._store.converged(slice(self._row, self._row + 1))
 
-        Cinv = 1 / (E * t) * np.array([[1., -nu, 0.], [-nu, 1., 0.], [0., 0., 2. * (1. + nu)]])
-        self.plastic_strain = self.total_strain - Cinv @ self.sig
+    def revert(self):
+        # return to the last converged state
+        self._store.revert(slice(self._row, self._row + 1))
@@ -29,6 +29,12 @@ class SectionMaterial(Material):
         self.setStrain({'axial':0.0, 'flexure':0.0})
         self.updateState()
 
+    def isLinear(self):
+        r"""
+        inherited from :code:`Material` class.
+        """
+        return True
+
     def updateState(self):
         EA = self.parameters['E']*self.parameters['A']
         EI = self.parameters['E']*self.parameters['I']
@@ -30,6 +30,14 @@ class VonMises(Material):
 
         self.setStrain({'xx':0.0, 'yy':0.0, 'zz':0.0, 'xy':0.0, 'yz':0.0, 'zx':0.0})
 
+    def isLinear(self):
+        r"""
+        inherited from :code:`Material` class.
+
+        The response remains elastic if no yield stress is given (:code:`fy` >= 1.0e30).
+        """
+        return self.parameters['fy'] >= 1.0e30
+
     def getThickness(self):
         raise NotImplementedError('Thickness has no meaning in a 3d model')
 
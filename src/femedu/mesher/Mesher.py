@@ -2,6 +2,8 @@ import sys
 import numpy as np
 from copy import deepcopy
 
+from ..domain.SpatialIndex import SpatialIndex
+
 
 class Mesher():
     """
@@ -102,11 +104,50 @@ class Mesher():
         """
         if isinstance(other, Mesher):
             # tie the patches together
-            for nd1 in self.nodes:
-                for nd2 in other.nodes:
-                    if np.linalg.norm(nd2.getPos() - nd1.getPos()) < tol:
-                        nd2.make_follower(nd1)
+            Mesher.tieAll([self, other], tol=tol)
         else:
             msg = "The tie(other) method requires a Mesher object as argument"
             raise TypeError(msg)
 
+    @staticmethod
+    def tieAll(meshers, tol=1.0e-3):
+        """
+        Tie any number of patches together.  Same as calling :code:`meshers[i].tie(meshers[j])`
+        for all pairs :code:`i < j`, in that order.
+
+        Coincident nodes are found through a single spatial index over the nodes of all patches,
+        such that the effort grows about linearly with the total number of nodes.
+
+        :param meshers: list of Mesher instances
+        :param tol: nodes closer than **tol** are tied
+        """
+        if not all( isinstance(mesher, Mesher) for mesher in meshers ):
+            msg = "The tieAll(meshers) method requires a list of Mesher objects as argument"
+            raise TypeError(msg)
+
+        nodes = [ node for mesher in meshers for node in mesher.nodes ]
+        owner = np.repeat(np.arange(len(meshers)), [ len(mesher.nodes) for mesher in meshers ])
+        start = np.cumsum([0] + [ len(mesher.nodes) for mesher in meshers ])
+
+        if len({ node.getPos().shape[0] for node in nodes }) != 1:
+            # mixed dimensions: compare all pairs of nodes
+            for i, mesher in enumerate(meshers):
+                for other in meshers[i+1:]:
+                    for nd1 in mesher.nodes:
+                        for nd2 in other.nodes:
+                            if np.linalg.norm(nd2.getPos() - nd1.getPos()) < tol:
+                                nd2.make_follower(nd1)
+            return
+
+        index = SpatialIndex([ node.getPos() for node in nodes ])
+
+        for i, mesher in enumerate(meshers):
+            pairs = []   # (j, position in meshers[i], position in meshers[j])
+            for a, nd1 in enumerate(mesher.nodes):
+                for k in index.nearPoint(nd1.getPos(), tol):
+                    if owner[k] > i and np.linalg.norm(nodes[k].getPos() - nd1.getPos()) < tol:
+                        pairs.append((owner[k], a, k - start[owner[k]]))
+
+            for j, a, b in sorted(pairs):
+                meshers[j].nodes[b].make_follower(mesher.nodes[a])
+
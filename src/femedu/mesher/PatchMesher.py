@@ -85,17 +85,11 @@ class PatchMesher(Mesher):
         ss = np.linspace(-1.,1.,NeX+1)
         tt = np.linspace(-1.,1.,NeY+1)
 
-        nodes    = []
-        elements = []
+        # mapping from local to global coordinates
+        X, Y = self.map(*np.meshgrid(ss, tt))
 
-        for t in tt:
-            row = []
-            for s in ss:
-                # mapping from local to global coordinates
-                X, Y = self.map(s,t)
-                nd = Node(X,Y)
-                row.append(nd)
-            nodes.append(row)
+        nodes    = [ [ Node(x, y) for x, y in zip(xrow, yrow) ] for xrow, yrow in zip(X, Y) ]
+        elements = []
 
         for j in range(NeY):
             for i in range(NeX):
@@ -124,17 +118,11 @@ class PatchMesher(Mesher):
         ss = np.linspace(-1.,1.,2*NeX+1)
         tt = np.linspace(-1.,1.,2*NeY+1)
 
-        nodes    = []
-        elements = []
+        # mapping from local to global coordinates
+        X, Y = self.map(*np.meshgrid(ss, tt))
 
-        for t in tt:
-            row = []
-            for s in ss:
-                # mapping from local to global coordinates
-                X, Y = self.map(s,t)
-                nd = Node(X,Y)
-                row.append(nd)
-            nodes.append(row)
+        nodes    = [ [ Node(x, y) for x, y in zip(xrow, yrow) ] for xrow, yrow in zip(X, Y) ]
+        elements = []
 
         for J in range(0, 2*NeY, 2):
             for I in range(0, 2*NeX, 2):
@@ -185,17 +173,11 @@ class PatchMesher(Mesher):
         ss = np.linspace(-1.,1.,NeX+1)
         tt = np.linspace(-1.,1.,NeY+1)
 
-        nodes    = []
-        elements = []
+        # mapping from local to global coordinates
+        X, Y = self.map(*np.meshgrid(ss, tt))
 
-        for t in tt:
-            row = []
-            for s in ss:
-                # mapping from local to global coordinates
-                X, Y = self.map(s,t)
-                nd = Node(X,Y)
-                row.append(nd)
-            nodes.append(row)
+        nodes    = [ [ Node(x, y) for x, y in zip(xrow, yrow) ] for xrow, yrow in zip(X, Y) ]
+        elements = []
 
         for j in range(NeY):
             for i in range(NeX):
@@ -223,17 +205,11 @@ class PatchMesher(Mesher):
         ss = np.linspace(-1., 1., 2*NeX + 1)
         tt = np.linspace(-1., 1., 2*NeY + 1)
 
-        nodes = []
-        elements = []
+        # mapping from local to global coordinates
+        X, Y = self.map(*np.meshgrid(ss, tt))
 
-        for t in tt:
-            row = []
-            for s in ss:
-                # mapping from local to global coordinates
-                X, Y = self.map(s, t)
-                nd = Node(X, Y)
-                row.append(nd)
-            nodes.append(row)
+        nodes    = [ [ Node(x, y) for x, y in zip(xrow, yrow) ] for xrow, yrow in zip(X, Y) ]
+        elements = []
 
         for j in range(0, 2*NeY, 2):
             for i in range(0, 2*NeX, 2):
@@ -261,20 +237,23 @@ class PatchMesher(Mesher):
         """
         maps the local coordinates (s,t) from a bi-unit-square
         to the actual position (x,y) in the global model space
+
+        **s** and **t** may also be arrays of equal shape, mapping all points in a single call.
         """
+        s = np.asarray(s, dtype=np.float64)
+        t = np.asarray(t, dtype=np.float64)
+
         ss = [0.5*s*(s-1), (1-s)*(s+1), 0.5*s*(s+1)]
         tt = [0.5*t*(t-1), (1-t)*(t+1), 0.5*t*(t+1)]
-        shp = [ss[0]*tt[0],
-               ss[2]*tt[0],
-               ss[2]*tt[2],
-               ss[0]*tt[2],
-               ss[1]*tt[0],
-               ss[2]*tt[1],
-               ss[1]*tt[2],
-               ss[0]*tt[1],
-               ss[1]*tt[1] ]
-        x = shp @ self.X + self.offset
-
-        return (x[0], x[1])
-
-
+        shp = np.array([ ss[0]*tt[0],
+                         ss[2]*tt[0],
+                         ss[2]*tt[2],
+                         ss[0]*tt[2],
+                         ss[1]*tt[0],
+                         ss[2]*tt[1],
+                         ss[1]*tt[2],
+                         ss[0]*tt[1],
+                         ss[1]*tt[1] ])
+        x = np.einsum('k...,kd->...d', shp, self.X) + self.offset
+
+        return (x[...,0][()], x[...,1][()])
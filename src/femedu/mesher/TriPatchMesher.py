@@ -140,17 +140,11 @@ class TriPatchMesher(Mesher):
         s = np.linspace(0.,1.,Ne+1)
         t = np.linspace(0.,1.,Ne+1)
 
-        nodes    = []
-        elements = []
+        # mapping from local to global coordinates
+        X, Y = self.map(*np.meshgrid(s, t))
 
-        for j in range(Ne+1):
-            row = []
-            for i in range(Ne+1-j):
-                # mapping from local to global coordinates
-                X, Y = self.map(s[i],t[j])
-                nd = Node(X,Y)
-                row.append(nd)
-            nodes.append(row)
+        nodes    = [ [ Node(X[j,i], Y[j,i]) for i in range(Ne+1-j) ] for j in range(Ne+1) ]
+        elements = []
 
         for j in range(Ne):
             for i in range(Ne-j):
@@ -177,10 +171,14 @@ class TriPatchMesher(Mesher):
         """
         maps the local coordinates (s,t) from a bi-unit-square
         to the actual position (x,y) in the global model space
+
+        **s** and **t** may also be arrays of equal shape, mapping all points in a single call.
         """
-        u = 1. - s - t
-        shp = [ u*(2*u-1), s*(2*s-1), t*(2*t-1), 4*u*s, 4*s*t, 4*t*u ]
-        x = shp @ self.X + self.offset
+        s = np.asarray(s, dtype=np.float64)
+        t = np.asarray(t, dtype=np.float64)
 
-        return (x[0], x[1])
+        u = 1. - s - t
+        shp = np.array([ u*(2*u-1), s*(2*s-1), t*(2*t-1), 4*u*s, 4*s*t, 4*t*u ])
+        x = np.einsum('k...,kd->...d', shp, self.X) + self.offset
 
+        return (x[...,0][()], x[...,1][()])
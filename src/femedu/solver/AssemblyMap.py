@@ -0,0 +1,532 @@
+import numpy as np
+from scipy.sparse import coo_array, csc_array, dia_array
+from scipy.sparse.csgraph import reverse_cuthill_mckee
+from scipy.sparse.linalg import splu
+
+
+class AssemblyMap():
+    r"""
+    Element-to-global scatter map used by the solvers during assembly.
+
+    The map numbers the system d.o.f.s and collects, for every element, the global
+    index of every nodal block.  From that it builds the COO row and column arrays for
+    all element stiffness blocks **once per topology**.  An assembly step then only needs to
+    collect the element contributions into a flat data array.
+
+    .. list-table:: data layout
+        :header-rows: 1
+
+        * - array
+          - content
+        * - **rows**, **cols**
+          - global indices of all stiffness entries, element by element,
+            nodal block :math:`{\bf K}_{IJ}` by nodal block, each block stored row by row
+        * - **vec_idx**
+          - global indices of all nodal force entries, element by element,
+            node by node
+        * - **vec_ptr**, **mat_ptr**
+          - offset of every element's first entry in **vec_idx** and **rows**/**cols**, respectively
+            (length :code:`nelem+1`)
+
+    The map is only valid as long as the topology does not change.  Use :py:meth:`isValid`
+    to test whether or not a map still describes the given model.
+
+    System d.o.f.s are numbered node by node.  The order of the nodes is chosen to reduce the
+    bandwidth or the fill-in of the system matrix (see :py:meth:`nodeOrdering`).  The resulting permutation
+    is available as **natural** (system index of every d.o.f. in the order nodes were added to the model),
+    and the half-bandwidth of all element contributions as **bandwidth**.
+
+    For sparse solvers, the map also provides a fixed CSC sparsity pattern
+    (see :py:meth:`assembleCSC`) and stores a fill-reducing ordering
+    (see :py:meth:`setOrdering`).  Both are computed once per topology.
+    Prescribed d.o.f.s are eliminated within that pattern (see :py:meth:`eliminate`).
+
+    Solvers using banded storage assemble directly into the LAPACK band of width
+    :code:`2*bandwidth+1` (see :py:meth:`assembleBanded` and :py:meth:`eliminateBanded`).
+
+    Elements evaluated in batches are registered with the map using :py:meth:`setElementGroups`.
+    """
+
+    ORDERINGS = ('natural', 'rcm', 'mindegree')
+
+    def __init__(self, nodes, elements, constraints, ordering='natural'):
+        r"""
+        :param nodes: list of node pointers
+        :param elements: list of element pointers
+        :param constraints: list of constraint pointers
+        :param ordering: node ordering used for the d.o.f. numbering (see :py:meth:`nodeOrdering`)
+        """
+        self.signature = self.topology(nodes, elements, constraints)
+        self.ordering  = ordering
+
+        # number the system d.o.f.s
+        ndof = 0
+        for k in self.nodeOrdering(nodes, elements, ordering):
+            nodes[k].setStart(ndof)
+            ndof += nodes[k].ndofs
+
+        # system index of every nodal d.o.f. in the order nodes were added to the model
+        self.natural = np.array([ node.start + i for node in nodes if node.isLead()
+                                  for i in range(node.ndofs) ], dtype=int)
+
+        for constraint in constraints:
+            constraint.setStart(ndof)
+            ndof += constraint.countConditions()
+
+        self.ndof = ndof
+        self.natural = np.concatenate((self.natural, np.arange(self.natural.shape[0], ndof, dtype=int)))
+
+        # collect the scatter map
+        rows    = []
+        cols    = []
+        vec_idx = []
+        self.vec_sizes = []       # length of every nodal vector, element by element
+
+        vec_ptr = [0]
+        mat_ptr = [0]
+
+        for element in elements:
+            idx_list = [ ndI.getIdx4Element(element) for ndI in element.nodes ]
+
+            nvec = 0
+            for idxK in idx_list:
+                vec_idx.append(idxK)
+                self.vec_sizes.append(len(idxK))
+                nvec += len(idxK)
+
+                for idxM in idx_list:
+                    rows.append(np.repeat(idxK, len(idxM)))
+                    cols.append(np.tile(idxM, len(idxK)))
+
+            vec_ptr.append(vec_ptr[-1] + nvec)
+            mat_ptr.append(mat_ptr[-1] + nvec * nvec)
+
+        self.vec_ptr = np.array(vec_ptr, dtype=int)
+        self.mat_ptr = np.array(mat_ptr, dtype=int)
+
+        self.rows    = np.concatenate(rows).astype(int)    if rows    else np.zeros(0, dtype=int)
+        self.cols    = np.concatenate(cols).astype(int)    if cols    else np.zeros(0, dtype=int)
+        self.vec_idx = np.concatenate(vec_idx).astype(int) if vec_idx else np.zeros(0, dtype=int)
+
+        self.bandwidth = int(np.abs(self.rows - self.cols).max(initial=0))  # half-bandwidth of all element contributions
+
+        # sparse pattern and ordering are built on demand
+        self.K        = None    # system matrix with fixed CSC pattern
+        self.csc_ptr  = None    # position of every (rows, cols) entry in K.data
+        self.diag_ptr = None    # position of every diagonal entry in K.data
+        self.perm     = None    # fill-reducing ordering
+        self.Kperm    = None    # symmetrically permuted system matrix
+        self.perm_ptr = None    # position of every Kperm.data entry in K.data
+
+        # banded storage is built on demand
+        self.band_ptr = None    # position of every (rows, cols) entry in the flat LAPACK band
+
+        # partition into free and prescribed d.o.f.s is built on demand
+        self.fixed      = None  # prescribed d.o.f.s
+        self.free       = None  # free d.o.f.s
+        self.fixed_ptr  = None  # position of every entry of K_fp, K_pf, and K_pp in K.data
+        self.column_ptr = None  # position of every entry in a prescribed column in K.data
+        self.column_idx = None  # column index of each of those entries
+
+        # element groups for batched evaluation are registered by the solver
+        self.groups     = None  # list of ElementGroup objects
+        self.singles    = None  # indices of all elements evaluated one by one
+        self.single_vec = None  # positions of their force entries in vec_idx
+        self.single_mat = None  # positions of their stiffness entries in rows and cols
+        self.tasks      = None  # partition of groups and single elements for concurrent evaluation
+
+        # stiffness data of elements with constant stiffness is kept by the solver
+        self.Kcache = None      # flat stiffness data, ordered as rows and cols
+        self.Kkeys  = None      # stiffness key of every element, None if not cached
+
+        # material stores holding the state of all material points are registered by the solver
+        self.stores = None      # list of MaterialStore objects
+
+    @staticmethod
+    def topology(nodes, elements, constraints):
+        r"""
+        Computes a simple signature of the model topology.
+
+        The signature changes if nodes, elements, or constraints are added,
+        if nodes get tied to other nodes, if nodes receive additional d.o.f.s,
+        or if nodal transformations are attached.
+
+        :returns: signature (tuple)
+        """
+        nlead  = 0
+        ndofs  = 0
+        ntrans = 0
+        for node in nodes:
+            if node.isLead():
+                nlead += 1
+                ndofs += node.ndofs
+                if node.hasTransform():
+                    ntrans += 1
+
+        return (len(nodes), len(elements), len(constraints), nlead, ndofs, ntrans)
+
+    @staticmethod
+    def nodeOrdering(nodes, elements, method='rcm'):
+        r"""
+        Order all lead nodes such that the system matrix has a small bandwidth or little fill-in.
+
+        The ordering is computed from the node graph, in which two lead nodes are adjacent
+        if they share an element.  Follower nodes are represented by their lead node.
+
+        .. list-table:: available methods
+            :header-rows: 1
+
+            * - method
+              - ordering
+            * - **'natural'**
+              - the order in which nodes were added to the model
+            * - **'rcm'**
+              - reverse Cuthill-McKee ordering: small bandwidth and profile
+            * - **'mindegree'**
+              - multiple minimum degree ordering: little fill-in during a sparse factorization
+
+        :param nodes: list of node pointers
+        :param elements: list of element pointers
+        :param method: one of the methods listed above
+        :returns: positions of all lead nodes in **nodes**, in their new order
+        """
+        if method not in AssemblyMap.ORDERINGS:
+            msg = "unknown d.o.f. ordering '{}': use one of {}".format(method, AssemblyMap.ORDERINGS)
+            raise TypeError(msg)
+
+        leads = [ k for k, node in enumerate(nodes) if node.isLead() ]
+        nlead = len(leads)
+
+        if method == 'natural' or nlead < 3:
+            return leads
+
+        position = { id(nodes[k]): i for i, k in enumerate(leads) }
+
+        rows = []
+        cols = []
+        for element in elements:
+            idx = np.array([ position[id(node.getLead())] for node in element.nodes
+                             if id(node.getLead()) in position ], dtype=int)
+            rows.append(np.repeat(idx, idx.shape[0]))
+            cols.append(np.tile(idx, idx.shape[0]))
+
+        rows = np.concatenate(rows + [np.arange(nlead)])
+        cols = np.concatenate(cols + [np.arange(nlead)])
+
+        # adjacency with a dominant diagonal (duplicate entries are summed)
+        graph = csc_array((np.ones(rows.shape[0]), (rows, cols)), shape=(nlead, nlead))
+        graph.setdiag(graph.sum(axis=0) + 1.0)
+
+        if method == 'rcm':
+            order = reverse_cuthill_mckee(graph, symmetric_mode=True)
+        else:
+            # splu applies its column ordering as graph[:, argsort(perm_c)]
+            lu = splu(graph, permc_spec='MMD_AT_PLUS_A', options=dict(SymmetricMode=True))
+            order = np.argsort(lu.perm_c)
+
+        return [ leads[i] for i in order ]
+
+    def isValid(self, nodes, elements, constraints):
+        r"""
+        :returns: **True** if this map still describes the given model topology
+        """
+        return self.signature == self.topology(nodes, elements, constraints)
+
+    def setElementGroups(self, groups, singles):
+        r"""
+        Register element groups for batched evaluation.
+
+        Every group learns the positions of its element data within the flat force and stiffness data arrays.
+
+        :param groups: list of :py:class:`ElementGroup` objects
+        :param singles: indices of all elements evaluated one by one
+        """
+        self.groups  = groups
+        self.singles = list(singles)
+        self.tasks   = None
+
+        for group in groups:
+            group.setPositions(self.vec_ptr, self.mat_ptr)
+
+        idx = np.array(self.singles, dtype=int)
+        self.single_vec = self._ranges(self.vec_ptr[idx], self.vec_ptr[idx + 1])
+        self.single_mat = self._ranges(self.mat_ptr[idx], self.mat_ptr[idx + 1])
+
+    @staticmethod
+    def _ranges(start, stop):
+        r"""
+        :returns: concatenation of all ranges :code:`start[k]:stop[k]`
+        """
+        if not len(start):
+            return np.zeros(0, dtype=int)
+        return np.concatenate([ np.arange(i, j) for i, j in zip(start, stop) ]).astype(int)
+
+    def assembleForces(self, data):
+        r"""
+        :param data: flat array of all nodal force entries, ordered as **vec_idx**
+        :returns: system vector (ndarray)
+        """
+        return np.bincount(self.vec_idx, weights=data, minlength=self.ndof)
+
+    def assembleVector(self, vectors):
+        r"""
+        Scatter element vectors into a system vector.
+
+        :param vectors: list of nodal vectors, element by element, node by node.
+                        **None** entries are treated as zero vectors.
+        :returns: system vector (ndarray)
+        """
+        data = [ np.ravel(vec) if vec is not None else np.zeros(n)
+                 for vec, n in zip(vectors, self.vec_sizes) ]
+
+        if not data:
+            return np.zeros(self.ndof)
+
+        data = np.concatenate(data, dtype=np.float64)
+
+        return np.bincount(self.vec_idx, weights=data, minlength=self.ndof)
+
+    def stiffnessData(self, blocks):
+        r"""
+        Flatten nodal stiffness blocks into the data array matching **rows** and **cols**.
+
+        :param blocks: list of nodal stiffness blocks :math:`{\bf K}_{IJ}`, element by element,
+                       :math:`I` by :math:`I`, :math:`J` by :math:`J`.
+        :returns: data array (ndarray)
+        """
+        if not blocks:
+            return np.zeros(0)
+
+        data = np.concatenate([ np.ravel(block) for block in blocks ], dtype=np.float64)
+
+        if data.shape[0] != self.rows.shape[0]:
+            msg = "element stiffness blocks do not match the assembly map: the model topology has changed"
+            raise TypeError(msg)
+
+        return data
+
+    def assembleDense(self, data):
+        r"""
+        :param data: data array as returned by :py:meth:`stiffnessData`
+        :returns: system matrix as a full (dense) array
+        """
+        ndof = self.ndof
+        K = np.bincount(self.rows * ndof + self.cols, weights=data, minlength=ndof*ndof)
+        K.shape = (ndof, ndof)
+        return K
+
+    def assembleSparse(self, data, rows=None, cols=None, extra=None):
+        r"""
+        :param data: data array as returned by :py:meth:`stiffnessData`
+        :param rows: optional row indices for additional entries
+        :param cols: optional column indices for additional entries
+        :param extra: optional values for additional entries, e.g., penalty terms
+        :returns: system matrix as :code:`scipy.sparse.csc_array`
+        """
+        if extra is not None and len(extra):
+            data = np.concatenate((data, extra))
+            rows = np.concatenate((self.rows, rows))
+            cols = np.concatenate((self.cols, cols))
+        else:
+            rows = self.rows
+            cols = self.cols
+
+        K = coo_array((data, (rows, cols)), shape=(self.ndof, self.ndof))
+        return K.tocsc()
+
+    def _buildPattern(self):
+        r"""
+        Build the CSC pattern of the system matrix, including all diagonal entries,
+        and the permutation from element blocks into the :code:`data` array.
+        """
+        ndof = self.ndof
+        diag = np.arange(ndof)
+
+        rows = np.concatenate((self.rows, diag))
+        cols = np.concatenate((self.cols, diag))
+
+        # column-major keys sort the entries in CSC order
+        keys, ptr = np.unique(cols * ndof + rows, return_inverse=True)
+
+        indices = (keys % ndof).astype(np.int32)
+        indptr  = np.zeros(ndof + 1, dtype=np.int32)
+        indptr[1:] = np.cumsum(np.bincount(keys // ndof, minlength=ndof))
+
+        self.K = csc_array((np.zeros(keys.shape[0]), indices, indptr), shape=(ndof, ndof))
+
+        self.csc_ptr  = ptr[:self.rows.shape[0]]
+        self.diag_ptr = ptr[self.rows.shape[0]:]
+
+    def assembleCSC(self, data, diag_idx=None, diag_values=None):
+        r"""
+        Assemble the system matrix into the fixed CSC pattern.
+
+        The pattern is computed on first use.  Every later call only updates the
+        values of the same :code:`csc_array` in place.
+
+        :param data: data array as returned by :py:meth:`stiffnessData`
+        :param diag_idx: optional indices of diagonal entries receiving additional values
+        :param diag_values: optional values added to those diagonal entries, e.g., penalty terms
+        :returns: system matrix as :code:`scipy.sparse.csc_array`
+        """
+        if self.K is None:
+            self._buildPattern()
+
+        self.K.data[:] = np.bincount(self.csc_ptr, weights=data, minlength=self.K.data.shape[0])
+
+        if diag_idx is not None and len(diag_idx):
+            self.K.data[self.diag_ptr[diag_idx]] += diag_values
+
+        return self.K
+
+    def assembleBanded(self, data):
+        r"""
+        Assemble the system matrix directly into LAPACK general band storage.
+
+        Entry :math:`K_{ij}` is stored as :code:`ab[bandwidth + i - j, j]`, hence, the first :code:`bandwidth+1`
+        rows of :code:`ab` are the upper band storage used for symmetric matrices.  The same array
+        is the :code:`data` array of a :code:`scipy.sparse.dia_array` with offsets :code:`bandwidth, ..., -bandwidth`.
+
+        :param data: data array as returned by :py:meth:`stiffnessData`
+        :returns: system matrix as :code:`scipy.sparse.dia_array` sharing its data with :code:`ab`
+        """
+        ndof = self.ndof
+        bw   = self.bandwidth
+
+        if self.band_ptr is None:
+            self.band_ptr = (bw + self.rows - self.cols) * ndof + self.cols
+
+        ab = np.bincount(self.band_ptr, weights=data, minlength=(2*bw + 1) * ndof)
+        ab.shape = (2*bw + 1, ndof)
+
+        return dia_array((ab, bw - np.arange(2*bw + 1)), shape=(ndof, ndof))
+
+    def eliminateBanded(self, fixed, du, K):
+        r"""
+        Eliminate prescribed d.o.f.s from a system matrix in band storage.
+
+        Same as :py:meth:`eliminate` for a matrix assembled by :py:meth:`assembleBanded`.
+        The cost is proportional to the number of prescribed d.o.f.s times the bandwidth.
+
+        :param fixed: indices of all prescribed d.o.f.s
+        :param du: prescribed displacement increments, :math:`\Delta\bar{\bf U}_p`
+        :param K: system matrix as returned by :py:meth:`assembleBanded` (modified in place)
+        :returns: the load correction :math:`{\bf K}_{:p}\:\Delta\bar{\bf U}_p` as a system vector
+        """
+        self.partition(fixed)
+
+        ndof  = self.ndof
+        bw    = self.bandwidth
+        ab    = K.data
+        fixed = self.fixed
+
+        # K[j+d, j] for every prescribed column j and every offset d within the band
+        d = np.arange(-bw, bw + 1)
+        i = fixed[:, np.newaxis] + d
+        inside = (i >= 0) & (i < ndof)
+
+        column = ab[bw + d, :][:, fixed].T
+        KdU = np.bincount(i[inside], weights=(column * np.asarray(du)[:, np.newaxis])[inside],
+                          minlength=ndof)
+
+        # zero prescribed columns and rows: K[i, i-d] is stored at ab[bw+d, i-d]
+        ab[:, fixed] = 0.0
+        j = fixed[:, np.newaxis] - d
+        inside = (j >= 0) & (j < ndof)
+        ab[np.broadcast_to(bw + d, j.shape)[inside], j[inside]] = 0.0
+
+        ab[bw, fixed] = 1.0
+
+        return KdU
+
+    def setOrdering(self, perm):
+        r"""
+        Store a fill-reducing ordering for the current pattern.
+
+        The symmetrically permuted pattern, :math:`{\bf K}[p,p]`, and a map from its
+        :code:`data` array into the :code:`data` array of :code:`K` are computed once.
+
+        :param perm: permutation vector, :math:`p`
+        """
+        if self.K is None:
+            self._buildPattern()
+
+        self.perm = np.asarray(perm, dtype=int)
+
+        # tag every entry with its position (+1 to avoid any structural zero)
+        tags = csc_array((np.arange(1, self.K.nnz + 1, dtype=np.float64),
+                          self.K.indices, self.K.indptr), shape=self.K.shape)
+        tags = csc_array(tags[self.perm, :][:, self.perm])
+        tags.sort_indices()
+
+        self.perm_ptr = tags.data.astype(int) - 1
+        self.Kperm = csc_array((self.K.data[self.perm_ptr], tags.indices, tags.indptr), shape=self.K.shape)
+
+    def permuted(self, K=None):
+        r"""
+        :param K: system matrix in the fixed pattern (defaults to the last matrix from :py:meth:`assembleCSC`)
+        :returns: the symmetrically permuted matrix :math:`{\bf K}[p,p]` (updated in place)
+        """
+        if K is None:
+            K = self.K
+        self.Kperm.data[:] = K.data[self.perm_ptr]
+        return self.Kperm
+
+    def partition(self, fixed):
+        r"""
+        Partition the system d.o.f.s into free and prescribed d.o.f.s.
+
+        The partition is recomputed only if the set of prescribed d.o.f.s has changed.
+
+        :param fixed: indices of all prescribed d.o.f.s
+        """
+        fixed = np.asarray(fixed, dtype=int)
+
+        if (self.fixed is not None and np.array_equal(fixed, self.fixed)
+                and (self.K is None or self.fixed_ptr is not None)):
+            return
+
+        ndof = self.ndof
+
+        is_fixed = np.zeros(ndof, dtype=bool)
+        is_fixed[fixed] = True
+
+        self.fixed = fixed
+        self.free  = np.flatnonzero(~is_fixed)
+
+        if self.K is not None:
+            column = np.repeat(np.arange(ndof), np.diff(self.K.indptr))
+
+            self.column_ptr = np.flatnonzero(is_fixed[column])
+            self.column_idx = column[self.column_ptr]
+            self.fixed_ptr  = np.flatnonzero(is_fixed[column] | is_fixed[self.K.indices])
+
+    def eliminate(self, fixed, du, K=None):
+        r"""
+        Eliminate prescribed d.o.f.s from a system matrix in the fixed CSC pattern.
+
+        All entries of :math:`{\bf K}_{fp}` and :math:`{\bf K}_{pf}` are set to zero
+        and :math:`{\bf K}_{pp}` is replaced by the identity.  Hence, the cost is proportional
+        to the number of entries in prescribed rows and columns.
+
+        :param fixed: indices of all prescribed d.o.f.s
+        :param du: prescribed displacement increments, :math:`\Delta\bar{\bf U}_p`
+        :param K: system matrix in the fixed pattern (defaults to the last matrix from :py:meth:`assembleCSC`)
+        :returns: the load correction :math:`{\bf K}_{:p}\:\Delta\bar{\bf U}_p` as a system vector
+        """
+        if K is None:
+            K = self.K
+
+        self.partition(fixed)
+
+        dU = np.zeros(self.ndof)
+        dU[self.fixed] = du
+
+        KdU = np.bincount(K.indices[self.column_ptr],
+                          weights=K.data[self.column_ptr] * dU[self.column_idx],
+                          minlength=self.ndof)
+
+        K.data[self.fixed_ptr] = 0.0
+        K.data[self.diag_ptr[self.fixed]] = 1.0
+
+        return KdU
@@ -0,0 +1,185 @@
+import numpy as np
+from collections import deque
+
+
+class DisplacementState():
+    r"""
+    System-level displacement state of all lead nodes.
+
+    The state keeps all nodal displacement vectors in a few contiguous arrays,
+    indexed by the system d.o.f.s as numbered by the :py:class:`AssemblyMap`.
+    Every lead node is bound to the state (see :py:meth:`Node.bindState`), i.e., its
+    displacement vectors are views into these arrays.  Hence, solvers update, rotate, and revert
+    the displacements of all nodes by single vector operations while every node still
+    reports its own displacements.
+
+    .. list-table:: data layout
+        :header-rows: 1
+
+        * - array
+          - content
+        * - **U**
+          - current displacements (:code:`node.disp`)
+        * - **U_n**
+          - previously converged displacements (:code:`node.disp_n`)
+        * - **U_nn**
+          - two steps back converged displacements (:code:`node.disp_nn`)
+        * - **U_mode**
+          - displacements representing a mode shape (:code:`node.disp_mode`)
+
+    Displacements of nodes with a transformation are stored in global coordinates while
+    solvers produce increments in local coordinates.  Increments of those nodes are
+    transformed node by node (see :py:meth:`update`).
+
+    The state is only valid as long as the topology does not change.  Solvers build a new state
+    together with every new :py:class:`AssemblyMap`.  Displacements pushed to the previous state
+    are carried over to the new numbering (see :py:meth:`push`).
+    """
+
+    def __init__(self, nodes, previous=None):
+        r"""
+        :param nodes: list of node pointers (numbered by an :py:class:`AssemblyMap`)
+        :param previous: the :py:class:`DisplacementState` this state replaces, if any
+        """
+        leads = [ node for node in nodes if node.isLead() ]
+
+        ndof = 0
+        for node in leads:
+            ndof = max(ndof, node.start + node.ndofs)
+
+        self.ndof = ndof        # number of nodal d.o.f.s (excludes d.o.f.s of constraints)
+
+        self.U      = np.zeros(ndof)
+        self.U_n    = np.zeros(ndof)
+        self.U_nn   = np.zeros(ndof)
+        self.U_mode = np.zeros(ndof)
+
+        self.pushed = deque()   # stored displacement vectors (see push() and pop())
+
+        self.transformed = []   # (slice, node) for all nodes with a transformation
+        self.slices      = {}   # slice of the system d.o.f.s owned by every lead node
+
+        for node in nodes:
+            if node.isLead():
+                idx = slice(node.start, node.start + node.ndofs)
+                self.slices[node] = idx
+                node.bindState(self, idx)
+                if node.hasTransform():
+                    self.transformed.append((idx, node))
+            else:
+                # followers report the displacements of their lead node
+                node.bindState(None)
+
+        if previous is not None:
+            for state in previous.pushed:
+                self.pushed.append({'U':self.renumber(previous, state['U']), 'lam':state['lam']})
+
+    def renumber(self, previous, U):
+        r"""
+        Map a displacement vector from the d.o.f. numbering of a previous state to this state.
+        Nodes unknown to the previous state receive zero displacements.
+
+        :param previous: the :py:class:`DisplacementState` **U** refers to
+        :param U: displacement vector numbered by **previous**
+        :returns: displacement vector numbered by this state
+        """
+        V = np.zeros(self.ndof)
+
+        for node, idx in self.slices.items():
+            if node in previous.slices:
+                Ui = U[previous.slices[node]]
+                n  = min(Ui.shape[0], idx.stop - idx.start)
+                V[idx.start:idx.start + n] = Ui[:n]
+
+        return V
+
+    def getArrays(self):
+        r"""
+        :returns: tuple (U, U_n, U_nn, U_mode)
+        """
+        return (self.U, self.U_n, self.U_nn, self.U_mode)
+
+    def update(self, dU):
+        r"""
+        Add a displacement update to all nodes.
+
+        :param dU: system vector of displacement updates (in nodal coordinates)
+        """
+        dU = dU[:self.ndof]
+
+        self.U += dU
+
+        for idx, node in self.transformed:
+            dUi = dU[idx]
+            self.U[idx] += node.v2g(dUi, node) - dUi
+
+    def commit(self):
+        r"""
+        Rotate states (n)->(n-1) and current->(n) once a solver has converged.
+        """
+        self.U_nn[:] = self.U_n
+        self.U_n[:]  = self.U
+
+    def revert(self):
+        r"""
+        Restore the last converged state.
+        """
+        self.U[:] = self.U_n
+
+    def setTrialState(self):
+        r"""
+        Set the trial state for arc-length control,
+        :math:`{\bf U}^{(0)}_{n+1} = 2{\bf U}_{n} - {\bf U}_{n-1}`.
+        """
+        np.subtract(2.0 * self.U_n, self.U_nn, out=self.U)
+
+    def reset(self):
+        r"""
+        Set all displacements, current and converged, to zero.
+        """
+        self.U[:]    = 0.0
+        self.U_n[:]  = 0.0
+        self.U_nn[:] = 0.0
+
+    def getDeltaU(self, previous_step=False):
+        r"""
+        :param previous_step: set to **True** for the increment of the last converged step
+        :returns: :math:`{\bf U} - {\bf U}_n`, or :math:`{\bf U}_n - {\bf U}_{n-1}` for the previous step
+        """
+        if previous_step:
+            return self.U_n - self.U_nn
+        else:
+            return self.U - self.U_n
+
+    def getNormDeltaU2(self, previous_step=False):
+        r"""
+        :param previous_step: set to **True** for the increment of the last converged step
+        :returns: :math:`||\Delta{\bf U}||^2` of all nodes
+        """
+        dU = self.getDeltaU(previous_step)
+        return dU @ dU
+
+    def push(self, loadfactor):
+        r"""
+        Store the current displacements for later restore using :py:meth:`pop`.
+        Only the two most recent states are kept.  They survive changes of the topology.
+
+        :param loadfactor: load factor associated with the current displacements
+        """
+        self.pushed.append({'U':self.U.copy(), 'lam':loadfactor})
+        if len(self.pushed) > 2:
+            self.pushed.popleft()
+
+    def pop(self):
+        r"""
+        Restore previously pushed displacements (using :py:meth:`push`).
+
+        :returns: the load factor stored with those displacements
+        """
+        if not len(self.pushed):
+            raise TypeError("no pushed displacement data available")
+
+        state = self.pushed.pop()
+        self.U[:] = state['U']
+
+        return state['lam']
@@ -0,0 +1,250 @@
+import numpy as np
+import scipy.sparse.linalg as spla
+
+from .NewtonRaphsonSparse import NewtonRaphsonSolverSparse
+
+class KrylovSolver(NewtonRaphsonSolverSparse):
+    r"""
+    An inexact Newton solver using preconditioned Krylov methods for the linearized system.
+
+    Assembly, boundary conditions, and control methods are shared with :py:class:`NewtonRaphsonSolverSparse`.
+    Instead of factorizing :math:`{\bf K}_t`, every Newton step solves the linearized system
+    iteratively.  This avoids the fill-in of direct factorizations on large meshes.
+
+    .. list-table:: Krylov methods
+        :header-rows: 1
+
+        * - method
+          - use
+        * - **'cg'**
+          - conjugate gradients for symmetric positive definite tangents
+        * - **'minres'**
+          - MINRES for symmetric indefinite tangents, e.g., beyond a limit point
+        * - **'gmres'**
+          - GMRES for unsymmetric tangents
+        * - **'auto'**
+          - conjugate gradients, switching to GMRES for any right-hand side CG fails to solve (default)
+
+    .. list-table:: preconditioners
+        :header-rows: 1
+
+        * - preconditioner
+          - description
+        * - **'ilu'**
+          - incomplete LU factorization (:code:`scipy.sparse.linalg.spilu`) in symmetric mode (default).
+            For symmetric tangents, this is an approximation of an incomplete Cholesky factorization.
+        * - **'jacobi'**
+          - diagonal scaling
+        * - **None**
+          - no preconditioning
+
+    The relative tolerance of the linear solve follows the forcing term of the inexact Newton method
+    (Eisenstat-Walker):
+
+    .. math::
+
+       \eta_k = \min\left( \eta_{max},\; 0.9 \left( \frac{||{\bf R}_k||}{||{\bf R}_{k-1}||} \right)^2 \right)
+
+    Each right-hand side is warm-started from the solution for the same right-hand side
+    of the previous increment, if that guess reduces the initial residual.
+    Should the Krylov method fail to converge, the step falls back to the direct solver
+    of :py:class:`NewtonRaphsonSolverSparse`.
+
+    .. note::
+
+        MINRES requires a symmetric positive definite preconditioner.
+        **'ilu'** is replaced by **'jacobi'** (using :math:`|K_{ii}|`) for MINRES.
+
+    :param method: Krylov method, one of **'auto'**, **'cg'**, **'minres'**, or **'gmres'**
+    :param preconditioner: one of **'ilu'**, **'jacobi'**, or **None**
+    :param forcing: largest forcing term, :math:`\eta_{max}`
+    :param maxiter: maximum number of Krylov iterations per solve (default: number of d.o.f.s, at most 1000)
+    """
+
+    METHODS = ('auto', 'cg', 'minres', 'gmres')
+    PRECONDITIONERS = ('ilu', 'jacobi', None)
+
+    def __init__(self, method='auto', preconditioner='ilu', forcing=1.0e-2, maxiter=None):
+        super(KrylovSolver, self).__init__()
+
+        if method not in self.METHODS:
+            msg = f"unknown Krylov method '{method}': use one of {self.METHODS}"
+            raise TypeError(msg)
+
+        if preconditioner not in self.PRECONDITIONERS:
+            msg = f"unknown preconditioner '{preconditioner}': use one of {self.PRECONDITIONERS}"
+            raise TypeError(msg)
+
+        if not 0.0 < forcing < 1.0:
+            msg = "forcing must be a number between 0.0 and 1.0"
+            raise TypeError(msg)
+
+        self.method         = method
+        self.preconditioner = preconditioner
+        self.forcing        = forcing
+        self.maxiter        = maxiter
+
+        self.normR_last = None      # residual norm from the previous Newton step
+        self.x0         = {}        # solutions of the previous increment, one per right-hand side
+        self.iterations = 0         # Krylov iterations spent during the last solve
+        self.direct     = None      # direct solve, only used if the Krylov method fails
+
+    def resetAssemblyMap(self):
+        r"""
+        inherited from :code:`Solver` class.
+
+        Also discards warm-start vectors.
+        """
+        super(KrylovSolver, self).resetAssemblyMap()
+        self.x0 = {}
+        self.normR_last = None
+
+    def forcingTerm(self):
+        r"""
+        Compute the forcing term, :math:`\eta_k`, for the current Newton step.
+
+        :returns: relative tolerance for the linear solve
+        """
+        normR = np.linalg.norm(self.R)
+
+        eta = self.forcing
+        if self.normR_last:
+            eta = min(eta, 0.9 * (normR / self.normR_last)**2)
+
+        # do not solve more accurately than needed to reach the Newton tolerance
+        if normR > 0.0:
+            eta = max(eta, 0.5 * self.TOL / normR)
+
+        self.normR_last = normR
+
+        return min(eta, self.forcing)
+
+    def buildPreconditioner(self, method):
+        r"""
+        :param method: the Krylov method the preconditioner is used with
+        :returns: the preconditioner as :code:`scipy.sparse.linalg.LinearOperator`, or **None**
+        """
+        if self.preconditioner is None:
+            return None
+
+        K = self.Kt
+
+        if self.preconditioner == 'ilu' and method != 'minres':
+            try:
+                ilu = spla.spilu(K.tocsc(), drop_tol=1.0e-4, fill_factor=10,
+                                 options=dict(SymmetricMode=True))
+                return spla.LinearOperator(K.shape, matvec=ilu.solve)
+            except RuntimeError:
+                # singular incomplete factor: fall back to diagonal scaling
+                pass
+
+        d = np.abs(K.diagonal())
+        d[d == 0.0] = 1.0
+        return spla.LinearOperator(K.shape, matvec=lambda x: x / d)
+
+    def factorize(self):
+        r"""
+        Prepare the iterative solution of :math:`{\bf K}_t\:{\bf x} = {\bf b}`.
+
+        Replaces the direct factorization of :py:class:`NewtonRaphsonSolverSparse`:
+        only the preconditioner is computed here.
+
+        :returns: a function solving :math:`{\bf K}_t \: {\bf x} = {\bf b}` for one or more right-hand sides
+        """
+        method = 'cg' if self.method == 'auto' else self.method
+        M      = self.buildPreconditioner(method)
+        rtol   = self.forcingTerm()
+
+        self.iterations = 0
+        self.direct     = None
+
+        def solve(b):
+            if np.ndim(b) > 1:
+                return np.column_stack([ self._solve(b[:,j], j, method, M, rtol) for j in range(b.shape[1]) ])
+            return self._solve(b, 0, method, M, rtol)
+
+        return solve
+
+    def _solve(self, b, col, method, M, rtol):
+        r"""
+        Solve for a single right-hand side.
+
+        :param b: right-hand side
+        :param col: index of the right-hand side (used for warm starts)
+        :param method: Krylov method
+        :param M: preconditioner
+        :param rtol: relative tolerance
+        :returns: solution vector
+        """
+        K = self.Kt
+
+        normb = np.linalg.norm(b)
+        if normb == 0.0:
+            return np.zeros_like(b)
+
+        # warm start from the previous increment if that improves the initial residual
+        x0 = self.x0.get(col)
+        if x0 is not None and (x0.shape != b.shape or np.linalg.norm(b - K @ x0) >= normb):
+            x0 = None
+
+        x, info = self._krylov(method, K, b, x0, rtol, M)
+
+        if method == 'minres':
+            # MINRES stops on a backward error estimate, relative to ||K|| ||x||.
+            # Tighten that tolerance and restart until the true residual is small enough.
+            tol = rtol
+            for restart in range(10):
+                ratio = np.linalg.norm(b - K @ x) / normb
+                if info != 0 or ratio <= rtol:
+                    break
+                tol *= 0.5 * rtol / ratio
+                x, info = self._krylov(method, K, b, x, tol, M)
+
+        if info != 0 and self.method == 'auto':
+            # CG failed, e.g., for an indefinite tangent
+            x, info = self._krylov('gmres', K, b, x0, rtol, self.buildPreconditioner('gmres'))
+
+        if info != 0:
+            # no convergence: fall back to the direct solver of the parent class
+            if self.direct is None:
+                self.direct = super(KrylovSolver, self).factorize()
+            x = self.direct(b)
+
+        self.x0[col] = x
+
+        return x
+
+    def _krylov(self, method, K, b, x0, rtol, M):
+        r"""
+        Thin wrapper around the :code:`scipy.sparse.linalg` Krylov methods.
+
+        :returns: tuple (solution, info)
+        """
+        counter = _Counter()
+        maxiter = self.maxiter if self.maxiter else min(K.shape[0], 1000)
+        kwargs = dict(x0=x0, M=M, maxiter=maxiter, callback=counter)
+
+        solver = {'cg': spla.cg, 'minres': spla.minres, 'gmres': spla.gmres}[method]
+        if method == 'gmres':
+            kwargs['callback_type'] = 'pr_norm'
+
+        try:
+            x, info = solver(K, b, rtol=rtol, **kwargs)
+        except TypeError:
+            # scipy < 1.12 names the relative tolerance 'tol'
+            x, info = solver(K, b, tol=rtol, **kwargs)
+
+        self.iterations += counter.count
+
+        return (x, info)
+
+
+class _Counter():
+    r"""
+    Callback counting Krylov iterations.
+    """
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, *args):
+        self.count += 1
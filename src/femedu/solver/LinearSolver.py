@@ -9,6 +9,7 @@ class LinearSolver(Solver):
 
     def __init__(self):
         super().__init__()
+        self.factorization = None   # ((banded, Kt values), solve function, inertia) of the last factorization
 
     def solve(self, **kwargs):
         r"""
@@ -21,6 +22,10 @@ class LinearSolver(Solver):
            The resulting forces may be out of equilibrium if the system experiences
            nonlinear behavior under the given load.
 
+        The factorization of the system stiffness is kept.  Repeated calls, e.g., for another
+        load factor or a modified load, only need a back-substitution as long as the stiffness and the
+        supports remain unchanged (see :py:meth:`factorize`).
+
         """
         self.resetDisplacements()
         self.assemble()
@@ -40,7 +45,8 @@ class LinearSolver(Solver):
         if self.hasConstraint:
 
             # solve for displacement update: a single Newton step
-            dQ = np.linalg.solve(self.Kt, np.stack([self.R, self.P]).T)
+            solve = self.factorize()
+            dQ = solve(np.stack([self.R, self.P]).T)
 
             if self.useArcLength:
                 # arc-length control
@@ -64,15 +70,36 @@ class LinearSolver(Solver):
 
         else:
             # solve for displacement update: a single Newton step
-            dU = np.linalg.solve(self.Kt, self.R)
+            solve = self.factorize()
+            dU = solve(self.R)
 
         self.U = dU
 
         # update nodal displacements
-        for node in self.nodes:
-            idxK = node.getIdx4DOFs()
-            node._updateDisp(dU[idxK])
+        self.updateDisplacements(dU)
+
+
+    def factorize(self):
+        r"""
+        inherited from :code:`Solver` class.
+
+        The factorization is reused as long as :code:`Kt` is unchanged, which is the rule for
+        linear elements (see :py:meth:`Element.hasConstantStiffness`) and unchanged supports.
+        """
+        # band storage (see setMatrixStorage) is compared by its data array
+        banded = issparse(self.Kt)
+        values = self.Kt.data if banded else self.Kt
+
+        if self.factorization is not None:
+            Kt, solve, inertia = self.factorization
+            if Kt[0] == banded and np.array_equal(Kt[1], values):
+                self.inertia = inertia
+                return solve
+
+        solve = super(LinearSolver, self).factorize()
+        self.factorization = ((banded, np.array(values, copy=True)), solve, self.inertia)
 
+        return solve
 
     def assemble(self, force_only=False):
         r"""
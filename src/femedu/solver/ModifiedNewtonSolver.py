@@ -0,0 +1,189 @@
+import numpy as np
+
+from ..solver.NewtonRaphsonSolver import NewtonRaphsonSolver
+
+class ModifiedNewtonSolver(NewtonRaphsonSolver):
+    r"""
+    A modified Newton-Raphson solver for general nonlinear analysis.
+
+    The solver keeps the factorization of the tangent stiffness, :math:`{\bf K}_t`, and
+    reuses it for as many iterations as the refactorization policy allows.
+    Iterations using a previous factorization only evaluate the residual force, i.e., they skip
+    the assembly of the tangent stiffness and its factorization.
+
+    .. list-table:: refactorization policies
+        :header-rows: 1
+
+        * - policy
+          - the tangent stiffness is assembled and factorized ...
+        * - **'step'**
+          - at the start of every load step (default)
+        * - **'iteration'**
+          - every **interval** iterations (:code:`interval=1` recovers the full Newton-Raphson method)
+        * - **'contraction'**
+          - whenever the residual contraction rate, :math:`||{\bf R}_{k}|| / ||{\bf R}_{k-1}||`,
+            exceeds **contraction**, i.e., whenever convergence becomes too slow.
+            The tangent stiffness is assembled with the residual of the next iteration,
+            so that every iteration evaluates the elements only once.
+
+    Displacement control and arc-length control are supported the same way as by
+    :py:class:`NewtonRaphsonSolver`.
+
+    .. note::
+
+        :code:`Kt` holds the tangent stiffness of the last factorization.
+        Stability checks, e.g., through :py:meth:`System.trackStability`, use that matrix.
+
+    :param policy: refactorization policy, one of **'step'**, **'iteration'**, or **'contraction'**
+    :param interval: number of iterations between factorizations (policy **'iteration'**)
+    :param contraction: largest acceptable residual contraction rate (policy **'contraction'**)
+    """
+
+    POLICIES = ('step', 'iteration', 'contraction')
+
+    def __init__(self, policy='step', interval=1, contraction=0.5):
+        super(ModifiedNewtonSolver, self).__init__()
+
+        self.factor     = None      # solve function from the last factorization
+        self.iterations = 0         # iterations since the last factorization
+
+        self.setRefactorizationPolicy(policy, interval=interval, contraction=contraction)
+
+    def setRefactorizationPolicy(self, policy='step', interval=1, contraction=0.5):
+        r"""
+        Set the policy for updating the factorization of the tangent stiffness.
+
+        :param policy: refactorization policy, one of **'step'**, **'iteration'**, or **'contraction'**
+        :param interval: number of iterations between factorizations (policy **'iteration'**)
+        :param contraction: largest acceptable residual contraction rate (policy **'contraction'**)
+        """
+        if policy not in self.POLICIES:
+            msg = f"unknown refactorization policy '{policy}': use one of {self.POLICIES}"
+            raise TypeError(msg)
+
+        if not isinstance(interval, int) or interval < 1:
+            msg = "interval must be a positive int"
+            raise TypeError(msg)
+
+        if contraction <= 0.0:
+            msg = "contraction must be a positive number"
+            raise TypeError(msg)
+
+        self.policy      = policy
+        self.interval    = interval
+        self.contraction = contraction
+
+    def resetFactorization(self):
+        r"""
+        Discard the current factorization.  The tangent stiffness will be factorized
+        during the next iteration, independent of the refactorization policy.
+        """
+        self.factor     = None
+        self.iterations = 0
+
+    def resetAssemblyMap(self):
+        r"""
+        inherited from :code:`Solver` class.
+
+        Also discards the current factorization.
+        """
+        super(ModifiedNewtonSolver, self).resetAssemblyMap()
+        self.resetFactorization()
+
+    def solve(self, max_steps=10, verbose=False, **kwargs):
+        r"""
+        :param max_step: maximum number of iterations (int)
+        :param verbose: set to :code:`True` for additional information
+        """
+        TOL = self.TOL
+
+        if 'tol' in kwargs:
+            TOL = kwargs['tol']
+        if 'tolerance' in kwargs:
+            TOL = kwargs['tolerance']
+
+        normR_last = None
+        too_slow   = False
+
+        self.num_iterations = max_steps
+
+        for k in range(max_steps):
+
+            refactor = self.needsFactorization(k) or too_slow
+
+            # compute the residual force; the tangent stiffness only if needed
+            normR = self.checkResiduum(verbose, force_only=not refactor)
+
+            if normR < TOL:
+                # we achieved convergence
+                self.num_iterations = k
+                #
+                # now broadcast that we can switch to this converged state
+                self.on_converged()
+
+                # time to add the information to the recorded data
+                if self.record:
+                    self.recordThisStep()
+
+                break  # converged! break the iteration loop
+
+            # convergence is too slow: update the tangent stiffness during the next sweep
+            too_slow = (self.policy == 'contraction'
+                        and normR_last is not None and normR > self.contraction * normR_last)
+
+            if refactor:
+                self.factor     = self.factorize()
+                self.iterations = 0
+
+            # Solve for equilibrium
+            self.solveSingleStep(solve=self.factor)
+
+            self.iterations += 1
+            normR_last = normR
+
+        print('+')
+
+        if normR > TOL:
+            # we failed to converge
+            #
+            # back to safety: revert to the last converged step
+            self.revert()
+
+        return normR
+
+    def initArcLength(self, load_increment=1., alpha=0.0, tolerance=1.0e-12, max_steps=100):
+        r"""
+        inherited from :code:`NewtonRaphsonSolver` class.
+
+        The calibration solves use a larger iteration budget since
+        a reused factorization converges linearly only.
+
+        :param load_increment:   load increment used to calibrate the constraint
+        :param alpha:            load contribution factor
+        :param tolerance:        convergence tolerance
+        :param max_steps:        maximum number of iterations for each calibration solve
+        :raises RuntimeError:    if the calibration step does not converge
+        """
+        super(ModifiedNewtonSolver, self).initArcLength(load_increment=load_increment, alpha=alpha,
+                                                        tolerance=tolerance, max_steps=max_steps)
+
+    def needsFactorization(self, iteration):
+        r"""
+        Apply the refactorization policy.
+
+        Called by **solve()**. (internal use only)
+
+        :param iteration: iteration count within the current load step
+        :returns: **True** if the tangent stiffness shall be assembled and factorized
+        """
+        if self.factor is None:
+            return True
+
+        if self.policy == 'step':
+            return iteration == 0
+
+        if self.policy == 'iteration':
+            return self.iterations >= self.interval
+
+        # 'contraction' is checked once the residual is known
+        return False
@@ -10,11 +10,66 @@ class NewtonRaphsonSolver(Solver):
     The implementation is stable and relatively easy to read, though, it comes at the cost of
     a full storage demand for the stiffness matrix.
 
+    Under load control, the Newton increment may be scaled by a line search (see :py:meth:`setLineSearch`).
+
     """
 
+    LINE_SEARCH_METHODS = (None, 'armijo', 'energy')
+
     def __init__(self):
         super(NewtonRaphsonSolver, self).__init__()
 
+        self.setLineSearch(None)
+
+    def setLineSearch(self, method='armijo', max_steps=5, tolerance=None):
+        r"""
+        Select a line search for the Newton increment, :math:`\Delta{\bf U}`.
+        The displacements are updated by :math:`\eta\:\Delta{\bf U}`, where the step length :math:`\eta \le 1`
+        is found from trial residuals, :math:`{\bf R}(\eta) = {\bf R}({\bf U} + \eta\:\Delta{\bf U})`.
+        Each trial only assembles internal forces (no tangent stiffness).
+
+        .. list-table:: line search methods
+            :header-rows: 1
+
+            * - method
+              - accepted step length
+            * - **None**
+              - no line search: always :math:`\eta=1` (default)
+            * - **'armijo'**
+              - backtracking until :math:`||{\bf R}(\eta)|| \le (1 - c\:\eta)\: ||{\bf R}(0)||` with :math:`c` = **tolerance**
+                (default: :math:`10^{-4}`)
+            * - **'energy'**
+              - secant search for a stationary energy along the increment, until
+                :math:`|\Delta{\bf U}\cdot{\bf R}(\eta)| \le \rho\: |\Delta{\bf U}\cdot{\bf R}(0)|` with :math:`\rho` = **tolerance**
+                (default: 0.5)
+
+        The full step, :math:`\eta=1`, is tried first.  If **'armijo'** finds no sufficient decrease within
+        **max_steps** trials, the full step is used.  **'energy'** uses the last trial step length.
+
+        .. note::
+
+            The line search costs one internal force assembly per trial.
+            It is not used with displacement control or arc-length control.
+
+        :param method: one of **None**, **'armijo'**, or **'energy'**
+        :param max_steps: maximum number of trial residuals per Newton step
+        :param tolerance: acceptance parameter of the selected method
+        """
+        if method not in self.LINE_SEARCH_METHODS:
+            msg = f"unknown line search method '{method}': use one of {self.LINE_SEARCH_METHODS}"
+            raise TypeError(msg)
+
+        if not isinstance(max_steps, int) or max_steps < 1:
+            msg = "max_steps must be a positive int"
+            raise TypeError(msg)
+
+        if tolerance is None:
+            tolerance = 0.5 if method == 'energy' else 1.0e-4
+
+        self.line_search = method
+        self.line_search_steps = max_steps
+        self.line_search_tol   = tolerance
+
     def solve(self, max_steps=10, verbose=False, **kwargs):
         r"""
         :param max_step: maximum number of iterations (int)
@@ -27,10 +82,9 @@ class NewtonRaphsonSolver(Solver):
         if 'tolerance' in kwargs:
             TOL = kwargs['tolerance']
 
-        for k in range(max_steps):
+        self.num_iterations = max_steps
 
-        # compute force vector and tangent stiffness
-            self.assemble()
+        for k in range(max_steps):
 
             # vals=(
             #     np.sum(self.P), np.linalg.norm(self.P),
@@ -38,11 +92,12 @@ class NewtonRaphsonSolver(Solver):
             # )
             # print("assembly has sum(P)={:.3g}   norm(P)={:.3g}   sum(R)={:.3g}   norm(R)={:.3g}".format(*vals))
 
-            # we are using , force_only=False and simply reuse self.Kt from that run (!)
+            # compute residual force, tangent stiffness, and constraint in a single assembly
             normR = self.checkResiduum(verbose, force_only=False)
 
             if normR < TOL:
                 # we achieved convergence
+                self.num_iterations = k
                 #
                 # now broadcast that we can switch to this converged state
                 self.on_converged()
@@ -66,18 +121,24 @@ class NewtonRaphsonSolver(Solver):
 
         return normR
 
-    def solveSingleStep(self):
+    def solveSingleStep(self, solve=None):
         r"""
         Helper function performing a single solution of the linearized system
 
         Called by **solve()**. (internal use only)
+
+        :param solve: optional function returning :math:`{\bf K}_t^{-1}{\bf b}`, e.g., from :py:meth:`factorize`.
+                      Defaults to :py:meth:`factorize` of the current :code:`Kt`.
+        :returns: the displacement update, :math:`\Delta{\bf U}`
         """
+        if solve is None:
+            solve = self.factorize()
 
         # are we doing displacement control?
         if self.hasConstraint:
 
             # solve for displacement update: a single Newton step
-            dQ = np.linalg.solve(self.Kt, np.stack([self.R, self.P]).T)
+            dQ = solve(np.stack([self.R, self.P]).T)
 
             if self.useArcLength:
                 # arc-length control
@@ -85,11 +146,10 @@ class NewtonRaphsonSolver(Solver):
                 denum = 2.*self.alpha * dload * self.P @ self.P
                 numerator = self.g
 
-                for node in self.nodes:
-                    idx = node.getIdx4DOFs()
-                    delU = node.getDeltaU()
-                    denum     += 2.*np.dot(dQ[idx,1], delU)
-                    numerator -= 2.*np.dot(dQ[idx,0], delU)
+                state = self.getDisplacementState()
+                delU  = state.getDeltaU()
+                denum     += 2.*np.dot(dQ[:state.ndof,1], delU)
+                numerator -= 2.*np.dot(dQ[:state.ndof,0], delU)
 
                 dlam = numerator / denum
 
@@ -106,12 +166,80 @@ class NewtonRaphsonSolver(Solver):
 
         else:
             # solve for displacement update: a single Newton step
-            dU = np.linalg.solve(self.Kt, self.R)
+            dU = solve(self.R)
+
+            if self.line_search:
+                return self.lineSearch(dU)
 
         # update nodal displacements
-        for node in self.nodes:
-            idxK = node.getIdx4DOFs()
-            node._updateDisp(dU[idxK])
+        self.updateDisplacements(dU)
+
+        return dU
+
+    def lineSearch(self, dU):
+        r"""
+        Scale the Newton increment, **dU**, following the selected line search method
+        (see :py:meth:`setLineSearch`) and apply it to the nodes.
+
+        Called by **solveSingleStep()**. (internal use only)
+
+        :param dU: full Newton increment, :math:`\Delta{\bf U}`
+        :returns: the applied displacement update, :math:`\eta\:\Delta{\bf U}`
+        """
+        free = self.getFreeDOFs()
+
+        norm0 = np.linalg.norm(self.R)
+        s0    = dU[free] @ self.R[free]
+
+        eta     = 1.0
+        applied = 0.0
+
+        for k in range(self.line_search_steps):
+
+            self.updateDisplacements((eta - applied) * dU)
+            applied = eta
+
+            normR = self.checkResiduum(force_only=True)
+
+            if self.line_search == 'armijo':
+                if normR <= (1. - self.line_search_tol * eta) * norm0:
+                    break
+
+                if k == 0:
+                    full_step_ok = np.isfinite(normR)
+
+                if k == self.line_search_steps - 1:
+                    if full_step_ok:
+                        # no sufficient decrease along dU: fall back to the full Newton step
+                        self.updateDisplacements((1. - applied) * dU)
+                        applied = 1.0
+                        self.checkResiduum(force_only=True)
+                    break
+
+                if np.isfinite(normR):
+                    # minimum of a quadratic model of ||R(eta)||^2, kept within [0.1, 0.5] eta
+                    f0, f1 = norm0**2, normR**2
+                    eta_q = eta * eta * f0 / (f1 - f0 + 2. * eta * f0)
+                    eta = min(max(eta_q, 0.1 * eta), 0.5 * eta)
+                else:
+                    eta *= 0.5
+
+            else:
+                s = dU[free] @ self.R[free]
+
+                if not np.isfinite(s):
+                    eta *= 0.5
+                    continue
+
+                if abs(s) <= self.line_search_tol * abs(s0) or s * s0 > 0.0:
+                    # (nearly) stationary, or the energy still decreases at the largest step length
+                    break
+
+                # secant estimate of s(eta) = 0, kept within [0.1, 1] eta
+                eta_s = eta * s0 / (s0 - s)
+                eta = min(max(eta_s, 0.1 * eta), eta)
+
+        return applied * dU
 
     def assemble(self, force_only=False):
         r"""
@@ -183,7 +311,7 @@ class NewtonRaphsonSolver(Solver):
 
     # arc-length control
 
-    def initArcLength(self, load_increment=1., alpha=0.0, tolerance=1.0e-12):
+    def initArcLength(self, load_increment=1., alpha=0.0, tolerance=1.0e-12, max_steps=10):
         r"""
         Initializes parameters for the arc-length constraint.
 
@@ -195,6 +323,8 @@ class NewtonRaphsonSolver(Solver):
         :param load_increment:   load increment used to calibrate the constraint
         :param alpha:            load contribution factor
         :param tolerance:        convergence tolerance
+        :param max_steps:        maximum number of iterations for each calibration solve
+        :raises RuntimeError:    if the calibration step does not converge
         """
 
         # store analysis parameter(s)
@@ -202,17 +332,21 @@ class NewtonRaphsonSolver(Solver):
         self.TOL   = tolerance
 
         # make sure we start at an equilibrium point
-        self.solve()
+        self.solve(max_steps=max_steps)
 
         # use load control to solve for the new equilibrium state
         self.hasConstraint = False          # this forces load control
         self.loadfactor += load_increment   # add reference load level
-        self.solve()                        # find equilibrium configuration for given load level
+        normR = self.solve(max_steps=max_steps)   # find equilibrium configuration for given load level
+
+        if normR > self.TOL:
+            # the step has been reverted: the arc-length would be calibrated from the load alone
+            msg = f"arc-length calibration did not converge within {max_steps} iterations (normR={normR:.3e})"
+            raise RuntimeError(msg)
 
         # compute the arc-length for that step and store as target arc length
         g = self.alpha * load_increment**2 * self.P@self.P
-        for node in self.nodes:
-            g += node.getNormDeltaU2(previous_step=True)
+        g += self.getDisplacementState().getNormDeltaU2(previous_step=True)
         self.arclength2 = g                 # target arc-length
 
         # set solver parameters
@@ -241,6 +375,7 @@ class NewtonRaphsonSolver(Solver):
         self.useArcLength  = True
 
         # set suitable trial state
+        self.getDisplacementState().setTrialState()
         for node in self.nodes:
             node.setTrialState()
 
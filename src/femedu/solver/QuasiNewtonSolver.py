@@ -0,0 +1,166 @@
+import numpy as np
+
+from ..solver.ModifiedNewtonSolver import ModifiedNewtonSolver
+
+class QuasiNewtonSolver(ModifiedNewtonSolver):
+    r"""
+    A quasi-Newton solver for general nonlinear analysis.
+
+    The tangent stiffness is assembled and factorized following the refactorization policy
+    of :py:class:`ModifiedNewtonSolver`.  All other iterations only evaluate the residual force and
+    improve the inverse of the last factorized tangent, :math:`{\bf H}_0 = {\bf K}_t^{-1}`, by low-rank
+    updates built from the secant pairs
+
+    .. math::
+
+       {\bf s}_k = \Delta{\bf U}_k, \qquad {\bf y}_k = {\bf F}_{k+1} - {\bf F}_k
+
+    where :math:`{\bf F}` is the internal force vector.
+
+    .. list-table:: update methods
+        :header-rows: 1
+
+        * - method
+          - inverse update
+        * - **'bfgs'**
+          - BFGS update for symmetric tangents (default).  Pairs violating the curvature condition,
+            :math:`{\bf s}_k\cdot{\bf y}_k > 0`, are skipped.
+        * - **'broyden'**
+          - Broyden's (good) update for unsymmetric tangents
+
+    The updates are never formed explicitly.  Instead, the secant pairs are stored and applied
+    on top of the factorization.  With a limited **memory**, BFGS keeps only the most recent pairs
+    (L-BFGS), while Broyden triggers a refactorization once the memory is exhausted.
+
+    :param method: update method, **'bfgs'** or **'broyden'**
+    :param memory: maximum number of stored secant pairs (**None**: all pairs since the last factorization)
+    :param policy: refactorization policy, see :py:class:`ModifiedNewtonSolver`
+    :param interval: number of iterations between factorizations (policy **'iteration'**)
+    :param contraction: largest acceptable residual contraction rate (policy **'contraction'**)
+    """
+
+    METHODS = ('bfgs', 'broyden')
+
+    def __init__(self, method='bfgs', memory=None, policy='step', interval=1, contraction=0.5):
+        super(QuasiNewtonSolver, self).__init__(policy=policy, interval=interval, contraction=contraction)
+
+        if method not in self.METHODS:
+            msg = f"unknown quasi-Newton method '{method}': use one of {self.METHODS}"
+            raise TypeError(msg)
+
+        if memory is not None and (not isinstance(memory, int) or memory < 1):
+            msg = "memory must be a positive int or None"
+            raise TypeError(msg)
+
+        self.method = method
+        self.memory = memory
+
+        self.pairs = []         # stored update vectors
+        self.last  = None       # (displacement update, internal force) from the previous iteration
+
+    def resetFactorization(self):
+        r"""
+        inherited from :code:`ModifiedNewtonSolver` class.
+
+        Also discards all stored secant pairs.
+        """
+        super(QuasiNewtonSolver, self).resetFactorization()
+        self.pairs = []
+        self.last  = None
+
+    def solveSingleStep(self, solve=None):
+        r"""
+        Helper function performing a single quasi-Newton step.
+
+        Called by **solve()**. (internal use only)
+
+        :param solve: function returning :math:`{\bf K}_t^{-1}{\bf b}` from the last factorization
+        :returns: the displacement update, :math:`\Delta{\bf U}`
+        """
+        F = self.loadfactor * self.P - self.R
+
+        if self.iterations == 0:
+            # fresh factorization: start over
+            self.pairs = []
+        elif self.last is not None:
+            self.addPair(self.last[0], F - self.last[1], solve)
+
+        dU = super(QuasiNewtonSolver, self).solveSingleStep(
+                    solve=lambda b: self.applyInverse(b, solve))
+
+        self.last = (dU, F)
+
+        return dU
+
+    def addPair(self, s, y, solve):
+        r"""
+        Add a secant pair to the inverse update.
+
+        Called by **solveSingleStep()**. (internal use only)
+
+        :param s: displacement update from the previous iteration
+        :param y: associated change of the internal force vector
+        :param solve: function returning :math:`{\bf K}_t^{-1}{\bf b}` from the last factorization
+        """
+        # fixed d.o.f.s do not contribute a force: keep the factorized stiffness there
+        idx, _ = self.getFixedDOFs()
+        if len(idx):
+            y = y.copy()
+            y[idx] = s[idx]
+
+        if self.method == 'bfgs':
+            sy = s @ y
+            if sy <= 1.0e-12 * np.linalg.norm(s) * np.linalg.norm(y):
+                # curvature condition violated: skip this pair
+                return
+
+            if self.memory and len(self.pairs) >= self.memory:
+                self.pairs.pop(0)
+
+            self.pairs.append((s, y, 1./sy))
+
+        else:
+            if self.memory and len(self.pairs) >= self.memory:
+                # memory exhausted: refactorize during the next iteration
+                self.factor = None
+                return
+
+            Hy  = self.applyInverse(y, solve)
+            sHy = s @ Hy
+            if abs(sHy) <= 1.0e-12 * np.linalg.norm(s) * np.linalg.norm(Hy):
+                return
+
+            self.pairs.append((s, (s - Hy) / sHy))
+
+    def applyInverse(self, b, solve):
+        r"""
+        Apply the updated inverse, :math:`{\bf H}_k`, to one or more right hand sides.
+
+        :param b: right hand side vector, or an array with one right hand side per column
+        :param solve: function returning :math:`{\bf K}_t^{-1}{\bf b}` from the last factorization
+        :returns: :math:`{\bf H}_k\:{\bf b}`
+        """
+        if np.ndim(b) > 1:
+            return np.column_stack([ self.applyInverse(b[:,j], solve) for j in range(b.shape[1]) ])
+
+        if self.method == 'bfgs':
+            # two-loop recursion
+            q = b.copy()
+            alpha = []
+            for s, y, rho in reversed(self.pairs):
+                a = rho * (s @ q)
+                q -= a * y
+                alpha.append(a)
+
+            h = solve(q)
+            for (s, y, rho), a in zip(self.pairs, reversed(alpha)):
+                beta = rho * (y @ h)
+                h += (a - beta) * s
+
+        else:
+            # product form of Broyden's update
+            h = solve(b)
+            for s, u in self.pairs:
+                h += u * (s @ h)
+
+        return h
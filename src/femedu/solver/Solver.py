@@ -1,9 +1,21 @@
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import scipy as sc
+from scipy.linalg import cho_factor, cho_solve, lu_factor, lu_solve, ldl, solve_triangular, solve_banded, LinAlgError
+from scipy.linalg import cholesky_banded, cho_solve_banded
+from scipy.linalg.lapack import dgbtrf, dgbtrs
+from scipy.sparse import issparse, csc_array
+from scipy.sparse.linalg import splu, eigsh
 
 import matplotlib.pyplot as plt
 
+from .AssemblyMap import AssemblyMap
+from .DisplacementState import DisplacementState
+from ..materials.MaterialStore import MaterialStore
+
 class Solver():
     r"""
     Abstract class for any solver implementation.
@@ -27,9 +39,25 @@ class Solver():
         self.nodes       = []       # list of node pointers
         self.constraints = []       # list of constraint pointers
         self.sdof = 0               # number of DOFs in the current system
+        self.assembly_map = None    # element-to-global scatter map (see AssemblyMap)
+        self.state = None           # system-level nodal displacements (see DisplacementState)
+        self.batching = True        # evaluate supported element types in batches (see ElementGroup)
+        self.dof_ordering = 'rcm'   # node ordering for the d.o.f. numbering (see AssemblyMap.nodeOrdering)
+        self.storage = 'dense'      # storage of Kt: 'dense', 'banded', or 'auto' (see setMatrixStorage)
+        self.workers = 1            # number of threads evaluating elements (see setWorkers)
+        self.executor = None        # persistent thread pool, if workers > 1
+        self.Kt = None              # tangent stiffness of the last assembly
+        self.inertia = None         # inertia of Kt, if known from its factorization
+        self.buckling_modes = None  # (critical load factors, mode shapes) from solveBuckling()
+
+        # linear load cases (see addLoadCase)
+        self.load_cases = {}        # reference load vector of every load case
+        self.load_case_map = None   # AssemblyMap the load vectors refer to
+        self.load_case_results = {} # (displacements, reactions) of every solved load case
 
         # numeric iteration tolerance
         self.TOL = 1.0e-6
+        self.num_iterations = 0     # iterations needed by the last call to solve()
 
         # displacement control
         self.hasConstraint = False
@@ -182,92 +210,712 @@ class Solver():
         :param force_only: set to **True** if only the residual force needs to be assembled
         """
 
-        # compute size parameters
-        ndof = 0
-        for node in self.nodes:
-            if node.isLead():
-                node.setStart(ndof)
-                ndof += node.ndofs
-
-        for constraint in self.constraints:
-            constraint.setStart(ndof)
-            ndof += constraint.countConditions()
+        # fetch the scatter map (computes size parameters and dof numbering)
+        amap = self.getAssemblyMap()
+        ndof = amap.ndof
 
         self.sdof = ndof  # number of system d.o.f.s
 
         Psys = np.zeros(ndof)           # reference load vector (without load factor)
-        Fsys = np.zeros(ndof)           # system internal force vector
-        Ksys = np.zeros((ndof, ndof))   # system tangent stiffness matrix
+
+        # assemble loads
+        for node in self.nodes:
+            if node.isLead() and node.hasLoad():
+                # idx = node.start + np.arange(node.ndofs)
+                idx = node.getIdx4DOFs()
+                Psys[idx] += node.getLoad()
+
+        # Element Loop: assemble element forces and stiffness
+        Pe, Fsys, Kdata = self.collectElementContributions(force_only=force_only)
+
+        Psys += Pe
+
+        if not force_only:
+            # system tangent stiffness matrix
+            if self.useBandedStorage():
+                Ksys = amap.assembleBanded(Kdata)
+            else:
+                Ksys = amap.assembleDense(Kdata)
+
+        # system residual force vector
+        self.P = Psys
+        self.R = self.loadfactor * Psys - Fsys
+
+        # apply boundary conditions
+        if force_only:
+            self.applyBoundaryConditions()
+        else:
+            self.Kt = self.applyBoundaryConditions(Ksys)
+            self.inertia = None
 
         # displacement control or arc-length control
+        self.evaluateConstraint()
+
+    def applyBoundaryConditions(self, Ksys=None):
+        r"""
+        Eliminate all prescribed d.o.f.s from the linearized system.
+
+        The system d.o.f.s are partitioned into free (:math:`f`) and prescribed (:math:`p`) d.o.f.s.
+        Only the free d.o.f.s are solved for, while the prescribed increment is imposed directly:
+
+        .. math::
+
+           {\bf K}_{ff}\:\Delta{\bf U}_f = {\bf R}_f - {\bf K}_{fp}\:\Delta\bar{\bf U}_p,
+           \qquad
+           \Delta{\bf U}_p = \Delta\bar{\bf U}_p
+
+        The system matrix keeps its size: :math:`{\bf K}_{fp}` and :math:`{\bf K}_{pf}` are set to zero and
+        :math:`{\bf K}_{pp}` is replaced by the identity, i.e., no penalty values are involved.
+        Hence, the factorization of the full-size matrix yields that of :math:`{\bf K}_{ff}`, and
+        displacement control, arc-length control, and the node updates keep working on system vectors.
+        For a dense matrix, this costs one pass over the prescribed rows and columns; only columns with
+        a nonzero prescribed increment enter the right-hand side.
+        The residuum at prescribed d.o.f.s is replaced by :math:`\Delta\bar{\bf U}_p`.
+        Loads acting on prescribed d.o.f.s are carried by the supports and removed from the reference load, :code:`self.P`.
+
+        If no matrix is given, only the reference load is modified and the residuum
+        at prescribed d.o.f.s holds the support reactions.
+
+        :param Ksys: system stiffness matrix, either a full (dense) array or a sparse matrix
+                     assembled by :py:meth:`AssemblyMap.assembleCSC` or :py:meth:`AssemblyMap.assembleBanded`.
+                     It is modified in place.
+        :returns: the modified system stiffness matrix
+        """
+        idx, du = self.getFixedDOFs()
+
+        amap = self.getAssemblyMap()
+        amap.partition(idx)
+
+        self.P[idx] = 0.0
+
+        if Ksys is None or not len(idx):
+            return Ksys
+
+        if issparse(Ksys) and Ksys.format == 'dia':
+            self.R -= amap.eliminateBanded(idx, du, Ksys)
+        elif issparse(Ksys):
+            self.R -= amap.eliminate(idx, du, Ksys)
+        else:
+            moved = du != 0.0
+            if moved.any():
+                self.R -= Ksys[:, idx[moved]] @ du[moved]
+
+            Ksys[:, idx]   = 0.0    # the range might need adjustment for constraints
+            Ksys[idx, :]   = 0.0    # the range might need adjustment for constraints
+            Ksys[idx, idx] = 1.0
+
+        self.R[idx] = du
+
+        return Ksys
+
+    def evaluateConstraint(self):
+        r"""
+        Evaluate the control constraint, :math:`g`, at the current state.
+
+        * displacement control: :math:`g = \bar u - u_{\mathtt{ctrl}}`
+        * arc-length control: :math:`g = \Delta s^2 - \alpha (\lambda-\lambda_n)^2 \:{\bf P}\cdot{\bf P} - ({\bf u} - {\bf u}_n)\cdot({\bf u} - {\bf u}_n)`
+        * load control: :math:`g = 0`
+
+        Called during assembly, once the reference load :code:`self.P` is known.
+
+        :returns: the constraint value, :math:`g`
+        """
         if self.hasConstraint:
             if self.useArcLength:
                 # arc-length control
                 dload = self.loadfactor - self.loadfactor_n
                 self.g = self.arclength2 - self.alpha * dload*dload * self.P@self.P
-                for node in self.nodes:
-                    self.g -= node.getNormDeltaU2()
+                self.g -= self.getDisplacementState().getNormDeltaU2()
             else:
-                self.g = self.control_node.getDisp(self.control_dof) - self.targetU
+                # displacement control
+                self.g = self.targetU - self.control_node.getDisp(self.control_dof)[0]
+        else:
+            self.g = 0.0
+
+        return self.g
+
+    def updateDisplacements(self, dU):
+        r"""
+        Add the displacement update, :math:`\Delta{\bf U}`, to all nodes.
+
+        :param dU: system vector of displacement updates
+        """
+        self.getDisplacementState().update(dU)
+
+    def getFreeDOFs(self):
+        r"""
+        :returns: system indices of all free (not prescribed) d.o.f.s
+        """
+        amap = self.getAssemblyMap()
+        amap.partition(self.getFixedDOFs()[0])
+        return amap.free
+
+    def getReducedStiffness(self):
+        r"""
+        :returns: the tangent stiffness of the free d.o.f.s, :math:`{\bf K}_{ff}`,
+                  stored the same way as :code:`self.Kt` (dense or sparse)
+        """
+        free = self.getFreeDOFs()
+        Kt = self.Kt
+        if issparse(Kt) and Kt.format == 'dia':
+            Kt = csc_array(Kt)    # band storage does not support indexing
+        return Kt[free, :][:, free]
+
+    def getFixedDOFs(self):
+        r"""
+        Collect all restrained d.o.f.s of the system.
+
+        The prescribed displacement is returned as the correction still needed
+        to reach the prescribed value, :math:`\bar u - u`, hence, is zero once that value has been reached.
+
+        :returns: tuple (system indices of all fixed d.o.f.s, outstanding prescribed displacements)
+        """
+        idx = []
+        du  = []
 
-        # assemble loads
         for node in self.nodes:
-            if node.isLead() and node.hasLoad():
-                # idx = node.start + np.arange(node.ndofs)
-                idx = node.getIdx4DOFs()
-                Psys[idx] += node.getLoad()
+            if not node.isLead():
+                continue
+            for dof in node.dofs:
+                if node.isFixed(dof):
+                    idx.append(node.getIdx4DOFs(dofs=[dof])[0])
+                    ubar = node.getFixedDisp(dof, local=True)[0]
+                    u    = node.getDisp(dof, local=True)[0]
+                    du.append(ubar - u)
+
+        return (np.array(idx, dtype=int), np.array(du, dtype=np.float64))
+
+    def factorize(self):
+        r"""
+        Factorize the current tangent stiffness, :code:`self.Kt`.
 
-        # Element Loop: assemble element forces and stiffness
-        for element in self.elements:
+        * dense, symmetric :code:`Kt`: Cholesky decomposition, falling back to a symmetric indefinite
+          (Bunch-Kaufman) :math:`{\bf L}{\bf D}{\bf L}^T` decomposition if :code:`Kt` is not positive definite
+        * dense, unsymmetric :code:`Kt`: LU decomposition
+        * banded :code:`Kt` (see :py:meth:`setMatrixStorage`): banded Cholesky decomposition if :code:`Kt` is symmetric
+          and positive definite, banded LU decomposition (LAPACK :code:`dgbtrf`) otherwise
+        * sparse :code:`Kt`: sparse LU decomposition (:code:`scipy.sparse.linalg.splu`)
 
-            Fe = element.getForce()     # Element State Update occurs here
-            Pe = element.getLoad()      # Element State Update occurs here
+        The inertia of symmetric :code:`Kt` is read from the factorization, if available,
+        and stored for :py:meth:`getInertia`.
 
-            if not force_only:
-                Ke = element.getStiffness() # fetch element stiffness matrix as array of nodal matrices
+        Specialized solvers may overload this method.
 
-            for (i,ndI) in enumerate(element.nodes):
-                # fetch dof mapping for node I
-                idxK = ndI.getIdx4Element(element)
+        :returns: a function :code:`solve(b)` returning :math:`{\bf K}_t^{-1}{\bf b}` for one or more right hand sides
+        """
+        if issparse(self.Kt) and self.Kt.format == 'dia':
+            return self.factorizeBanded()
+
+        if issparse(self.Kt):
+            lu = splu(csc_array(self.Kt), options=dict(SymmetricMode=True, DiagPivotThresh=0.1))
+            self.setInertia(lu)
+            return lu.solve
+
+        Kt = np.asarray(self.Kt)
+
+        if np.allclose(Kt, Kt.T):
+            try:
+                factor = cho_factor(Kt)
+                self.setInertia(np.ones(Kt.shape[0]))
+                return lambda b: cho_solve(factor, b)
+            except LinAlgError:
+                pass
+
+            # symmetric indefinite: Kt[perm,perm] = L D L^T with 1x1 and 2x2 blocks in D
+            lu, D, perm = ldl(Kt)
+            L  = lu[perm]
+            ab = np.zeros((3, Kt.shape[0]))
+            ab[0, 1:]  = np.diag(D, 1)
+            ab[1]      = np.diag(D)
+            ab[2, :-1] = np.diag(D, -1)
+            self.setInertia(D)
+
+            def solve(b):
+                y = solve_triangular(L, b[perm], lower=True, unit_diagonal=True)
+                y = solve_banded((1, 1), ab, y)
+                x = np.empty_like(y)
+                x[perm] = solve_triangular(L.T, y, lower=False, unit_diagonal=True)
+                return x
+
+            return solve
+
+        factor = lu_factor(Kt)
+        return lambda b: lu_solve(factor, b)
+
+    def factorizeBanded(self):
+        r"""
+        Factorize the current tangent stiffness, :code:`self.Kt`, held in band storage.  (internal use only)
 
-                # system reference load vector
-                if isinstance(Pe[i], np.ndarray):
-                    # assemble the load vector
-                    Psys[idxK] += Pe[i]
+        Called by :py:meth:`factorize`.  The cost is :math:`O(n\,b^2)` for :math:`n` d.o.f.s and
+        half-bandwidth :math:`b`, and every solve costs :math:`O(n\,b)` per right-hand side.
 
-                # system residual force vector
-                Fsys[idxK] += Fe[i]
+        :returns: a function :code:`solve(b)` returning :math:`{\bf K}_t^{-1}{\bf b}` for one or more right hand sides
+        """
+        Kt   = self.Kt
+        bw   = self.getAssemblyMap().bandwidth
+        ab   = Kt.data
+        ndof = Kt.shape[0]
 
-                # system tangent stiffness matrix
-                if not force_only:
-                    for (j,ndJ) in enumerate(element.nodes):
-                        # fetch dof mapping for node J
-                        idxM = ndJ.getIdx4Element(element)
-                        # add to system matrix
-                        Ksys[idxK[:, np.newaxis], idxM] += Ke[i][j]
+        symmetric = all( np.allclose(ab[bw - d, d:], ab[bw + d, :ndof - d]) for d in range(1, bw + 1) )
 
-        # system residual force vector
-        self.P = Psys
-        self.R = self.loadfactor * Psys - Fsys
+        if symmetric:
+            try:
+                factor = cholesky_banded(ab[:bw + 1], lower=False)
+                self.setInertia(np.ones(ndof))
+                return lambda b: cho_solve_banded((factor, False), b)
+            except LinAlgError:
+                pass
+
+        # LU with partial pivoting needs bw additional rows for the fill-in
+        lab = np.zeros((3*bw + 1, ndof))
+        lab[bw:] = ab
+        lu, piv, info = dgbtrf(lab, bw, bw)
+
+        if info > 0:
+            msg = f"singular tangent stiffness: zero pivot at d.o.f. {info - 1}"
+            raise LinAlgError(msg)
+
+        def solve(b):
+            x, info = dgbtrs(lu, bw, bw, b, piv)
+            return x
+
+        return solve
+
+    def setInertia(self, pivots):
+        r"""
+        Store the inertia of :code:`self.Kt` from its factorization.  (internal use only)
+
+        By Sylvester's law of inertia, :math:`{\bf K}_t = {\bf L}{\bf D}{\bf L}^T` has as many negative, zero, and positive
+        eigenvalues as :math:`{\bf D}`.  A sparse LU factorization only provides that information
+        if all pivots were taken from the diagonal, i.e., if rows and columns were permuted alike.
+
+        :param pivots: one of
+
+            * the block diagonal matrix, :math:`{\bf D}`, of an :math:`{\bf L}{\bf D}{\bf L}^T` factorization
+            * an array of diagonal pivots
+            * a :code:`SuperLU` object returned by :code:`scipy.sparse.linalg.splu`
+        """
+        if hasattr(pivots, 'perm_r'):
+            if not np.array_equal(pivots.perm_r, pivots.perm_c):
+                # off-diagonal pivoting: inertia unknown
+                self.inertia = None
+                return
+            pivots = pivots.U.diagonal()
+        elif np.ndim(pivots) > 1:
+            # eigenvalues of the 1x1 and 2x2 blocks
+            pivots = sc.linalg.eigvalsh_tridiagonal(np.diag(pivots), np.diag(pivots, -1))
+
+        tol = 1.0e-12 * np.max(np.abs(pivots), initial=0.0)
+        negative = int(np.sum(pivots < -tol))
+        zero     = int(np.sum(np.abs(pivots) <= tol))
+
+        # every prescribed d.o.f. contributes a unit pivot to Kt
+        positive = len(self.getFreeDOFs()) - negative - zero
+
+        self.inertia = (negative, zero, positive)
+
+    def getInertia(self):
+        r"""
+        Inertia of the tangent stiffness of all free d.o.f.s, :math:`{\bf K}_{ff}`, i.e., the number of
+        negative, zero, and positive eigenvalues.
+
+        The inertia is read from the factorization the solver computed for the current :code:`Kt`.
+        Only if no such factorization exists, e.g., after the convergence check assembled a new :code:`Kt`,
+        a symmetric :math:`{\bf L}{\bf D}{\bf L}^T` factorization is computed.  No eigenvalues are needed.
+
+        A change in the number of negative eigenvalues between load steps indicates that a
+        limit point or a bifurcation point has been passed.
+
+        :returns: tuple (number of negative, zero, and positive eigenvalues of :math:`{\bf K}_{ff}`)
+        """
+        if self.inertia is None and self.Kt is not None:
+            Kt = self.Kt
+
+            if issparse(Kt):
+                try:
+                    # diagonal pivoting only, so that Kt[perm,perm] = L D L^T
+                    lu = splu(csc_array(Kt), permc_spec='MMD_AT_PLUS_A',
+                              options=dict(SymmetricMode=True, DiagPivotThresh=0.0))
+                    self.setInertia(lu)
+                except RuntimeError:
+                    # zero pivot
+                    pass
+
+                if self.inertia is None:
+                    Kt = Kt.toarray()
+
+            if not issparse(Kt):
+                _, D, _ = ldl(np.asarray(Kt))
+                self.setInertia(D)
+
+        return self.inertia
+
+    def getAssemblyMap(self):
+        r"""
+        Provides the element-to-global scatter map for the current model topology.
+
+        The map is built on first use and rebuilt only if the topology has changed.
+        Every new map also binds all nodes to a new :py:class:`DisplacementState`,
+        which takes over all pushed displacements from the previous state.
+
+        :returns: an :py:class:`AssemblyMap` object
+        """
+        if not (self.assembly_map and
+                self.assembly_map.isValid(self.nodes, self.elements, self.constraints)):
+            self.assembly_map = AssemblyMap(self.nodes, self.elements, self.constraints,
+                                            ordering=self.dof_ordering)
+            self.state = DisplacementState(self.nodes, previous=self.state)
+
+        return self.assembly_map
+
+    def getDisplacementState(self):
+        r"""
+        Provides the contiguous displacement vectors of all nodes for the current model topology.
+
+        :returns: a :py:class:`DisplacementState` object
+        """
+        self.getAssemblyMap()
+        return self.state
+
+    def getMaterialStores(self):
+        r"""
+        Provides the material stores holding the state of all material points of the model
+        (see :py:class:`MaterialStore`).  Stores are created during the first assembly.
+
+        :returns: list of :py:class:`MaterialStore` objects
+        """
+        amap = self.getAssemblyMap()
+        return amap.stores if amap.stores else []
+
+    def resetAssemblyMap(self):
+        r"""
+        Discard the current scatter map, including any sparsity pattern and ordering
+        derived from it.  It will be rebuilt during the next assembly.
+
+        This is called by :py:class:`System` whenever nodes, elements, or constraints are added.
+        """
+        self.assembly_map = None
+
+    def setDOFOrdering(self, method='rcm'):
+        r"""
+        Select the node ordering used to number the system d.o.f.s.
+
+        The numbering is computed once per topology from the node graph and used by all solvers.
+        A reverse Cuthill-McKee ordering (default) keeps the bandwidth of the system matrix small.
+        See :py:meth:`AssemblyMap.nodeOrdering` for all available methods.
+
+        :param method: **'rcm'**, **'mindegree'**, or **'natural'** (order in which nodes were added)
+        """
+        if method not in AssemblyMap.ORDERINGS:
+            msg = "unknown d.o.f. ordering '{}': use one of {}".format(method, AssemblyMap.ORDERINGS)
+            raise TypeError(msg)
+
+        self.dof_ordering = method
+        self.resetAssemblyMap()
+
+    def setMatrixStorage(self, storage='banded'):
+        r"""
+        Select the storage of the tangent stiffness, :code:`Kt`, for solvers using dense matrices.
+
+        .. list-table::
+            :header-rows: 1
+
+            * - storage
+              - description
+            * - **'dense'**
+              - full :code:`(n, n)` array (default)
+            * - **'banded'**
+              - LAPACK band storage, held as :code:`scipy.sparse.dia_array`.  Elements are assembled directly
+                into the band, which is factorized by banded Cholesky or LU decompositions.
+                Memory drops from :math:`O(n^2)` to :math:`O(n\,b)` and the factorization from
+                :math:`O(n^3)` to :math:`O(n\,b^2)` for half-bandwidth :math:`b`.
+            * - **'auto'**
+              - banded storage if the band is narrow compared to the size of the system
+
+        Long, thin structures, e.g., frames and trusses, have a small bandwidth
+        with the default d.o.f. numbering (see :py:meth:`setDOFOrdering`).
+
+        :param storage: **'dense'**, **'banded'**, or **'auto'**
+        """
+        if storage not in ('dense', 'banded', 'auto'):
+            msg = f"unknown matrix storage '{storage}': use 'dense', 'banded', or 'auto'"
+            raise TypeError(msg)
+
+        self.storage = storage
+
+    def useBandedStorage(self):
+        r"""
+        :returns: **True** if the tangent stiffness shall be assembled in band storage (see :py:meth:`setMatrixStorage`)
+        """
+        if self.storage == 'auto':
+            amap = self.getAssemblyMap()
+            return 4 * (2*amap.bandwidth + 1) <= amap.ndof
+        return self.storage == 'banded'
+
+    def setElementBatching(self, on=True):
+        r"""
+        Enable or disable batched evaluation of element groups.
+
+        If enabled (default), all elements of a type supporting batched evaluation
+        (see :py:class:`ElementGroup`) are stacked into arrays and evaluated together.
+        All other elements are always evaluated one by one.
+
+        :param on: **True** for batched evaluation, **False** for an element-by-element loop
+        """
+        self.batching = bool(on)
+
+        if self.assembly_map:
+            self.assembly_map.groups = None
+
+    def setWorkers(self, workers=None):
+        r"""
+        Evaluate elements on a persistent pool of worker threads.
+
+        Element groups (see :py:class:`ElementGroup`) and chunks of all other elements are evaluated concurrently.
+        NumPy releases the global interpreter lock in its array kernels, such that batched element groups
+        and elements with expensive material updates benefit most.
+        Every element writes its forces and stiffness to fixed positions of the assembly data, hence,
+        results do not depend on the number of workers.
+
+        Elements sharing a material object are always evaluated by the same worker, one after the other.
+
+        :param workers: number of worker threads.  **None** uses one thread per CPU, **1** (default)
+                        evaluates all elements in the calling thread.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        if int(workers) < 1:
+            msg = f"number of workers must be a positive integer, not {workers}"
+            raise TypeError(msg)
+
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+        self.workers = int(workers)
+
+        if self.workers > 1:
+            self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='femedu')
+
+        if self.assembly_map:
+            self.assembly_map.tasks = None
+
+    def partitionElements(self):
+        r"""
+        Partition all elements into tasks for concurrent evaluation (see :py:meth:`setWorkers`).  (internal use only)
+
+        Every element group forms a task, and all other elements are split into chunks of consecutive elements.
+        Tasks sharing a material object are merged, since a material object holds the state of a single material point.
+
+        :returns: list of tasks, each a tuple (list of element groups, list of element indices)
+        """
+        amap = self.getAssemblyMap()
+
+        if self.workers < 2:
+            return [ (amap.groups, amap.singles) ]
+
+        tasks = [ ([group], []) for group in amap.groups ]
+        nchunk = min(len(amap.singles), 4 * self.workers)
+        if nchunk:
+            tasks += [ ([], chunk.tolist()) for chunk in np.array_split(np.array(amap.singles, dtype=int), nchunk) ]
+
+        # merge tasks sharing a material object (union-find on task indices)
+        parent = list(range(len(tasks)))
+
+        def find(k):
+            while parent[k] != k:
+                parent[k] = parent[parent[k]]
+                k = parent[k]
+            return k
+
+        owner = {}
+        for k, (groups, singles) in enumerate(tasks):
+            elements = [ element for group in groups for element in group.elements ]
+            elements += [ self.elements[idx] for idx in singles ]
+
+            for element in elements:
+                for material in element.getMaterials():
+                    if material is not None:
+                        parent[find(k)] = find(owner.setdefault(id(material), k))
+
+        merged = {}
+        for k, (groups, singles) in enumerate(tasks):
+            task = merged.setdefault(find(k), ([], []))
+            task[0].extend(groups)
+            task[1].extend(singles)
+
+        return [ (groups, sorted(singles)) for groups, singles in merged.values() ]
+
+    def checkStiffnessCache(self):
+        r"""
+        Identify all elements with a valid cached stiffness.  (internal use only)
+
+        Elements with constant stiffness (see :py:meth:`Element.hasConstantStiffness`) are evaluated once.
+        Their stiffness data is reused by later assemblies as long as their material and transformations
+        remain unchanged (see :py:meth:`Element.getStiffnessKey`).  Internal forces are still obtained
+        from a state update, such that stresses and strains remain available for reporting.
+
+        :returns: boolean array, **True** for every element whose cached stiffness data may be used
+        """
+        amap = self.getAssemblyMap()
+
+        if amap.Kkeys is None:
+            amap.Kkeys  = [ None for element in self.elements ]
+            amap.Kcache = np.zeros(amap.mat_ptr[-1])
+
+        cached = np.zeros(len(self.elements), dtype=bool)
+
+        for idx, key in enumerate(amap.Kkeys):
+            if key is None:
+                continue
+
+            element = self.elements[idx]
+            if element.hasConstantStiffness() and key == element.getStiffnessKey():
+                cached[idx] = True
+            else:
+                amap.Kkeys[idx] = None
+
+        return cached
+
+    def updateStiffnessCache(self, Kdata, cached):
+        r"""
+        Store the stiffness data of all elements with constant stiffness not cached yet.  (internal use only)
+
+        :param Kdata: flat stiffness data of the current assembly
+        :param cached: boolean array returned by :py:meth:`checkStiffnessCache`
+        """
+        amap = self.getAssemblyMap()
+
+        for idx in np.flatnonzero(~cached):
+            element = self.elements[idx]
+            if element.hasConstantStiffness():
+                start, stop = amap.mat_ptr[idx], amap.mat_ptr[idx + 1]
+                amap.Kcache[start:stop] = Kdata[start:stop]
+                amap.Kkeys[idx] = element.getStiffnessKey()
+
+    def collectElementContributions(self, force_only=False):
+        r"""
+        Run the element loop and scatter element loads and internal forces into system vectors.
+
+        Element groups (see :py:class:`ElementGroup`) are evaluated in batches; all other elements
+        are evaluated one by one.  The element stiffness is returned as a flat data array matching the
+        :code:`rows` and :code:`cols` arrays of the :py:class:`AssemblyMap`.
+        Constant element stiffness is taken from the cache (see :py:meth:`checkStiffnessCache`).
+
+        :param force_only: set to **True** if only the internal force needs to be collected
+        :returns: tuple (reference element load vector, internal force vector, stiffness data)
+        """
+        amap = self.getAssemblyMap()
+
+        if amap.groups is None:
+            if self.batching:
+                from ..elements.ElementGroup import ElementGroup     # deferred: elements import the domain
+                amap.setElementGroups(*ElementGroup.buildGroups(self.elements))
+            else:
+                amap.setElementGroups([], range(len(self.elements)))
+
+        if amap.stores is None or not all( store.isValid() for store in amap.stores ):
+            amap.stores = MaterialStore.bindMaterials([ material for element in self.elements
+                                                        for material in element.getMaterials() ])
+
+        force_data = np.empty(amap.vec_ptr[-1])
+
+        if force_only:
+            cached = np.zeros(len(self.elements), dtype=bool)
+            Kdata  = None
+        else:
+            cached = self.checkStiffnessCache()
+            Kdata  = amap.Kcache.copy() if cached.any() else np.empty(amap.mat_ptr[-1])
+
+        def evaluate(task):
+            groups, singles = task
+
+            # batched element groups
+            for group in groups:
+                if force_only or cached[group.index].all():
+                    Fe, _ = group.evaluate(self.state.U, force_only=True)   # Element State Update occurs here
+                else:
+                    Fe, Ke = group.evaluate(self.state.U, force_only=False)
+                    Kdata[group.mat_pos] = Ke.ravel()
+
+                force_data[group.vec_pos] = Fe.ravel()
+
+            # element by element
+            results = []
+            for idx in singles:
+                element = self.elements[idx]
+
+                if force_only or cached[idx]:
+                    results.append((idx, element.getForce(), None))     # Element State Update occurs here
+                else:
+                    results.append((idx, *element.getForceAndStiffness()))  # a single Element State Update occurs here
+
+            return results
+
+        if amap.tasks is None:
+            amap.tasks = self.partitionElements()
+
+        if self.executor is None or len(amap.tasks) < 2:
+            results = [ evaluate(task) for task in amap.tasks ]
+        else:
+            results = list(self.executor.map(evaluate, amap.tasks))
+
+        evaluated = { idx: (Fe, Ke) for result in results for idx, Fe, Ke in result }
+
+        # gather in the order of the assembly map
+        forces = []
+        blocks = []
+        update = []     # elements contributing new stiffness blocks
+
+        for idx in amap.singles:
+            Fe, Ke = evaluated[idx]
+
+            if Ke is not None:
+                for KeI in Ke:
+                    blocks.extend(KeI)
+                update.append(idx)
+
+            forces.extend(Fe)
+
+        if forces:
+            force_data[amap.single_vec] = np.concatenate([ np.ravel(F) for F in forces ], dtype=np.float64)
+
+        if blocks:
+            data = np.concatenate([ np.ravel(block) for block in blocks ], dtype=np.float64)
+
+            if len(update) == len(amap.singles):
+                positions = amap.single_mat
+            else:
+                update = np.array(update, dtype=int)
+                positions = amap._ranges(amap.mat_ptr[update], amap.mat_ptr[update + 1])
+
+            if data.shape[0] != positions.shape[0]:
+                msg = "element stiffness blocks do not match the assembly map: the model topology has changed"
+                raise TypeError(msg)
+
+            Kdata[positions] = data
 
-        # apply boundary conditions
         if not force_only:
-            for node in self.nodes:
-                for dof in node.dofs:
-                    if node.isFixed(dof):
-                        #idx = node.lead.start + node.dofs[dof]
-                        idx = node.getIdx4DOFs(dofs=[dof])[0]
+            self.updateStiffnessCache(Kdata, cached)
 
-                        ubar  = node.getFixedDisp(dof, local=True)
+        Psys = self.collectElementLoads()
+        Fsys = amap.assembleForces(force_data)
 
-                        self.R -= Ksys[:, idx] * ubar
-                        self.R[idx]    = ubar * 1.0e3
+        return (Psys, Fsys, Kdata)
 
-                        Ksys[:, idx]   = np.zeros(ndof)   # the range might need adjustment for constraints
-                        Ksys[idx, :]   = np.zeros(ndof)   # the range might need adjustment for constraints
-                        Ksys[idx, idx] = 1.0e3
+    def collectElementLoads(self):
+        r"""
+        Scatter all element loads, e.g., distributed loads on frames or surface loads, into a system vector.
 
-            self.Kt = Ksys
+        :returns: reference element load vector (without load factor)
+        """
+        loads = []
+        for element in self.elements:
+            Pe = element.getLoad()
+            loads.extend([ P if isinstance(P, np.ndarray) else None for P in Pe ])
+
+        return self.getAssemblyMap().assembleVector(loads)
 
     def solve(self, **kwargs):
         """
@@ -293,6 +941,8 @@ class Solver():
 
         It tells all components to update its state to "converged"
         """
+        self.getDisplacementState().commit()
+
         for node in self.nodes:
             node.setLoadFactor(self.loadfactor)
             node.on_converged()
@@ -305,6 +955,9 @@ class Solver():
             const.setLoadFactor(self.loadfactor)
             const.on_converged()
 
+        for store in self.getMaterialStores():
+            store.converged()
+
         self.loadfactor_nn = self.loadfactor_n
         self.loadfactor_n  = self.loadfactor
 
@@ -314,6 +967,8 @@ class Solver():
 
         It will revert the entire system to the last converged state.
         """
+        self.getDisplacementState().revert()
+
         for node in self.nodes:
             node.revert()
 
@@ -323,12 +978,17 @@ class Solver():
         for const in self.constraints:
             const.revert()
 
+        for store in self.getMaterialStores():
+            store.revert()
+
     def checkStability(self, verbose=True, **kwargs):
         r"""
         Computes the stability index as
 
-        * :math:`\mathop{det}([{\bf K}_t])` for systems with less than 25 d.o.f.s
-        * :math:`\min\lambda_i` where :math:`\lambda_i` are the eigenvalues of :math:`{\bf K}_t`
+        * :math:`\mathop{det}([{\bf K}_{ff}])` for systems with less than 25 d.o.f.s
+        * :math:`\min\lambda_i` where :math:`\lambda_i` are the eigenvalues of :math:`{\bf K}_{ff}`
+
+        where :math:`{\bf K}_{ff}` is the tangent stiffness of all free (not prescribed) d.o.f.s.
 
         :param verbose: set to **True** for log info
         :param num_eigen: if set to a value greater than 0, show the **num_eigen** eigenvalues
@@ -341,24 +1001,20 @@ class Solver():
             num_eigen = 0
 
         if self.sdof < 10 and not num_eigen:
-            detKt = np.linalg.det(self.Kt)
+            Kff = self.getReducedStiffness()
+            if issparse(Kff):
+                Kff = Kff.toarray()
+            detKt = np.linalg.det(Kff)
             msg = f"\n ** Stability check: det(Kt) = {detKt}\n"
         else:
-            evals = sc.linalg.eigvalsh(self.Kt)
-            abs_evals = np.abs(evals)
-            idx = np.argmin(abs_evals)
-            detKt = evals[idx]  # we need to get the sign back
+            evals = self.computeEigenModes(num_modes=max(num_eigen, 1))
             if num_eigen > 0:
-                detKt = []
-                for cnt in range(num_eigen):
-                    detKt.append(evals[idx])      # we need to get the sign back
-                    abs_evals[idx] = 1.0e20
-                    idx = np.argmin(abs_evals)
-                detKt.sort()
+                detKt = list(evals)
                 msg = f"\n ** Stability check: (smallest {num_eigen} eigenvalues of Kt)\n"
                 for k, val in enumerate(detKt):
                     msg += f"\t\t\tmode {k}:{val:12.2f}\n"
             else:
+                detKt = evals[0]
                 msg = f"\n ** Stability check: (smallest eigenvalue of Kt) = {detKt}\n"
 
         if verbose:
@@ -366,10 +1022,63 @@ class Solver():
 
         return detKt
 
+    def computeEigenModes(self, num_modes=1, vectors=False):
+        r"""
+        Compute the **num_modes** eigenvalues of :math:`{\bf K}_{ff}` closest to zero.
+
+        Small systems use a dense eigen-decomposition.  Larger systems use sparse shift-invert
+        Lanczos iterations (:code:`scipy.sparse.linalg.eigsh` with :math:`\sigma=0`), which only need a
+        sparse factorization of :math:`{\bf K}_{ff}`.  Both dense and sparse tangent stiffness matrices are accepted.
+
+        :param num_modes: number of requested eigenvalues
+        :param vectors: set to **True** to also compute the matching eigenvectors
+        :returns: eigenvalues in ascending order, and, if requested, the eigenvectors as columns
+                  of a system-size array (zero at prescribed d.o.f.s)
+        """
+        free = self.getFreeDOFs()
+        ndof = len(free)
+        num_modes = min(num_modes, ndof)
+
+        Kff = self.getReducedStiffness()
+
+        if ndof <= 100 or num_modes >= ndof - 1:
+            if issparse(Kff):
+                Kff = Kff.toarray()
+            if vectors:
+                w, v = sc.linalg.eigh(Kff)
+            else:
+                w, v = sc.linalg.eigvalsh(Kff), None
+
+            # eigenvalues closest to zero, in ascending order
+            idx = np.sort(np.argsort(np.abs(w))[:num_modes])
+
+        else:
+            Kff = csc_array(Kff)
+            try:
+                w, v = eigsh(Kff, k=num_modes, sigma=0.0, which='LM', return_eigenvectors=True)
+            except RuntimeError:
+                # Kff is exactly singular: shift away from zero
+                shift = 1.0e-8 * np.abs(Kff.diagonal()).max()
+                w, v = eigsh(Kff, k=num_modes, sigma=-shift, which='LM', return_eigenvectors=True)
+
+            idx = np.argsort(w)
+
+        w = w[idx]
+
+        if not vectors:
+            return w
+
+        V = np.zeros((self.sdof, len(idx)))
+        V[free, :] = v[:, idx]
+
+        return (w, V)
+
     def getBucklingMode(self, mode=0, **kwargs):
         r"""
         Perform an eigen-analysis on :math:`{\bf K}_t` for the requested **mode**.
-        Default is the mode with the smallest absolute eigenvalue (:math:`\min\{\lambda_i\}`)
+        Default is the mode with the smallest absolute eigenvalue (:math:`\min\{\lambda_i\}`).
+        Higher modes are counted in ascending order among the **mode+1** eigenvalues closest to zero
+        (see :py:meth:`computeEigenModes`).
 
         The mode shape will be pushed to the nodes.
 
@@ -380,12 +1089,12 @@ class Solver():
 
         :return: the eigenvalue, :math:`\lambda_{\mathtt{mode}}`
         """
-        if not isinstance(mode,int) or mode < 0 or mode >= self.Kt.shape[0]:
+        if not isinstance(mode,int) or mode < 0 or mode >= len(self.getFreeDOFs()):
             raise TypeError(f"mode out of range: must be an int between 0 and the number of d.o.f.s")
 
-        w, v = sc.linalg.eigh(self.Kt, subset_by_index=[mode, mode])
-        lam = w[0]
-        U = v[:,0]
+        w, v = self.computeEigenModes(num_modes=mode+1, vectors=True)
+        lam = w[mode]
+        U = v[:,mode]
 
         # update nodal displacements
         for node in self.nodes:
@@ -394,32 +1103,161 @@ class Solver():
 
         return lam
 
+    def solveBuckling(self, num_modes=1, verbose=False):
+        r"""
+        Linearized buckling analysis for the reference load, :math:`{\bf P}`.
+
+        #. The material stiffness, :math:`{\bf K}_0`, is assembled on the undeformed configuration.
+        #. The reference stress state follows from the linear solution :math:`{\bf K}_0\:{\bf U}_0 = {\bf P}`.
+        #. The geometric stiffness, :math:`{\bf K}_g`, is assembled for that stress state
+           (see :py:meth:`Element.getGeometricStiffness`).
+        #. The critical load factors are the lowest positive eigenvalues of
+
+           .. math::
+
+              \left( {\bf K}_0 + \lambda\: {\bf K}_g \right) \: {\bf \phi} = {\bf 0}
+
+        Larger systems solve that generalized eigenvalue problem as
+        :math:`-{\bf K}_g {\bf \phi} = \frac{1}{\lambda} {\bf K}_0 {\bf \phi}` using sparse Lanczos iterations
+        (:code:`scipy.sparse.linalg.eigsh`), reusing the factorization of :math:`{\bf K}_0` from step 2.
+
+        The current state of the model is not changed.  The first mode shape is pushed to the nodes.
+        Use :py:meth:`pushBucklingMode` to select a different mode, e.g., for :code:`System.plot(modeshape=True)`.
+
+        .. note::
+
+            Prescribed displacements are not part of the reference load.
+            Modes without a positive critical load factor are reported as :math:`\lambda=\infty`.
+
+        :param num_modes: number of requested buckling modes
+        :param verbose: set to **True** for log info
+        :returns: critical load factors in ascending order
+        """
+        state = (self.Kt.copy() if self.Kt is not None else None, self.inertia)
+
+        leads = [ node for node in self.nodes if node.isLead() ]
+        disps = [ node.getDisp().copy() for node in leads ]
+
+        for node in leads:
+            node.setDisp(np.zeros_like(node.getDisp()))
+
+        # material stiffness and linear reference solution
+        self.assemble()
+        K0 = self.Kt.copy()
+        solve = Solver.factorize(self)
+        U0 = solve(self.P)
+
+        self.updateDisplacements(U0)
+
+        # geometric stiffness of the reference stress state
+        amap = self.getAssemblyMap()
+        blocks = []
+        for element in self.elements:
+            for KgI in element.getGeometricStiffness():
+                blocks.extend(KgI)
+        data = amap.stiffnessData(blocks)
+
+        free = np.zeros(amap.ndof)
+        free[self.getFreeDOFs()] = 1.0
+
+        if issparse(K0):
+            mask = sc.sparse.diags(free)
+            Kg = csc_array(mask @ amap.assembleSparse(data) @ mask)
+        else:
+            Kg = amap.assembleDense(data) * np.outer(free, free)
+
+        # restore the current state
+        for node, U in zip(leads, disps):
+            node.setDisp(U)
+        self.assemble(force_only=True)
+        self.Kt, self.inertia = state
+
+        ndof = int(free.sum())
+        num_modes = min(num_modes, ndof)
+
+        if ndof <= 100 or num_modes >= ndof - 1:
+            if issparse(K0):
+                K0 = K0.toarray()
+                Kg = Kg.toarray()
+            mu, v = sc.linalg.eigh(-Kg, K0)
+            idx = np.argsort(mu)[::-1][:num_modes]
+            mu, v = mu[idx], v[:,idx]
+        else:
+            Minv = sc.sparse.linalg.LinearOperator(K0.shape, matvec=solve)
+            mu, v = eigsh(-Kg, k=num_modes, M=K0, Minv=Minv, which='LA')
+            idx = np.argsort(mu)[::-1]
+            mu, v = mu[idx], v[:,idx]
+
+        # critical load factors
+        lam = np.full(num_modes, np.inf)
+        positive = mu > 0.0
+        lam[positive] = 1. / mu[positive]
+
+        # scale modes to a largest component of 1
+        v /= np.max(np.abs(v), axis=0)
+
+        self.buckling_modes = (lam, v)
+        self.pushBucklingMode(0)
+
+        if verbose:
+            msg = f"\n ** Linearized buckling analysis: (lowest {num_modes} critical load factors)\n"
+            for k, val in enumerate(lam):
+                msg += f"\t\t\tmode {k}:{val:12.4g}\n"
+            print(msg)
+
+        return lam
+
+    def pushBucklingMode(self, mode=0):
+        r"""
+        Push a mode shape from the last linearized buckling analysis (see :py:meth:`solveBuckling`) to the nodes.
+
+        :param mode: mode number, :code:`0` being the mode with the lowest critical load factor
+        :returns: the critical load factor of that mode
+        """
+        if self.buckling_modes is None:
+            msg = "no buckling modes available: run solveBuckling() first"
+            raise TypeError(msg)
+
+        lam, v = self.buckling_modes
+
+        if not isinstance(mode, int) or mode < 0 or mode >= len(lam):
+            raise TypeError(f"mode out of range: must be an int between 0 and {len(lam) - 1}")
+
+        for node in self.nodes:
+            idxK = node.getIdx4DOFs()
+            node.setDisp(v[idxK, mode], modeshape=True)
+
+        return lam[mode]
+
     def checkResiduum(self, verbose=False, force_only=True):
+        r"""
+        Assemble the residual force and compute its norm, including the constraint violation
+        for displacement or arc-length control.
+
+        With :code:`force_only=True`, only internal forces are evaluated and the previous tangent
+        stiffness is kept.  Entries for fixed d.o.f.s then hold the outstanding prescribed displacement
+        instead of the support reactions, so that the residuum can be used with a previous factorization.
+
+        :param verbose: set to **True** for log info
+        :param force_only: set to **False** to also assemble the tangent stiffness
+        :returns: norm of the residuum
+        """
 
         # compute residual force and tangent stiffness
         self.assemble(force_only=force_only)
 
+        if force_only:
+            # fixed d.o.f.s carry reactions: replace them by the outstanding prescribed displacement
+            idx, du = self.getFixedDOFs()
+            self.R[idx] = du
+
         normR = np.dot(self.R, self.R)
 
         # Add constraint violation in case we are using displacement control
+        # (the constraint was evaluated during assembly)
         if self.hasConstraint:
-
-            if self.useArcLength:
-                # arc-length control
-                dload = self.loadfactor - self.loadfactor_n
-                self.g = self.arclength2 - self.alpha * dload*dload * self.P@self.P
-                for node in self.nodes:
-                    self.g -= node.getNormDeltaU2()
-
-            else:
-                # displacement control
-                self.g = self.targetU - self.control_node.getDisp(self.control_dof)[0]
-
             normR += self.g*self.g
 
-        else:
-            self.g = 0.0
-
         normR = np.sqrt(normR)
 
         if verbose:
@@ -444,15 +1282,183 @@ class Solver():
         """
         self.sysU = np.zeros(self.sdof)
 
-    def showKt(self, filename="", **kwargs):
+    def showKt(self, filename="", natural=False, **kwargs):
+        r"""
+        Plot the sparsity pattern of the current tangent stiffness matrix.
+
+        :param filename: save the plot to that file instead of showing it
+        :param natural: set to **True** to show :code:`Kt` in the order nodes were added to the model
+                        instead of the solver's d.o.f. numbering (see :py:meth:`setDOFOrdering`)
+        """
+        Kt = self.Kt
+        if issparse(Kt) and Kt.format == 'dia':
+            Kt = csc_array(Kt)    # band storage does not support indexing
+        if natural:
+            idx = self.getAssemblyMap().natural
+            Kt  = Kt[idx, :][:, idx]
 
         plt.figure()
-        plt.spy(self.Kt, marker='.',mec='b',mfc='b', **kwargs)
+        plt.spy(Kt, marker='.',mec='b',mfc='b', **kwargs)
         if filename:
             plt.savefig(filename)
         else:
             plt.show()
 
+    def addLoadCase(self, name):
+        r"""
+        Store all loads currently applied to the model, i.e., nodal loads and element loads
+        (see :code:`setDistLoad` and :code:`setSurfaceLoad`), as load case **name**.
+
+        Load cases are defined one by one and solved together by :py:meth:`solveLoadCases`:
+
+        .. code::
+
+            model.resetLoad()
+            node.addLoad([-10.], ['uy'])
+            model.addLoadCase('dead')
+
+            model.resetLoad()
+            element.setDistLoad(-2.0)
+            model.addLoadCase('live')
+
+            model.solveLoadCases()
+            U, R = model.combineLoadCases({'dead': 1.2, 'live': 1.6})
+
+        Loads acting on prescribed d.o.f.s are carried by the supports.
+        Prescribed displacements are not part of a load case, i.e., all supports are held at zero displacement.
+
+        :param name: name of the load case.  An existing load case of the same name is replaced.
+        """
+        amap = self.getAssemblyMap()
+
+        if self.load_case_map is not amap:
+            if self.load_cases:
+                msg = "model topology changed after load cases were defined: call resetLoadCases() first"
+                raise TypeError(msg)
+            self.load_case_map = amap
+
+        P = np.zeros(amap.ndof)
+
+        for node in self.nodes:
+            if node.isLead() and node.hasLoad():
+                P[node.getIdx4DOFs()] += node.getLoad()
+
+        P += self.collectElementLoads()
+
+        self.load_cases[name] = P
+        self.load_case_results.pop(name, None)
+
+    def resetLoadCases(self):
+        r"""
+        Remove all load cases and their results.
+        """
+        self.load_cases = {}
+        self.load_case_map = None
+        self.load_case_results = {}
+
+    def solveLoadCases(self, verbose=False):
+        r"""
+        Linear analysis of all load cases defined by :py:meth:`addLoadCase`.
+
+        The stiffness of the undeformed system is assembled and factorized once.  All load cases are solved
+        by a single back-substitution for a right-hand side matrix with one column per load case.
+        Support reactions follow from one product of the unconstrained stiffness with all displacement vectors.
+
+        The current state of the model is not changed.
+        Use :py:meth:`getLoadCase` and :py:meth:`combineLoadCases` to access the results.
+
+        :param verbose: set to **True** for log info
+        :returns: list of the names of all solved load cases
+        """
+        names = list(self.load_cases)
+        if not names:
+            return names
+
+        amap = self.getAssemblyMap()
+        if self.load_case_map is not amap:
+            msg = "model topology changed after load cases were defined: call resetLoadCases() and define them again"
+            raise TypeError(msg)
+
+        leads = [ node for node in self.nodes if node.isLead() ]
+        disps = [ node.getDisp().copy() for node in leads ]
+
+        for node in leads:
+            node.setDisp(np.zeros_like(node.getDisp()))
+
+        # stiffness of the undeformed system, with and without supports
+        self.assemble()
+        solve = self.factorize()
+
+        _, _, Kdata = self.collectElementContributions()
+        K0 = amap.assembleSparse(Kdata)
+
+        fixed = amap.fixed
+        P = np.column_stack([ self.load_cases[name] for name in names ])
+        B = P.copy()
+        B[fixed, :] = 0.0
+
+        U = np.asarray(solve(B)).reshape(B.shape)
+
+        # support reactions, stored like the residuum of a solver (see applyBoundaryConditions)
+        R = np.zeros_like(U)
+        R[fixed, :] = (P - K0 @ U)[fixed, :]
+
+        for k, name in enumerate(names):
+            self.load_case_results[name] = (U[:, k], R[:, k])
+
+        # restore the current state
+        for node, Ui in zip(leads, disps):
+            node.setDisp(Ui)
+        self.assemble(force_only=True)
+
+        if verbose:
+            print(f"\n ** Linear analysis of {len(names)} load cases ({amap.ndof} d.o.f.s)\n")
+
+        return names
+
+    def getLoadCase(self, name):
+        r"""
+        Results of load case **name** from the last :py:meth:`solveLoadCases`.
+
+        Nodal values are extracted using the node's system indices, e.g., :code:`U[node.getIdx4DOFs()]`.
+
+        :param name: name of the load case
+        :returns: tuple (system displacement vector, system vector of support reactions)
+        """
+        if name not in self.load_case_results:
+            msg = f"no results for load case '{name}': run solveLoadCases() first"
+            raise TypeError(msg)
+
+        U, R = self.load_case_results[name]
+
+        return (U.copy(), R.copy())
+
+    def combineLoadCases(self, factors):
+        r"""
+        Linear combination of solved load cases (see :py:meth:`solveLoadCases`).
+
+        The combined displacements are pushed to the nodes and the state of all elements is updated,
+        e.g., for :code:`System.plot()` or :code:`System.valuePlot()`.  The loads applied to the model are not changed.
+
+        :param factors: dict :code:`{ name: factor }` of load case names and their factors
+        :returns: tuple (system displacement vector, system vector of support reactions)
+        """
+        U = np.zeros(self.getAssemblyMap().ndof)
+        R = np.zeros_like(U)
+
+        for name, factor in factors.items():
+            Ui, Ri = self.getLoadCase(name)
+            U += factor * Ui
+            R += factor * Ri
+
+        for node in self.nodes:
+            if node.isLead():
+                node.setDisp(np.zeros_like(node.getDisp()))
+        self.updateDisplacements(U)
+        self.assemble(force_only=True)
+
+        return (U, R)
+
     def getNodalReactions(self, dofs=None, cut_off=1.0e-6):
 
         self.assemble(force_only=True)
@@ -518,7 +1524,7 @@ class Solver():
         return R
 
 
-    def initArcLength(self, load_increment=1., alpha=0.0, tolerance=1.0e-12):
+    def initArcLength(self, load_increment=1., alpha=0.0, tolerance=1.0e-12, max_steps=10):
         r"""
         This method may be implemented by a nonlinear solver
         """
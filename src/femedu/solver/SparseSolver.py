@@ -1,5 +1,4 @@
 import numpy as np
-import scipy.sparse as scs
 import scipy.sparse.linalg as spla
 
 from ..solver.NewtonRaphsonSolver import NewtonRaphsonSolver
@@ -24,16 +23,16 @@ class SparseSolver(NewtonRaphsonSolver):
         if 'tolerance' in kwargs:
             TOL = kwargs['tolerance']
 
-        for k in range(max_steps):
+        self.num_iterations = max_steps
 
-        # compute force vector and tangent stiffness
-            self.assemble()
+        for k in range(max_steps):
 
-            # we are using , force_only=False and simply reuse self.Kt from that run (!)
+            # compute residual force, tangent stiffness, and constraint in a single assembly
             normR = self.checkResiduum(verbose, force_only=False)
 
             if normR < TOL:
                 # we achieved convergence
+                self.num_iterations = k
                 #
                 # now broadcast that we can switch to this converged state
                 self.on_converged()
@@ -99,9 +98,7 @@ class SparseSolver(NewtonRaphsonSolver):
             dU = spla.spsolve(self.Kt, self.R)
 
         # update nodal displacements
-        for node in self.nodes:
-            idxK = node.start + np.arange(node.ndofs)
-            node._updateDisp(dU[idxK])
+        self.updateDisplacements(dU)
 
     def assemble(self, force_only=False):
         """
@@ -122,63 +119,34 @@ class SparseSolver(NewtonRaphsonSolver):
         :param force_only: set to **True** if only the residual force needs to be assembled
         """
 
-        # compute size parameters
-        ndof = 0
-        for node in self.nodes:
-            node.setStart(ndof)
-            ndof += node.ndofs
-
-        for constraint in self.constraints:
-            constraint.setStart(ndof)
-            ndof += constraint.countConditions()
+        # fetch the scatter map (computes size parameters and dof numbering)
+        amap = self.getAssemblyMap()
+        ndof = amap.ndof
 
         self.sdof = ndof  # number of system d.o.f.s
 
-        Rsys = np.zeros(ndof)
-
-        rows = []
-        cols = []
-        data = []
+        Psys = np.zeros(ndof)
 
         # assemble loads
         for node in self.nodes:
-            if node.hasLoad():
-                idx = node.start + np.arange(node.ndofs)
-                Rsys[idx] += node.getLoad() * self.loadfactor
+            if node.isLead() and node.hasLoad():
+                idx = node.getIdx4DOFs()
+                Psys[idx] += node.getLoad()
 
         # Element Loop: assemble element forces and stiffness
-        for element in self.elements:
-            Fe = element.getForce()     # Element State Update occurs here
-            Pe = element.getLoad()      # Element State Update occurs here
-            for (i,ndI) in enumerate(element.nodes):
-                idxK = ndI.start + np.arange(ndI.ndofs)
-                if isinstance(Pe[i], np.ndarray):
-                    Rsys[idxK] -= Fe[i] - self.loadfactor * Pe[i]
-                else:
-                    Rsys[idxK] -= Fe[i]
-                if not force_only:
-                    for (j,ndJ) in enumerate(element.nodes):
-                        idxM = ndJ.start + np.arange(ndJ.ndofs)
-                        KIJ = element.Kt[i][j]
-                        II,JJ = KIJ.shape
-                        for p in range(II):
-                            for q in range(JJ):
-                                rows.append(idxK[p])
-                                cols.append(idxM[q])
-                                data.append(KIJ[p][q])
-
-        # apply boundary conditions
-        if not force_only:
-            for node in self.nodes:
-                for dof in node.dofs:
-                    if node.isFixed(dof):
-                        idx = node.start + node.dofs[dof]
-                        Rsys[idx]      = 0.0
-                        rows.append(idx)
-                        cols.append(idx)
-                        data.append(1.0e30)
-
-        self.R  = Rsys
-
-        KtS = scs.coo_array((data, (rows, cols)), shape=(self.sdof,self.sdof))
-        self.Kt = scs.csc_array(KtS)
+        Pe, Fsys, data = self.collectElementContributions(force_only=force_only)
+
+        Psys += Pe
+
+        self.P = Psys
+        self.R = self.loadfactor * Psys - Fsys
+
+        # apply boundary conditions (eliminated within the fixed CSC pattern)
+        if force_only:
+            self.applyBoundaryConditions()
+        else:
+            self.Kt = self.applyBoundaryConditions(amap.assembleCSC(data))
+            self.inertia = None
+
+        # displacement control or arc-length control
+        self.evaluateConstraint()
@@ -2,12 +2,18 @@ __all__ = (
     'Solver',
     'LinearSolver',
     'NewtonRaphsonSolver',
+    'ModifiedNewtonSolver',
+    'QuasiNewtonSolver',
     'NewtonRaphsonSparse',
     'SparseSolver',
+    'KrylovSolver',
 )
 
 from .Solver import *
 from .LinearSolver import *
 from .NewtonRaphsonSolver import *
+from .ModifiedNewtonSolver import *
+from .QuasiNewtonSolver import *
 from .NewtonRaphsonSparse import *
 from .SparseSolver import *
+from .KrylovSolver import *